@@ -1,17 +1,33 @@
-from flask import Flask, jsonify, send_from_directory
+from flask import Blueprint, Flask, Response, jsonify, request, send_from_directory
 from flask_cors import CORS
 from pathlib import Path
 import sqlite3
+import json
+import logging
+import queue
 import requests
+import threading
+import time
 from datetime import datetime, timedelta
+import itertools
 import os
+import sys
+
+import numpy as np
+
+# `python backend/app.py` only puts backend/ on sys.path; the shared helpers import as backend.*
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from backend.utils.registry import get_active_run_id, run_exists, set_active_run
+from backend.utils.versions import latest_version, versions_since
+
+logger = logging.getLogger(__name__)
 
 # Get absolute paths
 BASE_DIR = Path(__file__).resolve().parent.parent
 FRONTEND_DIR = BASE_DIR / "frontend"
 
-app = Flask(__name__, static_folder=str(FRONTEND_DIR), static_url_path='')
-CORS(app)  # Enable CORS for frontend requests
+# All routes live on this blueprint; create_app() builds apps around it
+api = Blueprint('api', __name__)
 
 # Database path
 DB_PATH = Path(__file__).resolve().parent / "data" / "climate.db"
@@ -21,28 +37,76 @@ NEWS_API_KEY = os.environ.get('NEWS_API_KEY', '7f876b4083d6424a8a229aa66e0d78d4'
 NEWS_API_URL = 'https://newsapi.org/v2/everything'
 NEWS_QUERY = 'climate change OR global warming OR sea level rise OR carbon emissions OR renewable energy'
 
-@app.route('/')
+# ---------------- Per-worker state ---------------- #
+# SQLite connections and pooled HTTP sessions must not cross a fork, so both
+# are keyed by pid (and the connection by thread and path) and rebuilt lazily
+# in each worker; init_worker() resets them eagerly after a fork.
+_local = threading.local()
+_http = {'pid': None, 'session': None}
+
+def _read_connection():
+    """This thread's long-lived read connection to DB_PATH"""
+    key = (os.getpid(), DB_PATH)
+    if getattr(_local, 'key', None) != key:
+        _local.conn = sqlite3.connect(DB_PATH)
+        _local.key = key
+    return _local.conn
+
+def _read_cursor():
+    """Cursor with named columns on this thread's read connection"""
+    cursor = _read_connection().cursor()
+    cursor.row_factory = sqlite3.Row
+    return cursor
+
+def _http_session():
+    """This process's pooled HTTP session for outbound API calls"""
+    if _http['pid'] != os.getpid():
+        _http['session'] = requests.Session()
+        _http['pid'] = os.getpid()
+    return _http['session']
+
+# ---------------- Precomputed responses ---------------- #
+# Series payloads rendered once before forking and shared copy-on-write by
+# every worker. They are tagged with the dataset_versions head and dropped
+# as soon as any writer logs a newer version.
+PRECOMPUTED_PATHS = [
+    '/api/temperature',
+    '/api/sea-level',
+    '/api/climate-features',
+    '/api/temperature-predictions',
+    '/api/sea-level-predictions',
+    '/api/explain',
+]
+_precomputed = {'db_path': None, 'version': None, 'responses': {}}
+
+@api.route('/')
 def index():
     """Serve the main index page"""
     return send_from_directory(str(FRONTEND_DIR), 'index.html')
 
-@app.route('/frontend/<path:path>')
+@api.route('/frontend/<path:path>')
 def serve_frontend(path):
     """Serve frontend static files"""
     return send_from_directory(str(FRONTEND_DIR), path)
 
-@app.route('/assets/<path:path>')
+@api.route('/assets/<path:path>')
 def serve_assets(path):
     """Serve assets (CSS, JS, images)"""
     return send_from_directory(str(FRONTEND_DIR / 'assets'), path)
 
-@app.route('/api/temperature')
+def _conditional_json(data):
+    """JSON response with a content ETag; answers 304 when the client's If-None-Match still matches"""
+    response = jsonify(data)
+    response.add_etag()
+    # Clients may keep the body but must revalidate before reusing it
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+@api.route('/api/temperature')
 def get_temperature():
     """Get historical temperature data"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _read_cursor()
         
         cursor.execute("SELECT year, observed_c, anthropogenic_c FROM temperature ORDER BY year")
         rows = cursor.fetchall()
@@ -53,18 +117,15 @@ def get_temperature():
             'anthropogenic_c': [row['anthropogenic_c'] for row in rows]
         }
         
-        conn.close()
-        return jsonify(data)
+        return _conditional_json(data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/sea-level')
+@api.route('/api/sea-level')
 def get_sea_level():
     """Get historical sea level data"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _read_cursor()
         
         cursor.execute("SELECT year, gmsl FROM sea_level ORDER BY year")
         rows = cursor.fetchall()
@@ -74,54 +135,352 @@ def get_sea_level():
             'gmsl': [row['gmsl'] for row in rows]
         }
         
-        conn.close()
-        return jsonify(data)
+        return _conditional_json(data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/temperature-predictions')
-def get_temperature_predictions():
-    """Get temperature predictions up to 2050"""
+@api.route('/api/climate-features')
+def get_climate_features():
+    """Get the per-year joined temperature, CO2 and sea level table built at ingest"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = _read_cursor()
         
-        cursor.execute("SELECT year, prediction FROM future_predictions ORDER BY year")
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='climate_features'")
+        if cursor.fetchone() is None:
+            return jsonify({'error': 'climate_features has not been built; run create_db.py'}), 404
+        
+        cursor.execute("SELECT * FROM climate_features ORDER BY year")
         rows = cursor.fetchall()
+        columns = [description[0] for description in cursor.description]
         
-        data = {
-            'years': [row['year'] for row in rows],
-            'predictions': [row['prediction'] for row in rows]
-        }
+        data = {'years': [row['year'] for row in rows]}
+        for column in columns[1:]:
+            data[column] = [row[column] for row in rows]
         
-        conn.close()
-        return jsonify(data)
+        return _conditional_json(data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/sea-level-predictions')
+def _prediction_payload(series, legacy_table):
+    """Predictions for ?run=<id>, else the active run, else the legacy latest-run table."""
+    cursor = _read_cursor()
+    run_id = request.args.get('run') or get_active_run_id(cursor.connection)
+    if run_id:
+        try:
+            cursor.execute(
+                "SELECT year, prediction FROM run_predictions WHERE run_id = ? AND series = ? ORDER BY year",
+                (run_id, series)
+            )
+            rows = cursor.fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+        if not rows:
+            return jsonify({'error': f'No {series} predictions for run {run_id}'}), 404
+    else:
+        cursor.execute(f"SELECT year, prediction FROM {legacy_table} ORDER BY year")
+        rows = cursor.fetchall()
+
+    return _conditional_json({
+        'years': [row['year'] for row in rows],
+        'predictions': [row['prediction'] for row in rows],
+        'run_id': run_id
+    })
+
+@api.route('/api/temperature-predictions')
+def get_temperature_predictions():
+    """Get temperature predictions up to 2050 (active run, or ?run=<run_id>)"""
+    try:
+        return _prediction_payload('temperature', 'future_predictions')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/sea-level-predictions')
 def get_sea_level_predictions():
-    """Get sea level predictions up to 2050"""
+    """Get sea level predictions up to 2050 (active run, or ?run=<run_id>)"""
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT year, prediction FROM sea_level_predictions ORDER BY year")
+        return _prediction_payload('sea_level', 'sea_level_predictions')
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+EXPLAIN_SERIES = ('temperature', 'sea_level')
+
+@api.route('/api/explain')
+def explain_predictions():
+    """Per-year trend, CO2 and forcing contributions behind the predictions (?series=, ?run=)"""
+    try:
+        series = request.args.get('series')
+        if series is not None and series not in EXPLAIN_SERIES:
+            return jsonify({'error': f'series must be one of: {", ".join(EXPLAIN_SERIES)}'}), 400
+
+        conn = _read_connection()
+        run_id = request.args.get('run') or get_active_run_id(conn)
+        try:
+            rows = conn.execute(
+                "SELECT series, year, term, component, forecast, value FROM run_contributions "
+                "WHERE run_id = ? ORDER BY rowid",
+                (run_id,)
+            ).fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+
+        # Rows are stored term by term, so first appearance gives the display order
+        collected = {}
+        for name, year, term, component, forecast, value in rows:
+            if series is not None and name != series:
+                continue
+            entry = collected.setdefault(name, {'terms': {}, 'components': {}, 'forecast_years': set()})
+            entry['terms'].setdefault(term, {})[year] = value
+            entry['components'].setdefault(component, {})[term] = None  # Ordered set: stable float sums
+            if forecast:
+                entry['forecast_years'].add(year)
+        if not collected:
+            return jsonify({'error': f'No contributions stored for run {run_id}'}), 404
+
+        payload = {'run_id': run_id}
+        for name, entry in collected.items():
+            years = sorted({year for values in entry['terms'].values() for year in values})
+            # Terms absent in a year (the anchor offset before the forecast) contribute nothing
+            terms = {term: [values.get(year, 0.0) for year in years] for term, values in entry['terms'].items()}
+            components = {
+                component: [sum(terms[term][i] for term in members) for i in range(len(years))]
+                for component, members in entry['components'].items()
+            }
+            payload[name] = {
+                'years': years,
+                'forecast_start': min(entry['forecast_years'], default=None),
+                'terms': terms,
+                'components': components,
+                'total': [sum(values[i] for values in terms.values()) for i in range(len(years))],
+            }
+        return _conditional_json(payload)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+# ---------------- Scenario grid ---------------- #
+# Written offline by `python -m backend.model.scenarios`; each worker loads a
+# run's grid into arrays once per data version and interpolates per request.
+SCENARIO_SERIES = ('temperature', 'sea_level')
+_scenario_grid = {'entry': (None, None)}  # (key, grid), swapped as one tuple
+
+def load_scenario_grid(run_id=None):
+    """Axes and (growth, ramp, year) arrays of a run's scenario grid (active run by default), or None"""
+    conn = _read_connection()
+    cursor = conn.cursor()
+    run_id = run_id or get_active_run_id(conn)
+    key = (DB_PATH, run_id, latest_version(conn))
+    cached_key, grid = _scenario_grid['entry']
+    if cached_key == key:
+        return grid
+
+    try:
+        cursor.execute(
+            f"SELECT co2_growth_pct, forcing_ramp, year, {', '.join(SCENARIO_SERIES)} FROM scenario_grid "
+            "WHERE run_id = ? ORDER BY co2_growth_pct, forcing_ramp, year",
+            (run_id,)
+        )
         rows = cursor.fetchall()
-        
-        data = {
-            'years': [row['year'] for row in rows],
-            'predictions': [row['prediction'] for row in rows]
+    except sqlite3.OperationalError:
+        rows = []
+
+    grid = None
+    if rows:
+        values = np.array(rows, dtype=float)  # NULL -> NaN
+        axes = [np.unique(values[:, i]) for i in range(3)]
+        shape = tuple(len(axis) for axis in axes)
+        grid = {
+            'run_id': run_id,
+            'axes': axes[:2],
+            'years': axes[2].astype(int).tolist(),
+            'series': {
+                name: values[:, 3 + i].reshape(shape)
+                for i, name in enumerate(SCENARIO_SERIES)
+                if not np.isnan(values[:, 3 + i]).all()
+            },
         }
-        
-        conn.close()
-        return jsonify(data)
+    _scenario_grid['entry'] = (key, grid)
+    return grid
+
+def _interpolate(axes, values, point):
+    """Multilinear interpolation of values[i, j, ..., :] at point, one coordinate per leading axis"""
+    corners = []
+    for axis, x in zip(axes, point):
+        if len(axis) == 1:
+            corners.append(((0, 1.0),))
+            continue
+        i = min(max(int(np.searchsorted(axis, x, side='right')) - 1, 0), len(axis) - 2)
+        t = (x - axis[i]) / (axis[i + 1] - axis[i])
+        corners.append(((i, 1.0 - t), (i + 1, t)))
+
+    result = 0.0
+    for corner in itertools.product(*corners):
+        weight = 1.0
+        for _, w in corner:
+            weight *= w
+        if weight:
+            result = result + weight * values[tuple(i for i, _ in corner)]
+    return result
+
+@api.route('/api/scenario')
+def get_scenario():
+    """Forecasts for ?co2_growth=<%/yr>&forcing_ramp=<forcing added by 2050>, interpolated from the grid"""
+    try:
+        grid = load_scenario_grid(request.args.get('run'))
+        if grid is None:
+            return jsonify({'error': 'No scenario grid for this run (python -m backend.model.scenarios)'}), 404
+
+        point = []
+        for param, axis in zip(('co2_growth', 'forcing_ramp'), grid['axes']):
+            value = request.args.get(param, type=float)
+            if value is None or not axis[0] <= value <= axis[-1]:
+                return jsonify({'error': f'{param} must be a number from {axis[0]:g} to {axis[-1]:g}'}), 400
+            point.append(value)
+
+        payload = {
+            'years': grid['years'],
+            'co2_growth': point[0],
+            'forcing_ramp': point[1],
+            'run_id': grid['run_id'],
+        }
+        for name, values in grid['series'].items():
+            payload[name] = _interpolate(grid['axes'], values, point).tolist()
+        return _conditional_json(payload)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
-@app.route('/api/news')
+# Live updates: one poller reads dataset_versions and fans new rows out to every open stream
+EVENTS_POLL_SECONDS = 1.0
+EVENTS_KEEPALIVE_SECONDS = 15.0
+EVENTS_QUEUE_SIZE = 64
+EVENTS_RETRY_MS = 5000
+
+class VersionBroadcaster:
+    """Single background poller shared by all event-stream subscribers
+
+    Each subscriber is just a small queue, so idle connections cost no
+    database work: the poller checks PRAGMA data_version (which only moves
+    when another connection commits) and reads the log once per change,
+    however many dashboards are open. It stops when the last one leaves.
+    Subscribers that fall EVENTS_QUEUE_SIZE events behind are dropped and
+    resume from Last-Event-ID when their browser reconnects.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._thread = None
+        self._conn = None
+        self._conn_path = None
+        self._data_version = None
+        self._last_version = 0
+
+    def _connection(self):
+        if self._conn_path != DB_PATH:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+            self._conn_path = DB_PATH
+            self._data_version = None
+            self._last_version = latest_version(self._conn)
+        return self._conn
+
+    def subscribe(self):
+        subscriber = queue.Queue(maxsize=EVENTS_QUEUE_SIZE)
+        with self._lock:
+            self._connection()  # Baseline before the stream reads its own starting point
+            self._subscribers.add(subscriber)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='version-broadcaster', daemon=True)
+                self._thread.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
+
+    def is_subscribed(self, subscriber):
+        with self._lock:
+            return subscriber in self._subscribers
+
+    def poll_once(self):
+        """Fan out versions logged since the last poll; returns them"""
+        with self._lock:
+            conn = self._connection()
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version == self._data_version:
+                return []
+            self._data_version = data_version
+
+            events = versions_since(conn, self._last_version)
+            for event in events:
+                for subscriber in list(self._subscribers):
+                    try:
+                        subscriber.put_nowait(event)
+                    except queue.Full:
+                        self._subscribers.discard(subscriber)
+            if events:
+                self._last_version = events[-1]['version']
+            return events
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    return
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.warning('Version poll failed: %s', e)
+            time.sleep(EVENTS_POLL_SECONDS)
+
+broadcaster = VersionBroadcaster()
+
+def _sse(event, event_type='dataset'):
+    """Format one dataset_versions row as a Server-Sent Event"""
+    return f"id: {event['version']}\nevent: {event_type}\ndata: {json.dumps(event)}\n\n"
+
+@api.route('/api/events')
+def dataset_events():
+    """Stream a small event whenever a dataset or the active run changes (Server-Sent Events)"""
+    last_seen = request.headers.get('Last-Event-ID', type=int)
+
+    def stream():
+        subscriber = broadcaster.subscribe()
+        try:
+            conn = sqlite3.connect(DB_PATH)
+            try:
+                missed = versions_since(conn, last_seen) if last_seen is not None else []
+                current = latest_version(conn)
+            finally:
+                conn.close()
+
+            yield f"retry: {EVENTS_RETRY_MS}\n\n"
+            # A reconnecting browser first receives what it missed while away
+            for event in missed:
+                yield _sse(event)
+            sent = current
+            yield _sse({'version': sent, 'dataset': None, 'run_id': None}, 'hello')
+
+            while True:
+                try:
+                    event = subscriber.get(timeout=EVENTS_KEEPALIVE_SECONDS)
+                except queue.Empty:
+                    if not broadcaster.is_subscribed(subscriber):
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                if event['version'] > sent:
+                    sent = event['version']
+                    yield _sse(event)
+        finally:
+            broadcaster.unsubscribe(subscriber)
+
+    return Response(stream(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    })
+
+@api.route('/api/news')
 def get_news():
     """Get recent climate change and sea level news articles"""
     try:
@@ -138,7 +497,7 @@ def get_news():
             'apiKey': NEWS_API_KEY
         }
         
-        response = requests.get(NEWS_API_URL, params=params, timeout=10)
+        response = _http_session().get(NEWS_API_URL, params=params, timeout=10)
         
         if response.status_code == 200:
             news_data = response.json()
@@ -183,7 +542,7 @@ def get_news():
             ]
         })
 
-@app.route('/api/admin/database-status')
+@api.route('/api/admin/database-status')
 def database_status():
     """Check database connection and return status"""
     try:
@@ -227,10 +586,12 @@ def database_status():
             'message': f'Database connection failed: {str(e)}'
         }), 500
 
-@app.route('/api/admin/read-database')
+@api.route('/api/admin/read-database')
 def read_database():
     """Read and return database contents from all tables"""
     try:
+        # ?rows=0 returns schemas and counts only; the admin panel pages rows via /api/admin/tables
+        sample_rows = max(0, min(request.args.get('rows', 100, type=int), 100))
         conn = sqlite3.connect(DB_PATH)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
@@ -251,7 +612,9 @@ def read_database():
             row_count = cursor.fetchone()[0]
             
             # Get sample data (limit to 100 rows per table to avoid overwhelming the response)
-            cursor.execute(f"SELECT * FROM {table} ORDER BY year LIMIT 100")
+            # Tables without a year column (e.g. backtest metrics) keep insertion order
+            order_by = 'year' if any(c['name'] == 'year' for c in columns) else 'rowid'
+            cursor.execute(f"SELECT * FROM {table} ORDER BY {order_by} LIMIT ?", (sample_rows,))
             rows = cursor.fetchall()
             
             # Convert rows to dictionaries
@@ -285,7 +648,173 @@ def read_database():
             'message': f'Failed to read database: {str(e)}'
         }), 500
 
-@app.route('/api/admin/api-details')
+ADMIN_PAGE_LIMIT = 500
+
+@api.route('/api/admin/tables/<table>/rows')
+def read_table_page(table):
+    """Keyset-paginated rows of one table (?after=<cursor>|offset=<n>&limit=<n>&columns=a,b)
+
+    Rows are ordered by (year, rowid), or rowid for tables without a year
+    column; WITHOUT ROWID tables are ordered by their declared primary key.
+    Each page resumes strictly after the previous page's last key (the
+    cursor is that key as a JSON array),
+    so a page costs the same whether it is the first or the ten-thousandth.
+    ?offset=<n> starts at the n-th row instead, so a client that jumps far
+    ahead fetches that window with one scan rather than every page before it;
+    its next_cursor continues with keyset pages.
+    """
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name = ?", (table,))
+            if cursor.fetchone() is None:
+                return jsonify({'status': 'error', 'error': f'Unknown table: {table}'}), 404
+
+            cursor.execute(f'PRAGMA table_info("{table}")')
+            info = cursor.fetchall()
+            available = [row[1] for row in info]
+            requested = request.args.get('columns')
+            columns = [c for c in requested.split(',') if c] if requested else available
+            unknown = [c for c in columns if c not in available]
+            if unknown:
+                return jsonify({'status': 'error', 'error': f'Unknown columns: {", ".join(unknown)}'}), 400
+
+            limit = max(1, min(request.args.get('limit', 100, type=int), ADMIN_PAGE_LIMIT))
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name = ?", (table,))
+            if 'WITHOUT ROWID' in cursor.fetchone()[0].upper():
+                key = [f'"{row[1]}"' for row in sorted((row for row in info if row[5]), key=lambda row: row[5])]
+            else:
+                key = ['year', 'rowid'] if 'year' in available else ['rowid']
+            key_sql = ', '.join(key)
+
+            where, params = '', []
+            after = request.args.get('after')
+            offset = request.args.get('offset', 0, type=int)
+            if offset < 0 or (offset and after):
+                return jsonify({'status': 'error', 'error': 'offset must be >= 0 and not combined with after'}), 400
+            if after:
+                params = json.loads(after)
+                if (not isinstance(params, list) or len(params) != len(key)
+                        or not all(isinstance(v, (int, float, str)) and not isinstance(v, bool) for v in params)):
+                    return jsonify({'status': 'error', 'error': f'Cursor must be a list of {len(key)} values'}), 400
+                where = f'WHERE ({key_sql}) > ({", ".join("?" * len(key))})'
+
+            projection = ', '.join(f'"{c}"' for c in columns)
+            cursor.execute(
+                f'SELECT {key_sql}, {projection} FROM "{table}" {where} ORDER BY {key_sql} LIMIT ? OFFSET ?',
+                (*params, limit, offset)
+            )
+            rows = cursor.fetchall()
+            # Counting is a full scan, so only the first page pays for it
+            total_rows = None
+            if not (after or offset):
+                cursor.execute(f'SELECT COUNT(*) FROM "{table}"')
+                total_rows = cursor.fetchone()[0]
+        finally:
+            conn.close()
+
+        # Full page means there may be more; the client stops on a null cursor
+        next_cursor = json.dumps(list(rows[-1][:len(key)])) if len(rows) == limit else None
+        return jsonify({
+            'status': 'success',
+            'table': table,
+            'columns': columns,
+            'rows': [list(row[len(key):]) for row in rows],
+            'total_rows': total_rows,
+            'next_cursor': next_cursor
+        })
+    except ValueError:
+        return jsonify({'status': 'error', 'error': 'Cursor must be a JSON array'}), 400
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 500
+
+@api.route('/api/admin/runs')
+def list_model_runs():
+    """List registered model runs, newest first, flagging the active one"""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        active = get_active_run_id(conn)
+        try:
+            cursor.execute(
+                "SELECT run_id, created_at, data_hash, params, metrics, artifact_path, timings "
+                "FROM model_runs ORDER BY created_at DESC, run_id DESC"
+            )
+            rows = cursor.fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+        conn.close()
+
+        runs = []
+        for row in rows:
+            run = dict(row)
+            for key in ('params', 'metrics', 'timings'):
+                run[key] = json.loads(run[key]) if run[key] else {}
+            run['active'] = run['run_id'] == active
+            runs.append(run)
+
+        return jsonify({'status': 'success', 'active_run': active, 'runs': runs})
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 500
+
+PROFILE_FIELDS = ('stage', 'wall_s', 'cpu_s', 'py_peak_mb', 'memory_traced', 'rss_mb', 'rss_delta_mb')
+
+@api.route('/api/admin/profiles')
+def list_pipeline_profiles():
+    """Per-stage profiles of recent `main.py --profile` runs, newest first (?limit=<runs>)"""
+    try:
+        limit = max(1, min(request.args.get('limit', 20, type=int), 200))
+        conn = sqlite3.connect(DB_PATH)
+        conn.row_factory = sqlite3.Row
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT p.* FROM pipeline_profiles p "
+                "JOIN (SELECT run_id, MAX(created_at) AS created_at FROM pipeline_profiles "
+                "      GROUP BY run_id ORDER BY created_at DESC, run_id DESC LIMIT ?) recent "
+                "ON p.run_id = recent.run_id "
+                "ORDER BY recent.created_at DESC, p.run_id DESC, p.seq",
+                (limit,)
+            )
+            rows = cursor.fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+        conn.close()
+
+        profiles = []
+        for row in rows:
+            if not profiles or profiles[-1]['run_id'] != row['run_id']:
+                profiles.append({'run_id': row['run_id'], 'created_at': row['created_at'], 'stages': []})
+            stage = {key: row[key] for key in PROFILE_FIELDS}
+            stage['memory_traced'] = bool(stage['memory_traced'])
+            profiles[-1]['stages'].append(stage)
+        for profile in profiles:
+            profile['total_wall_s'] = sum(stage['wall_s'] or 0 for stage in profile['stages'])
+
+        return jsonify({'status': 'success', 'profiles': profiles})
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 500
+
+@api.route('/api/admin/runs/<run_id>/activate', methods=['POST'])
+def activate_model_run(run_id):
+    """Flip the active-run pointer so the prediction endpoints serve another run"""
+    try:
+        conn = sqlite3.connect(DB_PATH)
+        try:
+            if not run_exists(conn, run_id):
+                return jsonify({'status': 'error', 'error': f'Unknown run: {run_id}'}), 404
+            # Also logs the switch, so open dashboards pick it up
+            set_active_run(conn, run_id)
+            conn.commit()
+        finally:
+            conn.close()
+        return jsonify({'status': 'success', 'active_run': run_id})
+    except Exception as e:
+        return jsonify({'status': 'error', 'error': str(e)}), 500
+
+@api.route('/api/admin/api-details')
 def api_details():
     """Get API endpoint details and configuration"""
     try:
@@ -299,7 +828,7 @@ def api_details():
                 'pageSize': 1,
                 'apiKey': NEWS_API_KEY
             }
-            test_response = requests.get(NEWS_API_URL, params=test_params, timeout=5)
+            test_response = _http_session().get(NEWS_API_URL, params=test_params, timeout=5)
             if test_response.status_code == 200:
                 news_api_status = 'connected'
                 news_api_message = 'News API is working correctly'
@@ -325,15 +854,35 @@ def api_details():
                 'method': 'GET',
                 'description': 'Get historical sea level data'
             },
+            {
+                'path': '/api/climate-features',
+                'method': 'GET',
+                'description': 'Get temperature, CO2, ln CO2 ratio and sea level joined per year'
+            },
             {
                 'path': '/api/temperature-predictions',
                 'method': 'GET',
-                'description': 'Get temperature predictions up to 2050'
+                'description': 'Get temperature predictions up to 2050 (optional ?run=<run_id>)'
             },
             {
                 'path': '/api/sea-level-predictions',
                 'method': 'GET',
-                'description': 'Get sea level predictions up to 2050'
+                'description': 'Get sea level predictions up to 2050 (optional ?run=<run_id>)'
+            },
+            {
+                'path': '/api/explain',
+                'method': 'GET',
+                'description': 'Per-year feature contributions behind the predictions (optional ?series=<name>&run=<run_id>)'
+            },
+            {
+                'path': '/api/scenario',
+                'method': 'GET',
+                'description': 'Scenario forecasts interpolated from the precomputed grid (?co2_growth=<%/yr>&forcing_ramp=<n>)'
+            },
+            {
+                'path': '/api/events',
+                'method': 'GET',
+                'description': 'Server-Sent Events stream announcing changed tables and newly active runs'
             },
             {
                 'path': '/api/news',
@@ -345,6 +894,26 @@ def api_details():
                 'method': 'GET',
                 'description': 'Check database connection status'
             },
+            {
+                'path': '/api/admin/tables/<table>/rows',
+                'method': 'GET',
+                'description': 'Keyset-paginated table rows (optional ?after=<cursor> or ?offset=<n>, &limit=<n>&columns=a,b)'
+            },
+            {
+                'path': '/api/admin/runs',
+                'method': 'GET',
+                'description': 'List registered model runs and the active run'
+            },
+            {
+                'path': '/api/admin/profiles',
+                'method': 'GET',
+                'description': 'Per-stage wall/CPU time and RSS (plus traced memory, if enabled) of recent profiled pipeline runs'
+            },
+            {
+                'path': '/api/admin/runs/<run_id>/activate',
+                'method': 'POST',
+                'description': 'Serve another registered run by default'
+            },
             {
                 'path': '/api/admin/api-details',
                 'method': 'GET',
@@ -376,5 +945,66 @@ def api_details():
             'message': f'Failed to get API details: {str(e)}'
         }), 500
 
+def precompute_responses(app, paths=PRECOMPUTED_PATHS):
+    """Render the series endpoints once; returns the paths now served from memory"""
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        version = latest_version(conn)
+    finally:
+        conn.close()
+
+    responses = {}
+    with app.test_client() as client:
+        for path in paths:
+            response = client.get(path)
+            if response.status_code == 200 and response.headers.get('ETag'):
+                responses[path] = (response.get_data(), response.headers['ETag'], response.mimetype)
+    _precomputed.update(db_path=DB_PATH, version=version, responses=responses)
+    return sorted(responses)
+
+def _serve_precomputed():
+    """Answer a GET for a precomputed path from memory while its data version is current"""
+    # One read of the dict: another thread may swap in an empty one at any point
+    responses = _precomputed['responses']
+    entry = responses.get(request.path)
+    if request.method != 'GET' or request.query_string or entry is None:
+        return None
+    try:
+        current = latest_version(_read_connection())
+    except sqlite3.Error:
+        current = None
+    if DB_PATH != _precomputed['db_path'] or current != _precomputed['version']:
+        # Data changed since the snapshot: fall back to the live routes from now on
+        _precomputed['responses'] = {}
+        return None
+
+    body, etag, mimetype = entry
+    response = Response(body, mimetype=mimetype)
+    response.set_etag(etag.strip('"'))
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+def init_worker():
+    """Per-process setup after a fork: fresh DB connections, HTTP session and event poller"""
+    global _local, broadcaster
+    _local = threading.local()
+    _http.update(pid=None, session=None)
+    broadcaster = VersionBroadcaster()
+    _read_connection()
+    _http_session()
+
+def create_app(config=None):
+    """Build the Flask app: static frontend, CORS, API routes and precomputed-response serving"""
+    app = Flask(__name__, static_folder=str(FRONTEND_DIR), static_url_path='')
+    if config:
+        app.config.update(config)
+    CORS(app, expose_headers=['ETag'])  # Enable CORS for frontend requests (ETag readable for revalidation)
+    app.register_blueprint(api)
+    app.before_request(_serve_precomputed)
+    return app
+
+# Module-level app for `python backend/app.py`, `flask --app backend.app` and the tests
+app = create_app()
+
 if __name__ == '__main__':
-    app.run(debug=True, port=5000, host='127.0.0.1')
+    app.run(debug=True, port=5000, host='127.0.0.1', threaded=True)
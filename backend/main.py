@@ -4,52 +4,42 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 """
 Driver script that loads historical climate data, trains the hybrid
 polynomial + XGBoost pipeline, and prints future temperature projections.
-"""
-
-from backend.utils.data_loader import (
-    load_main,
-    load_co2,
-    load_sea_level,
-    merge_datasets,
-    merge_with_sea_level,
-    split_data,
-    save_predictions,
-)
-from backend.model.temprature_model import (
-    train_poly_model,
-    train_xgb_residual,
-    poly_equation,
-    predict_future,
-)
-from backend.model.sea_level_model import (
-    train_sea_poly_model,
-    train_sea_xgb_residual,
-    predict_sea_future,
-)
-
-
-if __name__ == "__main__":
-    # Ingest historical temperature and CO₂ observations directly from SQLite
-    main_df = load_main()
-    co2_df = load_co2()
-    data = merge_datasets(main_df, co2_df)  # Supplies ln(CO₂) forcing proxy
+Each execution is recorded as a versioned run in the model registry.
 
-    # Reserve earlier years for training and keep recent periods for holdout checks
-    train, val, test = split_data(data)
+Usage:
+    python backend/main.py [--profile] [--profile-memory] [--profile-dir DIR] [--scenarios]
+"""
 
-    # Fit the long-term polynomial warming trend
-    poly = train_poly_model(train, degree=2)
+import argparse
 
-    # Learn residual structure that the polynomial baseline misses
-    xgb = train_xgb_residual(train, poly)
+from backend.model.pipeline import run_temperature, run_sea_level, publish
+from backend.model.scenarios import build_scenario_grid
+from backend.utils.profiling import PipelineProfiler, save_profile, set_profiler
 
-    # Generate anchored projections for the coming decades
-    future_years, co2_future, poly_pred, hybrid_pred, anchored = predict_future(
-        poly, xgb, data, start=2025, end=2050
-    )
 
-    # Persist the latest projection run so other components can query it
-    save_predictions(future_years, anchored, table_name="future_predictions")
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the forecast pipeline and register a run")
+    parser.add_argument("--profile", action="store_true",
+                        help="record wall/CPU time and RSS per stage in pipeline_profiles")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="also trace peak Python/NumPy allocations; slows the stages, so run it "
+                             "as a separate pass from timing (implies --profile)")
+    parser.add_argument("--profile-dir", default=None,
+                        help="also dump cProfile stats per stage into this directory (implies --profile)")
+    parser.add_argument("--scenarios", action="store_true",
+                        help="precompute the CO₂ growth x forcing ramp scenario grid for the new run")
+    args = parser.parse_args()
+
+    profiler = None
+    if args.profile or args.profile_memory or args.profile_dir:
+        profiler = PipelineProfiler(profile_dir=args.profile_dir, trace_memory=args.profile_memory)
+        set_profiler(profiler)
+
+    timings = {}
+
+    # -------- Temperature Pipeline -------- #
+    temperature = run_temperature(timings, start=2025, end=2050)
+    future_years, anchored = temperature["years"], temperature["predictions"]
 
     # Present the final deterministic forecast in the console
     print("\nFuture Predictions")
@@ -61,21 +51,28 @@ if __name__ == "__main__":
     print(f"  Max forecast: {anchored.max():.2f} °C in {future_years[anchored.argmax()]}")
 
     # -------- Sea Level Pipeline -------- #
-    sea_df = load_sea_level()
-    sea_dataset = (
-        merge_with_sea_level(data, sea_df).sort_values("year").reset_index(drop=True)
-    )
-    sea_train, sea_val, sea_test = split_data(sea_dataset)
-
-    sea_poly = train_sea_poly_model(sea_train)
-    sea_xgb = train_sea_xgb_residual(sea_train, sea_poly)
-
-    sea_years, sea_poly_pred, sea_hybrid, sea_anchored = predict_sea_future(
-        sea_poly, sea_xgb, sea_dataset, future_years, anchored
-    )
-
-    save_predictions(sea_years, sea_anchored, table_name="sea_level_predictions")
+    sea_level = run_sea_level(future_years, anchored, timings)
 
     print("\nSea Level Projections")
-    for y, lvl in zip(sea_years, sea_anchored):
-        print(f"{y}: GMSL={lvl:.2f} mm")
\ No newline at end of file
+    for y, lvl in zip(sea_level["years"], sea_level["predictions"]):
+        print(f"{y}: GMSL={lvl:.2f} mm")
+
+    # -------- Publish -------- #
+    # Latest-run tables and a new registry run (now the active one)
+    run_id = publish(temperature, sea_level, timings)
+    print(f"\nRegistered run {run_id} (now active)")
+
+    # -------- Scenario Grid -------- #
+    if args.scenarios:
+        stats = build_scenario_grid(run_id, models={**temperature["models"], **sea_level["models"]})
+        print(f"\nScenario grid: {stats['scenarios']} scenarios ({stats['stored']} rows) "
+              f"in {stats['seconds']:.2f}s")
+
+    # -------- Profile -------- #
+    if profiler is not None:
+        set_profiler(None)
+        save_profile(run_id, profiler)
+        print("\nStage Profile")
+        print(profiler.summary())
+        if args.profile_dir:
+            print(f"cProfile stats written to {args.profile_dir}")
@@ -0,0 +1,139 @@
+"""
+Fan-out training of one hybrid model per series (region, station, country).
+
+A long-format dataset keyed by a series id is split into per-series frames,
+which are trained and forecast in worker processes in chunks of several
+series per task to amortize scheduling and pickling overhead. Forecasts are
+written to SQLite in bulk as each chunk finishes.
+"""
+
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.model.temprature_model import train_poly_model, train_xgb_residual, predict_future
+from backend.model.sea_level_model import (
+    train_sea_poly_model,
+    train_sea_xgb_residual,
+    predict_sea_future,
+)
+from backend.utils.data_loader import save_series_predictions, split_data
+from backend.utils.resources import plan_workers, worker_pool
+
+
+def _forecast_series(kind: str, df: pd.DataFrame, start: int, end: int, future_temps):
+    """
+    Train the hybrid model for one series and return ``(years, anchored)``.
+    """
+    train, _, _ = split_data(df)
+    if kind == "temperature":
+        poly = train_poly_model(train, degree=2)
+        xgb = train_xgb_residual(train, poly)
+        years, _, _, _, anchored = predict_future(poly, xgb, df, start=start, end=end)
+    elif kind == "sea_level":
+        poly = train_sea_poly_model(train)
+        xgb = train_sea_xgb_residual(train, poly)
+        years, _, _, anchored = predict_sea_future(
+            poly, xgb, df, np.arange(start, end + 1), future_temps
+        )
+    else:
+        raise ValueError(f"Unknown model kind: {kind}")
+    return years, anchored
+
+
+def _train_chunk(task):
+    """
+    Train every series in a chunk; failures are reported rather than raised.
+    """
+    kind, chunk, start, end, future_temps = task
+    frames, errors = [], {}
+    for series_id, df in chunk:
+        try:
+            years, anchored = _forecast_series(kind, df, start, end, future_temps)
+        except Exception as exc:  # One bad series must not sink the batch
+            errors[series_id] = f"{type(exc).__name__}: {exc}"
+            continue
+        frames.append(pd.DataFrame({"series_id": series_id, "year": years, "prediction": anchored}))
+    return frames, errors
+
+
+def train_series(
+    long_df: pd.DataFrame,
+    kind: str = "temperature",
+    series_col: str = "series_id",
+    start: int = 2025,
+    end: int = 2050,
+    future_temps=None,
+    max_workers: int | None = None,
+    chunksize: int | None = None,
+    table_name: str | None = "series_predictions",
+):
+    """
+    Train and forecast one hybrid model per series across a process pool.
+
+    ``long_df`` carries the columns the chosen model needs plus ``series_col``.
+    Sea-level fan-out needs ``future_temps`` covering ``start..end``. With a
+    ``table_name`` each finished chunk is upserted into SQLite.
+
+    Returns ``(predictions, errors, stats)``: all forecasts in long format, a
+    mapping of failed series to error text, and throughput figures.
+    """
+    if kind == "sea_level" and future_temps is None:
+        raise ValueError("Sea-level fan-out needs future_temps")
+
+    started = time.perf_counter()
+    groups = [
+        (series_id, df.drop(columns=series_col).sort_values("year").reset_index(drop=True))
+        for series_id, df in long_df.groupby(series_col, sort=True)
+    ]
+    if not groups:
+        raise ValueError("No series to train")
+
+    workers, _ = plan_workers(len(groups), max_workers)
+    if chunksize is None:
+        # A few chunks per worker keeps the pool busy without per-series overhead
+        chunksize = max(1, math.ceil(len(groups) / (workers * 4)))
+    tasks = [
+        (kind, groups[i : i + chunksize], start, end, future_temps)
+        for i in range(0, len(groups), chunksize)
+    ]
+    # The pool is sized for the chunks, which may be fewer than the planned workers
+    workers, _ = plan_workers(len(tasks), max_workers)
+
+    frames, errors = [], {}
+
+    def collect(result):
+        chunk_frames, chunk_errors = result
+        errors.update(chunk_errors)
+        if chunk_frames:
+            frames.extend(chunk_frames)
+            if table_name:
+                save_series_predictions(pd.concat(chunk_frames), table_name=table_name)
+
+    if workers <= 1:
+        for task in tasks:
+            collect(_train_chunk(task))
+    else:
+        with worker_pool(len(tasks), max_workers) as pool:
+            for result in pool.map(_train_chunk, tasks):
+                collect(result)
+
+    elapsed = time.perf_counter() - started
+    trained = len(groups) - len(errors)
+    stats = {
+        "n_series": len(groups),
+        "trained": trained,
+        "failed": len(errors),
+        "workers": workers,
+        "chunksize": chunksize,
+        "seconds": elapsed,
+        "series_per_minute": trained * 60.0 / elapsed if elapsed > 0 else float("inf"),
+    }
+    predictions = (
+        pd.concat(frames, ignore_index=True)
+        if frames
+        else pd.DataFrame(columns=["series_id", "year", "prediction"])
+    )
+    return predictions, errors, stats
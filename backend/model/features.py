@@ -0,0 +1,178 @@
+"""
+Shared feature store for the hybrid temperature and sea-level models.
+
+Both residual learners use the same centred year terms plus a handful of
+exogenous inputs. The store builds every feature a dataset can support once,
+as a contiguous NumPy matrix, caches it under a hash of the source columns,
+and hands out column subsets to each model without building DataFrames.
+"""
+
+from collections import OrderedDict
+import hashlib
+import threading
+
+import numpy as np
+
+REF_YEAR = 2000  # Reference year for centering features
+
+# Raw columns the engineered features are derived from
+_SOURCE_COLUMNS = ("year", "anthropogenic_c", "anthropogenic_f", "co2_ppm", "ln_co2_ratio", "observed_c")
+
+TEMPERATURE_FEATURES = ("year_c", "year_c2", "anthro_c", "anthro_f", "co2_ppm", "ln_co2_ratio")
+SEA_LEVEL_FEATURES = ("year_c", "year_c2", "temp", "temp2")
+
+
+def _build_columns(sources: dict) -> dict:
+    """
+    Derive every engineered feature supported by the available source columns.
+    """
+    cols = {}
+    if "year" in sources:
+        year_c = sources["year"] - REF_YEAR
+        cols["year_c"] = year_c
+        cols["year_c2"] = year_c**2
+    if "anthropogenic_c" in sources:
+        cols["anthro_c"] = sources["anthropogenic_c"]
+    if "anthropogenic_f" in sources:
+        cols["anthro_f"] = sources["anthropogenic_f"]
+    if "co2_ppm" in sources:
+        cols["co2_ppm"] = sources["co2_ppm"]
+    if "ln_co2_ratio" in sources:
+        cols["ln_co2_ratio"] = sources["ln_co2_ratio"]
+    if "observed_c" in sources:
+        temp = sources["observed_c"]
+        cols["temp"] = temp
+        cols["temp2"] = temp**2
+    return cols
+
+
+def feature_dtype(sources: dict):
+    """
+    Floating dtype for features: float32 only when every float input is float32.
+    """
+    floats = [np.asarray(v).dtype for v in sources.values() if np.asarray(v).dtype.kind == "f"]
+    return np.result_type(*floats) if floats else np.dtype(np.float64)
+
+
+def build_features(sources: dict, columns) -> np.ndarray:
+    """
+    Uncached C-contiguous feature matrix for one-off inputs (e.g. simulated paths).
+    """
+    dtype = feature_dtype(sources)
+    sources = {name: np.asarray(values, dtype=dtype) for name, values in sources.items()}
+    cols = _build_columns(sources)
+    missing = [c for c in columns if c not in cols]
+    if missing:
+        raise KeyError(f"Cannot build features {missing} from the supplied columns")
+    n_rows = len(next(iter(sources.values()))) if sources else 0
+    matrix = np.empty((n_rows, len(columns)), dtype=dtype)
+    for i, name in enumerate(columns):
+        matrix[:, i] = cols[name]
+    return matrix
+
+
+class _Entry:
+    """
+    Cached feature matrix for one dataset version plus its served subsets.
+    """
+
+    def __init__(self, names: tuple, matrix: np.ndarray):
+        self.index = {name: i for i, name in enumerate(names)}
+        self.matrix = matrix
+        self.subsets = {}
+
+
+class FeatureStore:
+    """
+    Content-addressed cache of engineered feature matrices.
+
+    Safe to share between threads (threaded Flask, thread-pool workers): the
+    entry table and counters are guarded by a lock, while hashing the inputs
+    happens outside it. Process-pool workers each hold their own store.
+    """
+
+    def __init__(self, max_entries: int = 64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """
+        Drop every cached matrix and reset the hit/miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def matrix(self, data, columns) -> np.ndarray:
+        """
+        Return a read-only C-contiguous ``(rows, len(columns))`` feature matrix.
+
+        ``data`` may be a DataFrame or any mapping of column name to 1-D array.
+        The matrix is float32 when the inputs are (compact mode), else float64.
+        """
+        columns = tuple(columns)
+        sources = {name: np.asarray(data[name]) for name in _SOURCE_COLUMNS if name in data}
+        dtype = feature_dtype(sources)
+        sources = {name: values.astype(dtype, copy=False) for name, values in sources.items()}
+
+        key = self._hash(sources)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                entry = self._insert(key, sources)
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+
+            subset = entry.subsets.get(columns)
+            if subset is None:
+                missing = [c for c in columns if c not in entry.index]
+                if missing:
+                    raise KeyError(f"Cannot build features {missing} from the supplied columns")
+                subset = np.ascontiguousarray(entry.matrix[:, [entry.index[c] for c in columns]])
+                subset.flags.writeable = False
+                entry.subsets[columns] = subset
+        return subset
+
+    @staticmethod
+    def _hash(sources: dict) -> str:
+        digest = hashlib.blake2b(digest_size=16)
+        for name, values in sources.items():
+            digest.update(values.dtype.str.encode())
+            digest.update(name.encode())
+            digest.update(np.ascontiguousarray(values).tobytes())
+        return digest.hexdigest()
+
+    def _insert(self, key: str, sources: dict) -> _Entry:
+        # Called with the lock held
+        names = tuple(_build_columns(sources))
+        matrix = build_features(sources, names)
+        matrix.flags.writeable = False
+
+        entry = _Entry(names, matrix)
+        self._entries[key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+
+FEATURE_STORE = FeatureStore()
+
+
+def temperature_features(data) -> np.ndarray:
+    """
+    Feature matrix consumed by the temperature residual model.
+    """
+    return FEATURE_STORE.matrix(data, TEMPERATURE_FEATURES)
+
+
+def sea_level_features(data) -> np.ndarray:
+    """
+    Feature matrix consumed by the sea-level residual model.
+    """
+    return FEATURE_STORE.matrix(data, SEA_LEVEL_FEATURES)
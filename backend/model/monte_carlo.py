@@ -0,0 +1,224 @@
+"""
+Vectorized Monte Carlo forecasts for the hybrid temperature and sea-level
+models.
+
+The deterministic ``predict_future`` extrapolates CO₂ with a single fitted
+growth rate and ramps anthropogenic forcing linearly to a fixed end point.
+Here both assumptions are sampled per path; every chunk of paths is pushed
+through the temperature residual model and then the sea-level residual model
+as one batched prediction, and the results are summarized as quantile fans.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.model.features import (
+    SEA_LEVEL_FEATURES,
+    TEMPERATURE_FEATURES,
+    build_features,
+    sea_level_features,
+    temperature_features,
+)
+
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+def co2_growth_prior(df: pd.DataFrame, since: int = 2010):
+    """
+    Fit the log-linear CO₂ growth rate used by ``predict_future`` and its standard error.
+    """
+    co2_hist = df[["year", "co2_ppm"]].dropna()
+    recent = co2_hist[co2_hist["year"] >= since]
+    coefs, cov = np.polyfit(recent["year"], np.log(recent["co2_ppm"]), 1, cov=True)
+    return float(coefs[0]), float(np.sqrt(cov[0, 0]))
+
+
+def sample_scenarios(
+    df: pd.DataFrame,
+    n_paths: int,
+    co2_growth_rel_sd: float = 0.15,
+    forcing_ramp_sd: float = 0.25,
+    seed: int | None = 42,
+):
+    """
+    Draw per-path CO₂ growth rates and end-of-horizon forcing increments.
+
+    Growth rates are centred on the fitted trend with the fit's standard error
+    plus ``co2_growth_rel_sd`` relative scenario spread; forcing increments are
+    centred on the +0.5 ramp used by the deterministic forecast.
+    """
+    rng = np.random.default_rng(seed)
+    slope, slope_se = co2_growth_prior(df)
+    slope_sd = np.hypot(slope_se, co2_growth_rel_sd * slope)
+
+    slopes = rng.normal(slope, slope_sd, n_paths)
+    ramps = rng.normal(0.5, forcing_ramp_sd, n_paths)
+    return slopes, ramps
+
+
+def temperature_base(poly_model, xgb_model, df: pd.DataFrame, years) -> np.ndarray:
+    """
+    Polynomial trend over ``years`` plus the offset anchoring the hybrid model to the last observation.
+    """
+    hist_X = temperature_features(df)
+    poly_pred = poly_model.predict(pd.DataFrame({"year": years}))
+    last_model = (
+        poly_model.predict(pd.DataFrame({"year": [df["year"].iloc[-1]]}))
+        + xgb_model.predict(hist_X[-1:])
+    )[0]
+    return (poly_pred + (df["observed_c"].iloc[-1] - last_model)).astype(hist_X.dtype)
+
+
+def sea_level_base(poly_model, xgb_model, sea_df: pd.DataFrame, years) -> np.ndarray:
+    """
+    Anchored sea-level trend over ``years``; residual paths are added on top.
+    """
+    hist_X = sea_level_features(sea_df)
+    poly_pred = poly_model.predict(pd.DataFrame({"year": years}))
+    last_model = (
+        poly_model.predict(pd.DataFrame({"year": [sea_df["year"].iloc[-1]]}))
+        + xgb_model.predict(hist_X[-1:])
+    )[0]
+    return (poly_pred + (sea_df["gmsl"].iloc[-1] - last_model)).astype(hist_X.dtype)
+
+
+def _temperature_paths(xgb_model, df, years, slopes, ramps) -> np.ndarray:
+    """
+    Residual predictions for a chunk of scenario paths, shape ``(paths, years)``.
+    """
+    n_paths, n_years = len(slopes), len(years)
+    dtype = temperature_features(df).dtype
+    co2_hist = df[["year", "co2_ppm"]].dropna()
+    last_year = co2_hist["year"].iloc[-1]
+    last_co2 = co2_hist["co2_ppm"].iloc[-1]
+
+    # Same extrapolation as predict_future, broadcast over sampled parameters
+    co2 = last_co2 * np.exp(slopes[:, None] * (years - last_year)[None, :])
+    co2 = co2.astype(dtype, copy=False)
+    ramp = np.linspace(0.0, 1.0, n_years, dtype=dtype)[None, :]
+
+    sources = {
+        "year": np.broadcast_to(years, (n_paths, n_years)).ravel(),
+        "co2_ppm": co2.ravel(),
+        "ln_co2_ratio": np.log(co2 / 278.0).ravel(),
+    }
+    for col in ("anthropogenic_c", "anthropogenic_f"):
+        start = df[col].iloc[-15:].mean()
+        end = (df[col].iloc[-1] + ramps[:, None]).astype(dtype, copy=False)
+        sources[col] = (start + (end - start) * ramp).ravel()
+
+    X = build_features(sources, TEMPERATURE_FEATURES)
+    return xgb_model.predict(X).reshape(n_paths, n_years)
+
+
+def _sea_level_paths(xgb_model, years, temps) -> np.ndarray:
+    """
+    Residual predictions for a chunk of simulated temperature paths.
+    """
+    n_paths, n_years = temps.shape
+    sources = {
+        "year": np.broadcast_to(years, (n_paths, n_years)).ravel(),
+        "observed_c": temps.ravel(),
+    }
+    X = build_features(sources, SEA_LEVEL_FEATURES)
+    return xgb_model.predict(X).reshape(n_paths, n_years)
+
+
+def quantile_fan(years, paths: np.ndarray, quantiles=DEFAULT_QUANTILES) -> pd.DataFrame:
+    """
+    Summarize ``(paths, years)`` simulations into one row of quantiles per year.
+    """
+    qs = np.quantile(paths, quantiles, axis=0)
+    fan = pd.DataFrame({"year": years})
+    for q, values in zip(quantiles, qs):
+        fan[f"q{round(q * 100):02d}"] = values
+    fan["mean"] = paths.mean(axis=0)
+    return fan
+
+
+def simulate_future(
+    poly_model,
+    xgb_model,
+    df: pd.DataFrame,
+    start: int,
+    end: int,
+    sea_poly_model=None,
+    sea_xgb_model=None,
+    sea_df: pd.DataFrame | None = None,
+    n_paths: int = 20000,
+    chunk_size: int = 5000,
+    quantiles=DEFAULT_QUANTILES,
+    seed: int | None = 42,
+    **scenario_kwargs,
+):
+    """
+    Run ``n_paths`` stochastic forecasts and return quantile fans.
+
+    Returns ``(years, temp_fan, sea_fan, stats)``; ``sea_fan`` is ``None`` unless
+    the sea-level models and dataset are supplied. Paths are evaluated in
+    chunks of ``chunk_size`` so peak feature-matrix memory stays bounded.
+    """
+    started = time.perf_counter()
+    years = np.arange(start, end + 1)
+    slopes, ramps = sample_scenarios(df, n_paths, seed=seed, **scenario_kwargs)
+
+    # Deterministic pieces are shared by every path
+    temp_base = temperature_base(poly_model, xgb_model, df, years)
+    dtype = temp_base.dtype  # float32 paths in compact mode halve the path buffers
+
+    with_sea = sea_poly_model is not None and sea_xgb_model is not None and sea_df is not None
+    if with_sea:
+        sea_base = sea_level_base(sea_poly_model, sea_xgb_model, sea_df, years).astype(dtype)
+        sea_paths = np.empty((n_paths, len(years)), dtype=dtype)
+
+    temp_paths = np.empty((n_paths, len(years)), dtype=dtype)
+    for lo in range(0, n_paths, chunk_size):
+        hi = min(lo + chunk_size, n_paths)
+        temps = temp_base + _temperature_paths(xgb_model, df, years, slopes[lo:hi], ramps[lo:hi])
+        temp_paths[lo:hi] = temps
+        if with_sea:
+            sea_paths[lo:hi] = sea_base + _sea_level_paths(sea_xgb_model, years, temps)
+
+    elapsed = time.perf_counter() - started
+    stats = {
+        "n_paths": n_paths,
+        "chunk_size": chunk_size,
+        "seconds": elapsed,
+        "paths_per_second": n_paths / elapsed if elapsed > 0 else float("inf"),
+    }
+
+    temp_fan = quantile_fan(years, temp_paths, quantiles)
+    sea_fan = quantile_fan(years, sea_paths, quantiles) if with_sea else None
+    return years, temp_fan, sea_fan, stats
+
+
+if __name__ == "__main__":
+    from backend.utils.data_loader import (
+        load_climate_features,
+        split_data,
+    )
+    from backend.model.temprature_model import train_poly_model, train_xgb_residual
+    from backend.model.sea_level_model import train_sea_poly_model, train_sea_xgb_residual
+
+    data = load_climate_features()
+    train, _, _ = split_data(data)
+    poly = train_poly_model(train, degree=2)
+    xgb = train_xgb_residual(train, poly)
+
+    sea_dataset = load_climate_features(with_sea_level=True)
+    sea_train, _, _ = split_data(sea_dataset)
+    sea_poly = train_sea_poly_model(sea_train)
+    sea_xgb = train_sea_xgb_residual(sea_train, sea_poly)
+
+    years, temp_fan, sea_fan, stats = simulate_future(
+        poly, xgb, data, 2025, 2050, sea_poly, sea_xgb, sea_dataset
+    )
+
+    print("\nTemperature forecast fan (°C)")
+    print(temp_fan.to_string(index=False, float_format=lambda v: f"{v:.2f}"))
+    print("\nSea level forecast fan (mm)")
+    print(sea_fan.to_string(index=False, float_format=lambda v: f"{v:.1f}"))
+    print(f"\n{stats['n_paths']} paths in {stats['seconds']:.2f}s "
+          f"({stats['paths_per_second']:.0f} paths/s)")
@@ -0,0 +1,242 @@
+"""
+Forecast pipeline stages shared by ``main.py`` and the data watcher.
+
+The pipeline has two stages: temperature (driven by the temperature and CO₂
+tables) and sea level (driven by the sea-level table plus the temperature
+history and forecast). ``stages_for`` maps changed source tables to the
+stages they invalidate, so a sea-level-only update reuses the active run's
+temperature forecast instead of retraining it.
+"""
+
+from contextlib import contextmanager, nullcontext
+import time
+
+from backend.utils.data_loader import load_climate_features, save_predictions, split_data
+from backend.utils.profiling import get_profiler
+from backend.utils.registry import (
+    hash_datasets,
+    load_run_contributions,
+    load_run_predictions,
+    new_run_id,
+    register_run,
+    save_artifacts,
+)
+from backend.model.explain import sea_level_contributions, temperature_contributions
+from backend.model.features import sea_level_features
+from backend.model.temprature_model import (
+    train_poly_model,
+    train_xgb_residual,
+    predict_future,
+    evaluate_model,
+    _calculate_metrics,
+)
+from backend.model.sea_level_model import (
+    train_sea_poly_model,
+    train_sea_xgb_residual,
+    predict_sea_future,
+)
+
+TEMPERATURE = "temperature"
+SEA_LEVEL = "sea_level"
+
+# Source tables each stage reads (directly or through the temperature forecast)
+STAGE_INPUTS = {
+    TEMPERATURE: {"temperature", "co2_concentration"},
+    SEA_LEVEL: {"temperature", "co2_concentration", "sea_level"},
+}
+
+
+@contextmanager
+def _timed(timings: dict, stage: str):
+    """
+    Record the wall time of a pipeline stage in seconds (and profile it when a profiler is installed).
+    """
+    profiler = get_profiler()
+    with profiler.stage(stage) if profiler is not None else nullcontext():
+        start = time.perf_counter()
+        yield
+        timings[stage] = time.perf_counter() - start
+
+
+def _metrics(y_true, y_pred) -> dict:
+    """
+    Hold-out metrics stored alongside each registered run.
+    """
+    _, rmse, mae, r2, _ = _calculate_metrics(y_true, y_pred)
+    return {"rmse": float(rmse), "mae": float(mae), "r2": float(r2)}
+
+
+def _poly_params(model) -> dict:
+    """
+    Degree and ridge penalty of a polynomial trend pipeline.
+    """
+    return {
+        "degree": model.named_steps["polynomialfeatures"].degree,
+        "alpha": model.named_steps["ridge"].alpha,
+    }
+
+
+def stages_for(changed_tables) -> set:
+    """
+    Pipeline stages invalidated by changes to ``changed_tables``.
+    """
+    changed = set(changed_tables)
+    return {stage for stage, inputs in STAGE_INPUTS.items() if inputs & changed}
+
+
+def run_temperature(timings: dict, start: int = 2025, end: int = 2050) -> dict:
+    """
+    Train the temperature hybrid model and forecast ``start..end``.
+    """
+    # Ingest historical temperature and CO₂ observations directly from SQLite
+    with _timed(timings, "load"):
+        # Pre-joined per year at ingest, including the ln(CO₂) forcing proxy
+        data = load_climate_features()
+
+    # Reserve earlier years for training and keep recent periods for holdout checks
+    with _timed(timings, "split"):
+        train, val, _ = split_data(data)
+
+    # Fit the long-term polynomial warming trend
+    with _timed(timings, "temperature_poly"):
+        poly = train_poly_model(train, degree=2)
+
+    # Learn residual structure that the polynomial baseline misses
+    with _timed(timings, "temperature_xgb"):
+        xgb = train_xgb_residual(train, poly)
+
+    # Generate anchored projections for the coming decades
+    with _timed(timings, "temperature_predict"):
+        years, _, _, _, anchored = predict_future(poly, xgb, data, start=start, end=end)
+        _, val_hybrid = evaluate_model(poly, xgb, val, "Validation", verbose=False)
+
+    # Attribute history and forecast to trend, CO₂ and forcing terms once per run
+    with _timed(timings, "temperature_explain"):
+        contributions = temperature_contributions(poly, xgb, data, years, anchored)
+
+    return {
+        "data": data,
+        "years": years,
+        "predictions": anchored,
+        "contributions": contributions,
+        "models": {"temperature_poly": poly, "temperature_xgb": xgb},
+        "params": {"temperature_poly": _poly_params(poly), "temperature_xgb": xgb.get_params()},
+        "metrics": {"temperature_val": _metrics(val["observed_c"].astype(float), val_hybrid)},
+    }
+
+
+def reuse_temperature(run_id: str | None = None) -> dict | None:
+    """
+    Temperature forecast of a registered run (the active one by default), or ``None``.
+    """
+    previous = load_run_predictions(TEMPERATURE, run_id)
+    if previous.empty:
+        return None
+    return {
+        "data": load_climate_features(),
+        "years": previous["year"].to_numpy(),
+        "predictions": previous["prediction"].to_numpy(),
+        "contributions": load_run_contributions(TEMPERATURE, run_id),
+        "models": {},
+        "params": {},
+        "metrics": {},
+        "reused": True,
+    }
+
+
+def run_sea_level(future_years, future_temps, timings: dict) -> dict:
+    """
+    Train the sea-level hybrid model and forecast it along ``future_temps``.
+    """
+    with _timed(timings, "sea_level_load"):
+        sea_dataset = load_climate_features(with_sea_level=True)
+    with _timed(timings, "sea_level_split"):
+        sea_train, sea_val, _ = split_data(sea_dataset)
+
+    with _timed(timings, "sea_level_poly"):
+        sea_poly = train_sea_poly_model(sea_train)
+    with _timed(timings, "sea_level_xgb"):
+        sea_xgb = train_sea_xgb_residual(sea_train, sea_poly)
+
+    with _timed(timings, "sea_level_predict"):
+        years, _, _, anchored = predict_sea_future(
+            sea_poly, sea_xgb, sea_dataset, future_years, future_temps
+        )
+        sea_val_hybrid = sea_poly.predict(sea_val[["year"]]) + sea_xgb.predict(
+            sea_level_features(sea_val)
+        )
+
+    with _timed(timings, "sea_level_explain"):
+        contributions = sea_level_contributions(
+            sea_poly, sea_xgb, sea_dataset, years, future_temps, anchored
+        )
+
+    return {
+        "data": sea_dataset,
+        "years": years,
+        "predictions": anchored,
+        "contributions": contributions,
+        "models": {"sea_level_poly": sea_poly, "sea_level_xgb": sea_xgb},
+        "params": {"sea_level_poly": _poly_params(sea_poly), "sea_level_xgb": sea_xgb.get_params()},
+        "metrics": {"sea_level_val": _metrics(sea_val["gmsl"].astype(float), sea_val_hybrid)},
+    }
+
+
+def publish(temperature: dict, sea_level: dict, timings: dict) -> str:
+    """
+    Write the latest-run tables and register (and activate) a new run.
+
+    These are separate transactions. Each latest-run table is replaced in its
+    own, and the registry flips the active pointer in the one that stores the
+    run, so the API (which serves the active run) never sees a half-published
+    forecast. A failure part way can leave the latest-run tables, which only
+    back databases without a registered run, ahead of the registry.
+    """
+    run_id = new_run_id()
+    with _timed(timings, "persist"):
+        if not temperature.get("reused"):
+            save_predictions(temperature["years"], temperature["predictions"], table_name="future_predictions")
+        save_predictions(sea_level["years"], sea_level["predictions"], table_name="sea_level_predictions")
+        artifact_dir = save_artifacts(run_id, {**temperature["models"], **sea_level["models"]})
+    params = {**temperature["params"], **sea_level["params"]}
+    if temperature.get("reused"):
+        params["reused_stages"] = [TEMPERATURE]
+    return register_run(
+        run_id,
+        hash_datasets(temperature["data"], sea_level["data"]),
+        predictions={
+            TEMPERATURE: (temperature["years"], temperature["predictions"]),
+            SEA_LEVEL: (sea_level["years"], sea_level["predictions"]),
+        },
+        params=params,
+        metrics={**temperature["metrics"], **sea_level["metrics"]},
+        artifact_path=artifact_dir,
+        timings=timings,
+        contributions={
+            series: stage["contributions"]
+            for series, stage in ((TEMPERATURE, temperature), (SEA_LEVEL, sea_level))
+            if stage.get("contributions") is not None
+        },
+    )
+
+
+def run_stages(stages, timings: dict | None = None) -> dict:
+    """
+    Rerun ``stages`` and publish a new run; returns what was computed.
+
+    A sea-level-only rerun reuses the active run's temperature forecast, and
+    falls back to retraining temperature when no run has been registered yet.
+    """
+    timings = {} if timings is None else timings
+    stages = set(stages)
+    temperature = None
+    if TEMPERATURE not in stages:
+        temperature = reuse_temperature()
+    if temperature is None:
+        temperature = run_temperature(timings)
+        stages.add(TEMPERATURE)
+    sea_level = run_sea_level(temperature["years"], temperature["predictions"], timings)
+    stages.add(SEA_LEVEL)
+
+    run_id = publish(temperature, sea_level, timings)
+    return {"run_id": run_id, "stages": stages, "temperature": temperature, "sea_level": sea_level}
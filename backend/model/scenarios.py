@@ -0,0 +1,149 @@
+"""
+Precomputed scenario grid for the hybrid temperature and sea-level forecasts.
+
+``predict_future`` fixes two assumptions: CO₂ keeps growing at its fitted
+recent rate, and anthropogenic forcing ramps up by +0.5 over the horizon.
+This job evaluates both forecasts over a dense grid of those two parameters
+(annual CO₂ growth in percent and the forcing ramp), pushing every scenario
+of a chunk through each residual model as one batched prediction. The grid
+is stored per run in the ``scenario_grid`` table; ``/api/scenario`` answers
+arbitrary parameter pairs by multilinear interpolation between grid points
+without touching the models.
+"""
+
+import sqlite3
+import time
+
+import numpy as np
+
+from backend.model.monte_carlo import (
+    _sea_level_paths,
+    _temperature_paths,
+    sea_level_base,
+    temperature_base,
+)
+from backend.utils.data_loader import get_db_path, load_climate_features, save_scenario_grid
+from backend.utils.registry import get_active_run_id, load_artifacts
+
+# 0–3 %/yr of CO₂ growth (the fitted recent rate is ~0.5 %/yr) by a forcing
+# ramp of -0.5 (decline) to +2.0 over the horizon, in steps of 0.1
+DEFAULT_CO2_GROWTH_PCT = np.round(np.linspace(0.0, 3.0, 31), 2)
+DEFAULT_FORCING_RAMPS = np.round(np.linspace(-0.5, 2.0, 26), 2)
+
+
+def scenario_grid(
+    poly_model,
+    xgb_model,
+    df,
+    start: int,
+    end: int,
+    sea_poly_model=None,
+    sea_xgb_model=None,
+    sea_df=None,
+    co2_growth_pct=DEFAULT_CO2_GROWTH_PCT,
+    forcing_ramps=DEFAULT_FORCING_RAMPS,
+    chunk_size: int = 5000,
+):
+    """
+    Anchored forecasts for every ``(co2_growth_pct, forcing_ramp)`` pair.
+
+    Returns ``(years, grids, stats)`` where ``grids`` maps ``"temperature"``
+    (and ``"sea_level"`` when its models and dataset are given) to arrays of
+    shape ``(growth, ramp, year)``. The scenario at the fitted growth rate and
+    a +0.5 ramp reproduces ``predict_future`` and ``predict_sea_future``.
+    """
+    started = time.perf_counter()
+    years = np.arange(start, end + 1)
+    growth = np.asarray(co2_growth_pct, dtype=float)
+    ramps = np.asarray(forcing_ramps, dtype=float)
+    if np.any(np.diff(growth) <= 0) or np.any(np.diff(ramps) <= 0):
+        raise ValueError("Scenario axes must be strictly increasing")
+
+    # Scenarios in (growth, ramp) C order, so results reshape straight into the grid
+    g, r = np.meshgrid(growth, ramps, indexing="ij")
+    slopes, ramp_values = np.log1p(g.ravel() / 100.0), r.ravel()
+    n_scenarios = len(slopes)
+
+    temp_base = temperature_base(poly_model, xgb_model, df, years)
+    temperature = np.empty((n_scenarios, len(years)), dtype=temp_base.dtype)
+    with_sea = sea_poly_model is not None and sea_xgb_model is not None and sea_df is not None
+    if with_sea:
+        sea_base = sea_level_base(sea_poly_model, sea_xgb_model, sea_df, years)
+        sea_level = np.empty_like(temperature)
+
+    for lo in range(0, n_scenarios, chunk_size):
+        hi = min(lo + chunk_size, n_scenarios)
+        temps = temp_base + _temperature_paths(xgb_model, df, years, slopes[lo:hi], ramp_values[lo:hi])
+        temperature[lo:hi] = temps
+        if with_sea:
+            sea_level[lo:hi] = sea_base + _sea_level_paths(sea_xgb_model, years, temps)
+
+    shape = (len(growth), len(ramps), len(years))
+    grids = {"temperature": temperature.reshape(shape)}
+    if with_sea:
+        grids["sea_level"] = sea_level.reshape(shape)
+
+    elapsed = time.perf_counter() - started
+    stats = {
+        "scenarios": n_scenarios,
+        "rows": n_scenarios * len(years),
+        "seconds": elapsed,
+        "scenarios_per_second": n_scenarios / elapsed if elapsed > 0 else float("inf"),
+    }
+    return years, grids, stats
+
+
+def build_scenario_grid(
+    run_id: str | None = None,
+    models: dict | None = None,
+    start: int = 2025,
+    end: int = 2050,
+    co2_growth_pct=DEFAULT_CO2_GROWTH_PCT,
+    forcing_ramps=DEFAULT_FORCING_RAMPS,
+) -> dict:
+    """
+    Compute and store the scenario grid of a registered run (the active one by default).
+
+    ``models`` may supply the run's fitted models directly (as ``main.py``
+    does right after training); otherwise they are loaded from the run's
+    saved artifacts. Returns the grid statistics plus the stored row count.
+    """
+    if run_id is None:
+        with sqlite3.connect(get_db_path()) as conn:
+            run_id = get_active_run_id(conn)
+        if run_id is None:
+            raise ValueError("No registered run to build a scenario grid for")
+
+    models = models if models is not None else load_artifacts(run_id)
+    missing = {"temperature_poly", "temperature_xgb"} - set(models)
+    if missing:
+        raise ValueError(f"Run {run_id} has no saved {', '.join(sorted(missing))} model")
+
+    years, grids, stats = scenario_grid(
+        models["temperature_poly"],
+        models["temperature_xgb"],
+        load_climate_features(),
+        start,
+        end,
+        models.get("sea_level_poly"),
+        models.get("sea_level_xgb"),
+        load_climate_features(with_sea_level=True),
+        co2_growth_pct=co2_growth_pct,
+        forcing_ramps=forcing_ramps,
+    )
+    stats["stored"] = save_scenario_grid(run_id, co2_growth_pct, forcing_ramps, years, grids)
+    stats["run_id"] = run_id
+    return stats
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Precompute the scenario forecast grid of a run")
+    parser.add_argument("--run", default=None, help="registered run id (default: the active run)")
+    args = parser.parse_args()
+
+    stats = build_scenario_grid(args.run)
+    print(f"Stored {stats['stored']} grid rows for run {stats['run_id']} "
+          f"({stats['scenarios']} scenarios in {stats['seconds']:.2f}s, "
+          f"{stats['scenarios_per_second']:.0f} scenarios/s)")
@@ -10,7 +10,8 @@ from sklearn.pipeline import make_pipeline
 from sklearn.preprocessing import PolynomialFeatures
 from xgboost import XGBRegressor
 
-_REF_YEAR = 2000  # Maintain feature centering parity with temperature model
+from backend.model.features import SEA_LEVEL_FEATURES, sea_level_features
+from backend.utils.resources import xgb_threads
 
 
 def train_sea_poly_model(train_df: pd.DataFrame, degree: int = 2, alpha: float = 0.1):
@@ -34,26 +35,26 @@ def train_sea_poly_model(train_df: pd.DataFrame, degree: int = 2, alpha: float =
 def _make_features(df: pd.DataFrame) -> pd.DataFrame:
     """
     Assemble engineered residual features using year and temperature context.
-    """
-    out = pd.DataFrame(index=df.index)
-    yr = df["year"].astype(float)
-    temp = df["observed_c"].astype(float)
 
-    out["year_c"] = yr - _REF_YEAR
-    out["year_c2"] = out["year_c"] ** 2
-    out["temp"] = temp
-    out["temp2"] = temp**2
-    return out
+    Labelled view of the shared feature store; training and prediction use
+    ``sea_level_features`` arrays directly.
+    """
+    return pd.DataFrame(sea_level_features(df), columns=list(SEA_LEVEL_FEATURES), index=df.index)
 
 
-def train_sea_xgb_residual(train_df: pd.DataFrame, poly_model):
+def train_sea_xgb_residual(
+    train_df: pd.DataFrame, poly_model, features: np.ndarray | None = None
+):
     """
     Residual learner that leverages temperature features to refine predictions.
+
+    ``features`` optionally supplies a precomputed ``sea_level_features``
+    matrix aligned with ``train_df``.
     """
     baseline = poly_model.predict(train_df[["year"]])
     residuals = train_df["gmsl"].values - baseline
 
-    X = _make_features(train_df)
+    X = sea_level_features(train_df) if features is None else features
     # Slightly shallower trees avoid overfitting to short temperature swings
     model = XGBRegressor(
         n_estimators=1500,
@@ -63,6 +64,7 @@ def train_sea_xgb_residual(train_df: pd.DataFrame, poly_model):
         colsample_bytree=0.9,
         reg_lambda=1.0,
         tree_method="hist",
+        n_jobs=xgb_threads(),  # Share of the process CPU budget
         random_state=42,
     )
     model.fit(X, residuals, verbose=False)
@@ -79,30 +81,24 @@ def predict_sea_future(
     """
     Generate anchored sea-level forecasts using projected temperatures.
     """
+    hist_X = sea_level_features(historical_df)
+    dtype = hist_X.dtype  # float32 when the data was loaded in compact mode
+
     years = np.array(future_years)
     years_df = pd.DataFrame({"year": years})
-    poly_pred = poly_model.predict(years_df)
+    poly_pred = poly_model.predict(years_df).astype(dtype, copy=False)
 
-    future_df = pd.DataFrame(
-        {
-            "year": years,
-            "observed_c": future_temps,
-        }
+    resid_pred = xgb_model.predict(
+        sea_level_features({"year": years, "observed_c": np.asarray(future_temps, dtype=dtype)})
     )
-
-    resid_pred = xgb_model.predict(_make_features(future_df))
     hybrid = poly_pred + resid_pred
 
-    last_obs = historical_df.iloc[-1]["gmsl"]
-    last_year = historical_df.iloc[-1]["year"]
-    last_temp = historical_df.iloc[-1]["observed_c"]
+    last_obs = historical_df["gmsl"].iloc[-1]
+    last_year = historical_df["year"].iloc[-1]
 
-    last_poly = poly_model.predict(pd.DataFrame({"year": [last_year]}))[0]
-    last_resid = xgb_model.predict(
-        _make_features(pd.DataFrame({"year": [last_year], "observed_c": [last_temp]}))
-    )[0]
+    last_poly = poly_model.predict(pd.DataFrame({"year": [last_year]})).astype(dtype, copy=False)[0]
+    last_resid = xgb_model.predict(hist_X[-1:])[0]
     offset = last_obs - (last_poly + last_resid)
     anchored = hybrid + offset
 
     return years, poly_pred, hybrid, anchored
-
@@ -11,7 +11,8 @@ from sklearn.pipeline import make_pipeline
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 from xgboost import XGBRegressor
 
-_REF_YEAR = 2000  # Reference year for centering features
+from backend.model.features import TEMPERATURE_FEATURES, temperature_features
+from backend.utils.resources import xgb_threads
 
 def train_poly_model(train_data: pd.DataFrame, degree: int = 2, alpha: float = 0.1):
     """
@@ -49,29 +50,26 @@ def poly_equation(model) -> str:
 def _make_features(df: pd.DataFrame) -> pd.DataFrame:
     """
     Generate consistent engineered features for the XGBoost model.
-    """
-    out = pd.DataFrame(index=df.index)
-    yr = df["year"].astype(float)
 
-    out["year_c"] = yr - _REF_YEAR
-    out["year_c2"] = out["year_c"] ** 2
-    out["anthro_c"] = df["anthropogenic_c"].astype(float)
-    out["anthro_f"] = df["anthropogenic_f"].astype(float)
-    out["co2_ppm"] = df["co2_ppm"].astype(float)
-    out["ln_co2_ratio"] = df["ln_co2_ratio"].astype(float)
-    return out
+    Labelled view of the shared feature store; the training and prediction
+    paths consume ``temperature_features`` arrays directly.
+    """
+    return pd.DataFrame(temperature_features(df), columns=list(TEMPERATURE_FEATURES), index=df.index)
 
 
-def train_xgb_residual(train_df: pd.DataFrame, poly_model):
+def train_xgb_residual(train_df: pd.DataFrame, poly_model, features: np.ndarray | None = None):
     """
     Train an XGBoost regressor on the residuals of the polynomial trend model.
+
+    ``features`` may carry a precomputed ``temperature_features`` matrix aligned
+    with ``train_df`` so callers fitting many windows only engineer features once.
     """
     # Residuals = observed temperature - polynomial trend
     y_poly = poly_model.predict(train_df[["year"]])
     residuals = train_df["observed_c"].values - y_poly
 
     # Prepare engineered features
-    X = _make_features(train_df)
+    X = temperature_features(train_df) if features is None else features
 
     model = XGBRegressor(
         n_estimators=2000,
@@ -81,6 +79,7 @@ def train_xgb_residual(train_df: pd.DataFrame, poly_model):
         colsample_bytree=0.8,
         reg_lambda=1.0,
         tree_method="hist",
+        n_jobs=xgb_threads(),  # Share of the process CPU budget
         random_state=42
     )
 
@@ -108,7 +107,7 @@ def evaluate_model(poly_model, xgb_model, df: pd.DataFrame, label: str, verbose:
     trend_pred = poly_model.predict(X_poly)
 
     # Feed engineered features to the residual model and combine the signals
-    X_res = _make_features(df)
+    X_res = temperature_features(df)
     resid_pred = xgb_model.predict(X_res)
     hybrid = trend_pred + resid_pred
 
@@ -132,45 +131,58 @@ def evaluate_model(poly_model, xgb_model, df: pd.DataFrame, label: str, verbose:
 
     return trend_pred, hybrid
 
-def predict_future(poly_model, xgb_model, df: pd.DataFrame, start: int, end: int):
+def future_inputs(df: pd.DataFrame, years, dtype=np.float64) -> dict:
     """
-    Predict future global temperature anomalies (hybrid model).
+    Extrapolated CO₂ and anthropogenic forcing columns for ``years`` (the residual model's future inputs).
     """
-    years = np.arange(start, end + 1)
-    years_df = pd.DataFrame({"year": years})
-    poly_pred = poly_model.predict(years_df)
+    years = np.asarray(years)
 
     # Estimate future CO₂ trend using exponential fit to recent history
     co2_hist = df[["year", "co2_ppm"]].dropna()
     recent = co2_hist[co2_hist["year"] >= 2010]
     slope = np.polyfit(recent["year"], np.log(recent["co2_ppm"]), 1)[0]
     co2_future = co2_hist["co2_ppm"].iloc[-1] * np.exp(slope * (years - co2_hist["year"].iloc[-1]))
+    co2_future = co2_future.astype(dtype, copy=False)
     ln_co2_ratio = np.log(co2_future / 278.0)
 
     # Extrapolate anthropogenic components with a gentle upward ramp
-    future_df = pd.DataFrame({
+    return {
         "year": years,
         "anthropogenic_c": np.linspace(df["anthropogenic_c"].iloc[-15:].mean(),
-                                       df["anthropogenic_c"].iloc[-1] + 0.5, len(years)),
+                                       df["anthropogenic_c"].iloc[-1] + 0.5, len(years), dtype=dtype),
         "anthropogenic_f": np.linspace(df["anthropogenic_f"].iloc[-15:].mean(),
-                                       df["anthropogenic_f"].iloc[-1] + 0.5, len(years)),
+                                       df["anthropogenic_f"].iloc[-1] + 0.5, len(years), dtype=dtype),
         "co2_ppm": co2_future,
         "ln_co2_ratio": ln_co2_ratio
-    })
+    }
+
+def predict_future(poly_model, xgb_model, df: pd.DataFrame, start: int, end: int):
+    """
+    Predict future global temperature anomalies (hybrid model).
+    """
+    hist_X = temperature_features(df)
+    dtype = hist_X.dtype  # float32 when the data was loaded in compact mode
+
+    years = np.arange(start, end + 1)
+    years_df = pd.DataFrame({"year": years})
+    poly_pred = poly_model.predict(years_df).astype(dtype, copy=False)
+
+    future = future_inputs(df, years, dtype)
+    co2_future = future["co2_ppm"]
 
     # Predict residuals and combine with polynomial baseline
-    X = _make_features(future_df)
+    X = temperature_features(future)
     resid_pred = xgb_model.predict(X)
     hybrid = poly_pred + resid_pred
 
-    # Anchor to last observed data point
-    last_obs = df.iloc[-1]["observed_c"]
-    last_year_df = pd.DataFrame({"year": [df.iloc[-1]["year"]]})
+    # Anchor to last observed data point (history features are cached per dataset)
+    last_obs = df["observed_c"].iloc[-1]
+    last_year_df = pd.DataFrame({"year": [df["year"].iloc[-1]]})
     last_model = (
-        poly_model.predict(last_year_df) +
-        xgb_model.predict(_make_features(df.iloc[[-1]]))
+        poly_model.predict(last_year_df).astype(dtype, copy=False) +
+        xgb_model.predict(hist_X[-1:])
     )[0]
     offset = last_obs - last_model
     anchored = hybrid + offset
 
-    return years, co2_future, poly_pred, hybrid, anchored
\ No newline at end of file
+    return years, co2_future, poly_pred, hybrid, anchored
@@ -0,0 +1,209 @@
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+"""
+Production launcher for the dashboard API with pre-fork worker processes.
+
+Everything the workers only read is loaded once in the master before it
+forks: the series endpoints' JSON responses (precomputed with their ETags)
+and the active run's scenario grid. The heap is then frozen (``gc.freeze``)
+so the workers' garbage collectors never write to those pages, and the
+workers share them copy-on-write instead of each holding a copy. After the
+fork every worker opens its own SQLite connections, HTTP session and
+live-update poller, none of which may be shared across processes.
+
+Gunicorn is used when it is installed, with ``gthread`` workers; otherwise a
+built-in pre-fork server runs Werkzeug in each worker on one shared listening
+socket. Platforms without ``fork`` fall back to a single threaded process.
+
+Every open /api/events stream holds one gunicorn thread for as long as the
+dashboard stays open, so a worker serves at most ``--threads`` streams and
+ordinary requests at once. Size ``--workers x --threads`` above the number of
+dashboards expected to be open. The built-in server starts a thread per
+connection and has no such cap.
+
+Usage:
+    python backend/serve.py [--workers 4] [--threads 8] [--host 127.0.0.1] [--port 5000]
+    python backend/serve.py --server builtin --db /path/to/climate.db
+"""
+
+from pathlib import Path
+import argparse
+import gc
+import logging
+import signal
+import socket
+import time
+
+import backend.app as web
+from backend.utils.data_loader import set_db_path
+from backend.utils.resources import available_cores
+
+logger = logging.getLogger(__name__)
+
+# A worker that exits sooner than this after being spawned counts as a failed start;
+# replacements back off exponentially, and the server stops after too many in a row
+WORKER_MIN_UPTIME = 5.0
+WORKER_BACKOFF = 0.5
+WORKER_MAX_QUICK_EXITS = 5
+
+
+def preload(app) -> dict:
+    """
+    Load the shared read-only state into the master process; returns what was loaded.
+    """
+    return {
+        "responses": web.precompute_responses(app),
+        "scenario_grid": web.load_scenario_grid() is not None,
+    }
+
+
+def freeze_heap() -> None:
+    """
+    Move every live object to the permanent generation so worker GCs leave shared pages untouched.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork() -> None:
+    """
+    Worker initialization: per-process connections, session and poller.
+    """
+    web.init_worker()
+
+
+def serve_gunicorn(app, host: str, port: int, workers: int, threads: int) -> None:
+    """
+    Run under gunicorn's pre-fork master with the already-loaded app.
+    """
+    from gunicorn.app.base import BaseApplication
+
+    class Launcher(BaseApplication):
+        def load_config(self):
+            self.cfg.set("bind", f"{host}:{port}")
+            self.cfg.set("workers", workers)
+            self.cfg.set("worker_class", "gthread")
+            self.cfg.set("threads", threads)
+            self.cfg.set("preload_app", True)
+            self.cfg.set("post_fork", lambda server, worker: post_fork())
+
+        def load(self):
+            return app
+
+    Launcher().run()
+
+
+def serve_prefork(app, host: str, port: int, workers: int) -> int:
+    """
+    Minimal pre-fork server: one listening socket, ``workers`` forked Werkzeug servers, respawned on exit.
+
+    Returns the exit status: 0 after a SIGTERM/SIGINT shutdown, 1 when workers
+    kept failing right after start (e.g. the database cannot be opened).
+    """
+    from werkzeug.serving import make_server
+
+    listener = socket.create_server((host, port), backlog=128)
+    children = {}  # pid -> monotonic spawn time
+    stopping = False
+
+    def spawn():
+        pid = os.fork()
+        if pid:
+            children[pid] = time.monotonic()
+            return
+        # Worker: default signal handling, own resources, serve until told to stop
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        status = 1
+        try:
+            post_fork()
+            make_server(host, port, app, threaded=True, fd=listener.fileno()).serve_forever()
+            status = 0
+        except Exception:
+            logger.exception("Worker failed")
+        finally:
+            os._exit(status)
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    for _ in range(workers):
+        spawn()
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    logger.info("Serving on http://%s:%s with %d workers", host, port, workers)
+
+    quick_exits, exit_status = 0, 0
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        started = children.pop(pid, None)
+        if stopping:
+            continue
+        code = os.waitstatus_to_exitcode(status)
+        quick_exits = quick_exits + 1 if started and time.monotonic() - started < WORKER_MIN_UPTIME else 0
+        if quick_exits >= WORKER_MAX_QUICK_EXITS:
+            logger.error("Workers keep exiting right after start (last status %s); shutting down", code)
+            exit_status = 1
+            stop(None, None)
+            continue
+        logger.warning("Worker %s exited with status %s; starting a replacement", pid, code)
+        if quick_exits:
+            time.sleep(WORKER_BACKOFF * 2 ** (quick_exits - 1))
+        if not stopping:
+            spawn()
+    listener.close()
+    return exit_status
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serve the dashboard API with pre-forked workers")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=available_cores())
+    parser.add_argument("--threads", type=int, default=8, help="threads per worker (gunicorn); each open /api/events stream holds one")
+    parser.add_argument("--server", choices=["auto", "gunicorn", "builtin"], default="auto")
+    parser.add_argument("--db", type=Path, default=None, help="database to serve (default backend/data/climate.db)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(process)d %(message)s")
+    if args.db is not None:
+        web.DB_PATH = args.db.resolve()
+        set_db_path(web.DB_PATH)
+
+    app = web.create_app()
+    loaded = preload(app)
+    logger.info("Preloaded %d responses%s", len(loaded["responses"]),
+                " and the scenario grid" if loaded["scenario_grid"] else "")
+
+    server = args.server
+    if server == "auto":
+        try:
+            import gunicorn  # noqa: F401
+            server = "gunicorn"
+        except ImportError:
+            server = "builtin"
+
+    if not hasattr(os, "fork"):
+        logger.warning("fork() is unavailable on this platform; serving from a single threaded process")
+        app.run(host=args.host, port=args.port, threaded=True)
+        return
+
+    freeze_heap()
+    if server == "gunicorn":
+        serve_gunicorn(app, args.host, args.port, args.workers, args.threads)
+    else:
+        sys.exit(serve_prefork(app, args.host, args.port, args.workers))
+
+
+if __name__ == "__main__":
+    main()
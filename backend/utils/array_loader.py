@@ -0,0 +1,90 @@
+"""
+Pandas-free loaders that read SQLite tables straight into NumPy arrays.
+
+For services that only need arrays (API handlers, inference), this skips the
+pandas import and the DataFrame round trip: rows stream from a sqlite3
+cursor into one preallocated structured array via ``np.fromiter``, already
+ordered by year. Semantics match ``load_main``/``load_co2``/``load_sea_level``
+(NULL readings become NaN, floats follow compact mode).
+
+``data_loader.set_db_path`` and ``set_compact_mode`` forward their settings
+here, so both loader paths always read the same database the same way.
+"""
+
+from pathlib import Path
+import sqlite3
+
+import numpy as np
+
+_DB_PATH = Path(__file__).resolve().parents[1] / "data" / "climate.db"
+_FLOAT_DTYPE = np.float64
+
+
+def set_db_path(path: str | Path) -> None:
+    """
+    Point the array loaders at another database.
+    """
+    global _DB_PATH
+    _DB_PATH = Path(path)
+
+
+def set_float_dtype(dtype) -> None:
+    """
+    Dtype used for REAL columns (float64, or float32 in compact mode).
+    """
+    global _FLOAT_DTYPE
+    _FLOAT_DTYPE = np.dtype(dtype).type
+
+
+def _column_dtypes(conn: sqlite3.Connection, table: str, columns: list[str] | None) -> np.dtype:
+    """
+    Structured dtype for ``columns`` of ``table``: INTEGER columns as int64, the rest as floats.
+    """
+    declared = {row[1]: (row[2] or "").upper() for row in conn.execute(f"PRAGMA table_info({table})")}
+    if not declared:
+        raise sqlite3.OperationalError(f"no such table: {table}")
+    names = columns or list(declared)
+    missing = [name for name in names if name not in declared]
+    if missing:
+        raise sqlite3.OperationalError(f"no such column: {missing[0]}")
+    return np.dtype(
+        [(name, np.int64 if "INT" in declared[name] else _FLOAT_DTYPE) for name in names]
+    )
+
+
+def read_table(table: str, columns: list[str] | None = None) -> np.ndarray:
+    """
+    Structured array of ``table`` (or ``columns``), one record per row ordered by year.
+
+    The row count is queried first so ``np.fromiter`` fills a single
+    preallocated buffer; both statements run in one read transaction, so a
+    concurrent write cannot change the row count between them. NULLs in
+    float fields are stored as NaN.
+    """
+    with sqlite3.connect(_DB_PATH) as conn:
+        dtype = _column_dtypes(conn, table, columns)
+        conn.execute("BEGIN")
+        count = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        query = f"SELECT {', '.join(dtype.names)} FROM {table} ORDER BY year"
+        return np.fromiter(conn.execute(query), dtype=dtype, count=count)
+
+
+def load_main_arrays() -> np.ndarray:
+    """
+    Temperature and anthropogenic forcing measurements as a structured array.
+    """
+    return read_table("temperature")
+
+
+def load_co2_arrays() -> np.ndarray:
+    """
+    ``year`` and ``co2_ppm`` as a structured array.
+    """
+    return read_table("co2_concentration", columns=["year", "co2_ppm"])
+
+
+def load_sea_level_arrays() -> np.ndarray:
+    """
+    ``year`` and ``gmsl`` as a structured array.
+    """
+    return read_table("sea_level", columns=["year", "gmsl"])
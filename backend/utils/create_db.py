@@ -3,62 +3,384 @@ Utility script to build the SQLite database used by the Climate Dashboard.
 
 Reads the legacy CSV sources and persists them as normalized tables so the
 runtime code can query SQLite instead of parsing CSVs on every execution.
+
+Builds are incremental: each CSV is checksummed and skipped when unchanged;
+changed files are streamed in chunks into a connection-private staging table
+before the write lock is taken, and only the years whose values differ are
+then upserted, so a refresh holds the lock for time proportional to the
+delta rather than the CSV parse. All writes happen in one transaction, so
+readers see either the previous or the new data.
+
+The joined ``climate_features`` table (temperature, CO₂, ln CO₂ ratio and
+sea level per year) is re-materialized in that same transaction whenever a
+source changed, so loaders can read model inputs with one keyed query.
 """
 
 from pathlib import Path
+from datetime import datetime, timezone
+import hashlib
 import sqlite3
+import sys
 
+import numpy as np
 import pandas as pd
 
+if __package__ in (None, ""):
+    # Run as ``python backend/utils/create_db.py``: make ``backend`` importable
+    sys.path.append(str(Path(__file__).resolve().parents[2]))
+
+from backend.utils.data_loader import _has_year_primary_key
+from backend.utils.versions import record_version
+
+CHECKSUM_TABLE = "ingest_checksums"
+FEATURES_TABLE = "climate_features"
+
+# table -> (csv file, {csv column: table column})
+SOURCES = {
+    "temperature": (
+        "temp.csv",
+        {
+            "year": "year",
+            "anthropogenic_c": "anthropogenic_c",
+            "observed_c": "observed_c",
+            "anthropogenic_f": "anthropogenic_f",
+        },
+    ),
+    "co2_concentration": (
+        "co2_concentration.csv",
+        {"year": "year", "ppm": "co2_ppm"},
+    ),
+    "sea_level": (
+        "ClimateChangeTracker.org_Data_Download_Chart_4_8.csv",
+        {"year": "year", "gmsl": "gmsl"},
+    ),
+}
+
+# Secondary indexes older builds created on the year key; year is the rowid
+# (INTEGER PRIMARY KEY), so they only cost writes and are dropped on ingest
+_REDUNDANT_INDEXES = {
+    "temperature": "idx_temperature_year",
+    "co2_concentration": "idx_co2_year",
+    "sea_level": "idx_sea_level_year",
+}
 
-def build_database(db_path: Path | None = None) -> Path:
+# Bulk-load settings: WAL keeps readers unblocked, NORMAL sync is safe under
+# WAL, and a larger page cache keeps the staging and upsert in memory
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def file_checksum(path: Path, block_size: int = 1 << 20) -> str:
     """
-    Create or refresh the SQLite database from the CSV files.
+    BLAKE2b digest of a file, read in blocks so large sources are never fully loaded.
     """
-    repo_root = Path(__file__).resolve().parents[1]
-    data_dir = repo_root / "data"
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
 
-    if db_path is None:
-        db_path = data_dir / "climate.db"
 
-    temp_path = data_dir / "temp.csv"
-    co2_path = data_dir / "co2_concentration.csv"
-    sea_path = data_dir / "ClimateChangeTracker.org_Data_Download_Chart_4_8.csv"
+def _stored_checksum(conn: sqlite3.Connection, table: str) -> str | None:
+    """
+    Checksum recorded for the source of ``table`` at its last ingest.
+    """
+    row = conn.execute(
+        f"SELECT checksum FROM {CHECKSUM_TABLE} WHERE table_name = ?", (table,)
+    ).fetchone()
+    return row[0] if row else None
 
-    db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = sqlite3.connect(db_path)
-    try:
-        temp_df = pd.read_csv(temp_path, comment="#")[
-            ["year", "anthropogenic_c", "observed_c", "anthropogenic_f"]
-        ]
-        temp_df.to_sql("temperature", conn, if_exists="replace", index=False)
-
-        co2_df = (
-            pd.read_csv(co2_path, comment="#")[["year", "ppm"]]
-            .rename(columns={"ppm": "co2_ppm"})
-        )
-        co2_df.to_sql("co2_concentration", conn, if_exists="replace", index=False)
+def _stage_csv(conn, csv_path: Path, columns: dict, staging: str, chunksize: int) -> int:
+    """
+    Stream ``csv_path`` into a temp staging table chunk by chunk; returns rows read.
+    """
+    names = list(columns.values())
+    value_cols = ", ".join(f"{name} REAL" for name in names[1:])
+    conn.execute(f"DROP TABLE IF EXISTS temp.{staging}")
+    conn.execute(f"CREATE TEMP TABLE {staging} (year INTEGER PRIMARY KEY, {value_cols})")
+
+    insert = (
+        f"INSERT OR REPLACE INTO temp.{staging} ({', '.join(names)}) "
+        f"VALUES ({', '.join('?' * len(names))})"
+    )
+    rows_read = 0
+    reader = pd.read_csv(csv_path, comment="#", usecols=list(columns), chunksize=chunksize)
+    for chunk in reader:
+        chunk = chunk[list(columns)].dropna(subset=["year"])
+        chunk["year"] = chunk["year"].astype(int)
+        # Missing readings become NULL, matching what to_sql used to write
+        chunk = chunk.astype(object).where(chunk.notna(), None)
+        conn.executemany(insert, chunk.itertuples(index=False, name=None))
+        rows_read += len(chunk)
+    return rows_read
+
+
+def _apply_staged(conn, table: str, columns: dict, staging: str) -> dict:
+    """
+    Upsert changed years from the staging table and delete years no longer present.
+    """
+    names = list(columns.values())
+    values = names[1:]
+
+    migrated = False
+    if not _has_year_primary_key(conn, table):
+        # Missing or legacy (unkeyed) table: recreate it with the year key
+        conn.execute(f"DROP TABLE IF EXISTS main.{table}")
+        value_cols = ", ".join(f"{name} REAL" for name in values)
+        conn.execute(f"CREATE TABLE main.{table} (year INTEGER PRIMARY KEY, {value_cols})")
+        migrated = True
+    conn.execute(f"DROP INDEX IF EXISTS main.{_REDUNDANT_INDEXES[table]}")
+
+    before = conn.total_changes
+    conn.execute(
+        f"""
+        INSERT INTO main.{table} ({', '.join(names)})
+        SELECT {', '.join(names)} FROM temp.{staging} WHERE true
+        ON CONFLICT(year) DO UPDATE SET
+            {', '.join(f'{name} = excluded.{name}' for name in values)}
+        WHERE ({', '.join(values)}) IS NOT ({', '.join(f'excluded.{name}' for name in values)})
+        """
+    )
+    upserted = conn.total_changes - before
+
+    before = conn.total_changes
+    conn.execute(
+        f"DELETE FROM main.{table} WHERE year NOT IN (SELECT year FROM temp.{staging})"
+    )
+    deleted = conn.total_changes - before
+    conn.execute(f"DROP TABLE temp.{staging}")
+    return {"upserted": upserted, "deleted": deleted, "migrated": migrated}
 
-        sea_df = pd.read_csv(sea_path, comment="#")[["year", "gmsl"]]
-        sea_df.to_sql("sea_level", conn, if_exists="replace", index=False)
 
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_temperature_year ON temperature(year)"
+def _ln(value):
+    """
+    Natural log for SQL; matches ``np.log`` bit for bit so features are identical.
+    """
+    if value is None or value <= 0:
+        return None
+    return float(np.log(value))
+
+
+def refresh_features(conn: sqlite3.Connection) -> int:
+    """
+    Rebuild ``climate_features`` from the source tables; returns the row count.
+
+    Mirrors ``merge_datasets`` (temperature left join CO₂) plus a left join of
+    sea level. ``has_sea_level`` marks the years with a sea-level row, even one
+    without a ``gmsl`` reading, so selecting on it reproduces the inner join
+    of ``merge_with_sea_level``.
+    """
+    conn.create_function("ln", 1, _ln, deterministic=True)
+    # Recreated rather than emptied, so tables built before has_sea_level pick it up
+    conn.execute(f"DROP TABLE IF EXISTS {FEATURES_TABLE}")
+    conn.execute(
+        f"""
+        CREATE TABLE {FEATURES_TABLE} (
+            year INTEGER PRIMARY KEY,
+            anthropogenic_c REAL,
+            observed_c REAL,
+            anthropogenic_f REAL,
+            co2_ppm REAL,
+            ln_co2_ratio REAL,
+            gmsl REAL,
+            has_sea_level INTEGER NOT NULL
         )
-        conn.execute(
-            "CREATE INDEX IF NOT EXISTS idx_co2_year ON co2_concentration(year)"
+        """
+    )
+    conn.execute(
+        f"""
+        INSERT INTO {FEATURES_TABLE}
+        SELECT t.year, t.anthropogenic_c, t.observed_c, t.anthropogenic_f,
+               c.co2_ppm, ln(c.co2_ppm / 278.0), s.gmsl, s.year IS NOT NULL
+        FROM temperature t
+        LEFT JOIN co2_concentration c ON c.year = t.year
+        LEFT JOIN sea_level s ON s.year = t.year
+        """
+    )
+    return conn.execute(f"SELECT COUNT(*) FROM {FEATURES_TABLE}").fetchone()[0]
+
+
+def open_ingest_connection(db_path: Path) -> sqlite3.Connection:
+    """
+    Autocommit connection with the bulk-load PRAGMAs and the checksum table in place.
+    """
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {CHECKSUM_TABLE} (
+            table_name TEXT PRIMARY KEY,
+            source TEXT NOT NULL,
+            checksum TEXT NOT NULL,
+            rows INTEGER,
+            ingested_at TEXT NOT NULL
         )
-        # Indices keep join/pivot queries fast when sampling long histories
-        conn.execute("CREATE INDEX IF NOT EXISTS idx_sea_level_year ON sea_level(year)")
+        """
+    )
+    return conn
+
+
+def source_is_current(conn: sqlite3.Connection, table: str, checksum: str) -> bool:
+    """
+    True when ``table`` was last ingested from content with ``checksum`` and is keyed by year.
+    """
+    return _stored_checksum(conn, table) == checksum and _has_year_primary_key(conn, table)
+
+
+def stage_file(conn: sqlite3.Connection, table: str, csv_path: Path, chunksize: int = 50_000) -> int:
+    """
+    Parse ``csv_path`` into ``table``'s temp staging table; returns rows read.
+
+    Temp tables live in the connection's private database, so call this
+    before taking the write lock: readers and other writers are not held up
+    while the CSV is parsed.
+    """
+    _, columns = SOURCES[table]
+    return _stage_csv(conn, csv_path, columns, f"{table}__staging", chunksize)
+
+
+def discard_staged(conn: sqlite3.Connection, table: str) -> None:
+    """
+    Drop ``table``'s staged rows without applying them.
+    """
+    conn.execute(f"DROP TABLE IF EXISTS temp.{table}__staging")
+
+
+def apply_staged_file(conn: sqlite3.Connection, table: str, checksum: str, rows_read: int) -> dict:
+    """
+    Upsert the changed years staged by ``stage_file`` and record the source checksum.
+
+    Must run inside the caller's write transaction.
+    """
+    filename, columns = SOURCES[table]
+    stats = {"skipped": False, "rows_read": rows_read}
+    stats.update(_apply_staged(conn, table, columns, f"{table}__staging"))
+
+    conn.execute(
+        f"""
+        INSERT INTO {CHECKSUM_TABLE} (table_name, source, checksum, rows, ingested_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(table_name) DO UPDATE SET
+            source = excluded.source, checksum = excluded.checksum,
+            rows = excluded.rows, ingested_at = excluded.ingested_at
+        """,
+        (table, filename, checksum, rows_read, datetime.now(timezone.utc).isoformat()),
+    )
+    if stats["upserted"] or stats["deleted"] or stats["migrated"]:
+        record_version(conn, table)
+    return stats
+
+
+def refresh_features_if_changed(conn: sqlite3.Connection, stats: dict) -> int | None:
+    """
+    Re-materialize ``climate_features`` when any ingest in ``stats`` changed rows (or it is missing).
+
+    Skipped (``None``) until every source table exists, e.g. after a partial refresh.
+    """
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    if not set(SOURCES) <= existing:
+        return None
+    features_missing = FEATURES_TABLE not in existing
+    changed = any(
+        s.get("upserted") or s.get("deleted") or s.get("migrated") for s in stats.values()
+    )
+    if not (changed or features_missing):
+        return None
+    rows = refresh_features(conn)
+    record_version(conn, FEATURES_TABLE)
+    return rows
+
+
+def ingest_sources(
+    db_path: Path,
+    data_dir: Path,
+    chunksize: int = 50_000,
+    force: bool = False,
+) -> dict:
+    """
+    Incrementally load every CSV in ``SOURCES`` into ``db_path``.
+
+    Unchanged files (same checksum as the last ingest) are skipped unless
+    ``force`` is set. Returns per-table stats: ``skipped``, ``rows_read``,
+    ``upserted``, ``deleted`` and ``migrated``, plus the row count of the
+    refreshed ``climate_features`` table (``None`` when it was up to date).
+    """
+    conn = open_ingest_connection(db_path)
+    try:
+        # Hash outside the write lock; only changed sources are streamed
+        checksums = {
+            table: file_checksum(data_dir / filename)
+            for table, (filename, _) in SOURCES.items()
+        }
+        # Parse the changed sources into temp tables, also before the lock
+        staged = {
+            table: stage_file(conn, table, data_dir / filename, chunksize)
+            for table, (filename, _) in SOURCES.items()
+            if force or not source_is_current(conn, table, checksums[table])
+        }
+
+        stats = {}
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for table in SOURCES:
+                # Re-checked under the lock: another writer may have ingested the same content
+                if table not in staged or (not force and source_is_current(conn, table, checksums[table])):
+                    discard_staged(conn, table)
+                    stats[table] = {"skipped": True, "rows_read": 0, "upserted": 0, "deleted": 0, "migrated": False}
+                    continue
+                stats[table] = apply_staged_file(conn, table, checksums[table], staged[table])
+
+            stats[FEATURES_TABLE] = refresh_features_if_changed(conn, stats)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
     finally:
-        conn.commit()
         conn.close()
 
+    return stats
+
+
+def build_database(
+    db_path: Path | None = None,
+    data_dir: Path | None = None,
+    force: bool = False,
+) -> Path:
+    """
+    Create or refresh the SQLite database from the CSV files.
+    """
+    repo_root = Path(__file__).resolve().parents[1]
+    if data_dir is None:
+        data_dir = repo_root / "data"
+
+    if db_path is None:
+        db_path = data_dir / "climate.db"
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    ingest_sources(db_path, data_dir, force=force)
     return db_path
 
 
 if __name__ == "__main__":
-    path = build_database()
-    print(f"SQLite climate database written to {path}")
-
+    repo_root = Path(__file__).resolve().parents[1]
+    stats = ingest_sources(repo_root / "data" / "climate.db", repo_root / "data", force="--force" in sys.argv)
+    features = stats.pop(FEATURES_TABLE)
+    for table, table_stats in stats.items():
+        if table_stats["skipped"]:
+            print(f"{table}: unchanged")
+        else:
+            print(
+                f"{table}: {table_stats['rows_read']} rows read, "
+                f"{table_stats['upserted']} upserted, {table_stats['deleted']} deleted"
+            )
+    if features is not None:
+        print(f"{FEATURES_TABLE}: refreshed ({features} rows)")
+    print(f"SQLite climate database written to {repo_root / 'data' / 'climate.db'}")
@@ -1,15 +1,36 @@
 """
 Utility helpers for ingesting historical data from the SQLite datastore and
 preparing merged climate datasets.
+
+Loaded frames are memoized per process. Each cache entry is tagged with the
+database's version (``PRAGMA data_version`` from a long-lived watcher
+connection plus the inode, mtime and size of the file and its WAL), so any
+commit from any connection or process invalidates it on the next call.
+Cached frames are backed by read-only arrays: in-place edits raise, and
+callers that need to modify values take a ``.copy()``.
 """
 
+from collections import OrderedDict
 from pathlib import Path
+import os
 import sqlite3
+import threading
 
 import pandas as pd
 import numpy as np
 
+from backend.utils import array_loader
+from backend.utils.versions import record_version
+
 _DB_PATH = Path(__file__).resolve().parents[1] / "data" / "climate.db"
+_FLOAT_DTYPE = np.float64
+
+_CACHE_ENABLED = True
+_CACHE_MAX_ENTRIES = 32
+_CACHE = OrderedDict()  # key -> (version token, frozen frame)
+_CACHE_STATS = {"hits": 0, "misses": 0}
+_CACHE_LOCK = threading.Lock()
+_WATCHER = None  # (db path, pid, connection) used to poll data_version
 
 
 def set_db_path(path: str | Path) -> None:
@@ -18,16 +39,147 @@ def set_db_path(path: str | Path) -> None:
     """
     global _DB_PATH
     _DB_PATH = Path(path)
+    array_loader.set_db_path(_DB_PATH)
+
+
+def get_db_path() -> Path:
+    """
+    Current database location (honours ``set_db_path`` overrides).
+    """
+    return _DB_PATH
+
+
+def set_compact_mode(enabled: bool = True) -> None:
+    """
+    Opt in to float32 measurement columns for large batched workloads.
+
+    Feature matrices and forecasts follow the dtype of the loaded data, so the
+    whole pipeline stays in float32 once the loaders return it.
+    """
+    global _FLOAT_DTYPE
+    _FLOAT_DTYPE = np.float32 if enabled else np.float64
+    array_loader.set_float_dtype(_FLOAT_DTYPE)
+
+
+def set_cache_enabled(enabled: bool = True) -> None:
+    """
+    Turn the in-process dataset cache on or off (disabling also empties it).
+    """
+    global _CACHE_ENABLED
+    _CACHE_ENABLED = enabled
+    if not enabled:
+        clear_cache()
+
+
+def clear_cache() -> None:
+    """
+    Drop every cached frame and reset the hit/miss counters.
+    """
+    with _CACHE_LOCK:
+        _CACHE.clear()
+        _CACHE_STATS.update(hits=0, misses=0)
+
+
+def cache_info() -> dict:
+    """
+    Hit/miss counters and the number of cached frames.
+    """
+    with _CACHE_LOCK:
+        return {**_CACHE_STATS, "entries": len(_CACHE)}
+
+
+def _db_version(path: Path):
+    """
+    Token that changes whenever the database at ``path`` is committed to or replaced.
+
+    Returns ``None`` when the file does not exist (nothing is cached then).
+    """
+    global _WATCHER
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    try:
+        wal = os.stat(f"{path}-wal")
+        wal_token = (wal.st_mtime_ns, wal.st_size)
+    except FileNotFoundError:
+        wal_token = None
+
+    pid = os.getpid()
+    if _WATCHER is None or _WATCHER[0] != path or _WATCHER[1] != pid:
+        if _WATCHER is not None and _WATCHER[1] == pid:
+            _WATCHER[2].close()
+        # Connections must not cross a fork, so each process opens its own
+        _WATCHER = (path, pid, sqlite3.connect(path, check_same_thread=False))
+    data_version = _WATCHER[2].execute("PRAGMA data_version").fetchone()[0]
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size, wal_token, data_version)
 
 
-def _read_table(table: str, columns: list[str] | None = None) -> pd.DataFrame:
+def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Rebuild ``df`` on read-only column arrays so cached data cannot be edited in place.
+    """
+    columns = {}
+    for name in df.columns:
+        values = df[name].to_numpy(copy=True)
+        values.flags.writeable = False
+        columns[name] = values
+    return pd.DataFrame(columns, copy=False)
+
+
+def _cached(key: tuple, load) -> pd.DataFrame:
+    """
+    Return the cached result of ``load()`` for ``key`` while the database is unchanged.
+
+    Keys are qualified with the database path and the active float dtype.
+    Each call returns a shallow copy, so adding columns does not leak into
+    the cache while the read-only values are still shared.
+    """
+    if not _CACHE_ENABLED:
+        return load()
+
+    key = (str(_DB_PATH), np.dtype(_FLOAT_DTYPE).name) + key
+    with _CACHE_LOCK:
+        version = _db_version(_DB_PATH)
+        entry = _CACHE.get(key)
+        if version is not None and entry is not None and entry[0] == version:
+            _CACHE.move_to_end(key)
+            _CACHE_STATS["hits"] += 1
+            return entry[1].copy(deep=False)
+        _CACHE_STATS["misses"] += 1
+
+    # Version is read before loading, so a concurrent commit only causes a reload
+    frame = _freeze(load())
+    if version is not None:
+        with _CACHE_LOCK:
+            _CACHE[key] = (version, frame)
+            _CACHE.move_to_end(key)
+            while len(_CACHE) > _CACHE_MAX_ENTRIES:
+                _CACHE.popitem(last=False)
+    return frame.copy(deep=False)
+
+
+def _read_table(table: str, columns: list[str] | None = None, where: str | None = None) -> pd.DataFrame:
     """
     Pull a table (or subset of columns) from SQLite into a pandas DataFrame.
     """
     projection = ", ".join(columns) if columns else "*"
     query = f"SELECT {projection} FROM {table}"
+    if where:
+        query += f" WHERE {where}"
+    return _cached(("query", query), lambda: _query_frame(query))
+
+
+def _query_frame(query: str, params=()) -> pd.DataFrame:
+    """
+    Run ``query`` and apply the load-boundary dtype narrowing and year ordering.
+    """
     with sqlite3.connect(_DB_PATH) as conn:
-        df = pd.read_sql_query(query, conn)
+        df = pd.read_sql_query(query, conn, params=params)
+    if _FLOAT_DTYPE is not np.float64:
+        # SQLite REALs arrive as doubles; narrow once at the load boundary
+        floats = df.select_dtypes(include="float64").columns
+        df = df.astype(dict.fromkeys(floats, _FLOAT_DTYPE))
     return df.sort_values("year").reset_index(drop=True)
 
 
@@ -52,6 +204,42 @@ def load_sea_level() -> pd.DataFrame:
     return _read_table("sea_level", columns=["year", "gmsl"])
 
 
+def load_gridded(
+    dataset: str,
+    variable: str,
+    regions=None,
+    start: int | None = None,
+    end: int | None = None,
+) -> np.ndarray:
+    """
+    Slice a regional/gridded dataset stored next to the database.
+
+    Reads ``<db dir>/gridded/<dataset>`` through memory maps instead of SQLite;
+    see ``GriddedStore.load`` for which selections are zero-copy.
+    """
+    from backend.utils.gridded_store import GriddedStore
+
+    store = GriddedStore(_DB_PATH.parent / "gridded" / dataset)
+    return store.load(variable, regions=regions, start=start, end=end)
+
+
+def load_snapshot(table: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Load a table from the columnar snapshot exported next to the database.
+
+    Columns are memory-mapped read-only, so the cost does not depend on row
+    count. The snapshot is as fresh as its last ``export_snapshot`` run;
+    compact mode narrows float columns, which copies them.
+    """
+    from backend.utils.snapshot import read_snapshot, snapshot_root
+
+    df = read_snapshot(snapshot_root(_DB_PATH), table, columns)
+    if _FLOAT_DTYPE is not np.float64:
+        floats = df.select_dtypes(include="float64").columns
+        df = df.astype(dict.fromkeys(floats, _FLOAT_DTYPE))
+    return df
+
+
 def merge_datasets(main_df: pd.DataFrame, co2_df: pd.DataFrame) -> pd.DataFrame:
     """
     Join the temperature and CO₂ tables while computing logarithmic forcing proxies.
@@ -69,34 +257,276 @@ def merge_with_sea_level(temp_df: pd.DataFrame, sea_df: pd.DataFrame) -> pd.Data
     return temp_df.merge(sea_df, on="year", how="inner")
 
 
+_FEATURE_COLUMNS = ["year", "anthropogenic_c", "observed_c", "anthropogenic_f", "co2_ppm", "ln_co2_ratio"]
+
+# Inclusive (first, last) years of each evaluation window; None is open-ended
+SPLIT_WINDOWS = {"train": (None, 2005), "val": (2006, 2015), "test": (2016, None)}
+
+
+def _year_window(column: str, start: int | None, end: int | None) -> tuple[list[str], list[int]]:
+    """
+    SQL conditions and parameters restricting ``column`` to ``start..end``.
+    """
+    conditions, params = [], []
+    if start is not None:
+        conditions.append(f"{column} >= ?")
+        params.append(int(start))
+    if end is not None:
+        conditions.append(f"{column} <= ?")
+        params.append(int(end))
+    return conditions, params
+
+
+def load_climate_features(
+    with_sea_level: bool = False, start: int | None = None, end: int | None = None
+) -> pd.DataFrame:
+    """
+    Model-ready dataset from the materialized ``climate_features`` table.
+
+    Equivalent to ``merge_datasets(load_main(), load_co2())`` or, with
+    ``with_sea_level``, to merging that with ``load_sea_level()``, but read in
+    one keyed query. ``start``/``end`` restrict the inclusive year range in
+    SQL (a range scan on the year key), so only those rows are materialized.
+    Databases built before the table (or its ``has_sea_level`` flag) existed
+    run the joins in SQL instead.
+    """
+    return _cached(
+        ("climate_features", with_sea_level, start, end),
+        lambda: _load_climate_features(with_sea_level, start, end),
+    )
+
+
+def _load_climate_features(with_sea_level: bool, start: int | None, end: int | None) -> pd.DataFrame:
+    """
+    Uncached body of ``load_climate_features``.
+    """
+    with sqlite3.connect(_DB_PATH) as conn:
+        # Tables built before has_sea_level cannot tell a missing reading from a missing row
+        materialized = any(
+            col[1] == "has_sea_level" for col in conn.execute("PRAGMA main.table_info(climate_features)")
+        )
+
+    columns = _FEATURE_COLUMNS + (["gmsl"] if with_sea_level else [])
+    if materialized:
+        conditions, params = _year_window("year", start, end)
+        if with_sea_level:
+            conditions.append("has_sea_level")
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return _query_frame(f"SELECT {', '.join(columns)} FROM climate_features{where}", params)
+
+    # Same joins as merge_datasets / merge_with_sea_level, keyed on each table's year rowid
+    conditions, params = _year_window("t.year", start, end)
+    where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    sea_join = " JOIN sea_level s ON s.year = t.year" if with_sea_level else ""
+    df = _query_frame(
+        "SELECT t.year, t.anthropogenic_c, t.observed_c, t.anthropogenic_f, c.co2_ppm"
+        + (", s.gmsl" if with_sea_level else "")
+        + " FROM temperature t LEFT JOIN co2_concentration c ON c.year = t.year"
+        + sea_join
+        + where,
+        params,
+    )
+    df["ln_co2_ratio"] = np.log(df["co2_ppm"] / 278.0)
+    return df[columns]
+
+
+def load_split(with_sea_level: bool = False):
+    """
+    Train/validation/test frames loaded window by window from SQLite.
+
+    Query-level counterpart of ``split_data(load_climate_features(...))``:
+    each window is its own range query, so only the rows a stage needs are
+    read, and no full frame is filtered and copied three times.
+    """
+    return tuple(
+        load_climate_features(with_sea_level, start, end) for start, end in SPLIT_WINDOWS.values()
+    )
+
+
 def split_data(df: pd.DataFrame):
     """
     Slice the merged dataset into train/validation/test windows for evaluation.
     """
-    train = df[df["year"] <= 2005].copy()
-    val = df[(df["year"] >= 2006) & (df["year"] <= 2015)].copy()
-    test = df[df["year"] >= 2016].copy()
-    return train, val, test
+    windows = []
+    for start, end in SPLIT_WINDOWS.values():
+        mask = np.ones(len(df), dtype=bool)
+        if start is not None:
+            mask &= df["year"].to_numpy() >= start
+        if end is not None:
+            mask &= df["year"].to_numpy() <= end
+        windows.append(df[mask].copy())
+    return tuple(windows)
+
+
+def _has_year_primary_key(conn: sqlite3.Connection, table: str) -> bool:
+    """
+    Whether ``table`` exists with ``year`` as its INTEGER PRIMARY KEY.
+    """
+    info = conn.execute(f"PRAGMA main.table_info({table})").fetchall()
+    return any(col[1] == "year" and col[5] == 1 for col in info)
 
 
 def save_predictions(years, anchored_pred, table_name: str = "future_predictions"):
     """
     Persist future forecast results so downstream services can query them.
+
+    Rows are staged in a connection-private temp table first, then upserted
+    (and stale years removed) in one short IMMEDIATE transaction under WAL, so
+    API readers keep seeing the previous forecast until the commit and never an
+    empty or half-written table. The ``year`` PRIMARY KEY is preserved; legacy
+    tables created without it are rebuilt once via an atomic shadow-table swap.
+    """
+    rows = [(int(year), float(pred)) for year, pred in zip(years, anchored_pred)]
+    staging = f"{table_name}__staging"
+
+    conn = sqlite3.connect(_DB_PATH, timeout=30, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")  # Readers never block on the writer
+
+        # Stage outside the write lock: temp tables live in a private database
+        conn.execute(f"DROP TABLE IF EXISTS temp.{staging}")
+        conn.execute(f"CREATE TEMP TABLE {staging} (year INTEGER PRIMARY KEY, prediction REAL)")
+        conn.executemany(f"INSERT INTO temp.{staging} (year, prediction) VALUES (?, ?)", rows)
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if _has_year_primary_key(conn, table_name):
+                conn.execute(
+                    f"""
+                    INSERT INTO main.{table_name} (year, prediction)
+                    SELECT year, prediction FROM temp.{staging} WHERE true
+                    ON CONFLICT(year) DO UPDATE SET prediction = excluded.prediction
+                    WHERE prediction IS NOT excluded.prediction
+                    """
+                )
+                conn.execute(
+                    f"DELETE FROM main.{table_name} "
+                    f"WHERE year NOT IN (SELECT year FROM temp.{staging})"
+                )
+            else:
+                # Missing or legacy schema: build the keyed table and swap it in
+                conn.execute(f"DROP TABLE IF EXISTS main.{staging}")
+                conn.execute(
+                    f"CREATE TABLE main.{staging} (year INTEGER PRIMARY KEY, prediction REAL)"
+                )
+                conn.execute(f"INSERT INTO main.{staging} SELECT year, prediction FROM temp.{staging}")
+                conn.execute(f"DROP TABLE IF EXISTS main.{table_name}")
+                conn.execute(f"ALTER TABLE main.{staging} RENAME TO {table_name}")
+            record_version(conn, table_name)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+
+
+def save_series_predictions(predictions: pd.DataFrame, table_name: str = "series_predictions"):
     """
-    df = pd.DataFrame(
-        {
-            "year": years,
-            "prediction": anchored_pred,
-        }
+    Upsert long-format ``series_id, year, prediction`` rows in one transaction.
+
+    Used by the fan-out trainer to write each finished chunk of series with a
+    single ``executemany``; rows for other series are left untouched.
+    """
+    rows = list(
+        zip(
+            predictions["series_id"].astype(str),
+            predictions["year"].astype(int).tolist(),
+            predictions["prediction"].astype(float).tolist(),
+        )
     )
 
-    with sqlite3.connect(_DB_PATH) as conn:
+    conn = sqlite3.connect(_DB_PATH, timeout=30, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.execute(
             f"""
             CREATE TABLE IF NOT EXISTS {table_name} (
-                year INTEGER PRIMARY KEY,
-                prediction REAL
+                series_id TEXT NOT NULL,
+                year INTEGER NOT NULL,
+                prediction REAL,
+                PRIMARY KEY (series_id, year)
             )
             """
         )
-        df.to_sql(table_name, conn, if_exists="replace", index=False)
\ No newline at end of file
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                f"""
+                INSERT INTO {table_name} (series_id, year, prediction) VALUES (?, ?, ?)
+                ON CONFLICT(series_id, year) DO UPDATE SET prediction = excluded.prediction
+                """,
+                rows,
+            )
+            record_version(conn, table_name)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+
+
+def save_backtest_results(
+    results: pd.DataFrame,
+    metrics: pd.DataFrame,
+    results_table: str = "backtest_results",
+    metrics_table: str = "backtest_metrics",
+):
+    """
+    Persist walk-forward backtest folds and per-horizon metrics for the admin panel.
+    """
+    with sqlite3.connect(_DB_PATH) as conn:
+        results.to_sql(results_table, conn, if_exists="replace", index=False)
+        metrics.to_sql(metrics_table, conn, if_exists="replace", index=False)
+
+
+def save_scenario_grid(run_id: str, co2_growth_pct, forcing_ramps, years, series: dict,
+                       table_name: str = "scenario_grid"):
+    """
+    Replace ``run_id``'s scenario grid with ``series`` arrays of shape ``(growth, ramp, year)``.
+
+    One row per grid point, clustered on ``(run_id, co2_growth_pct,
+    forcing_ramp, year)`` so a run's grid is read back in axis order with a
+    single range scan.
+    """
+    names = sorted(series)
+    growth, ramp, year = np.meshgrid(
+        np.asarray(co2_growth_pct, dtype=float), np.asarray(forcing_ramps, dtype=float),
+        np.asarray(years, dtype=int), indexing="ij",
+    )
+    columns = [growth.ravel().tolist(), ramp.ravel().tolist(), year.ravel().tolist()]
+    columns += [np.asarray(series[name], dtype=float).ravel().tolist() for name in names]
+    rows = [(run_id, *values) for values in zip(*columns)]
+
+    conn = sqlite3.connect(_DB_PATH, timeout=30, isolation_level=None)
+    try:
+        conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table_name} (
+                run_id TEXT NOT NULL,
+                co2_growth_pct REAL NOT NULL,
+                forcing_ramp REAL NOT NULL,
+                year INTEGER NOT NULL,
+                temperature REAL,
+                sea_level REAL,
+                PRIMARY KEY (run_id, co2_growth_pct, forcing_ramp, year)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(f"DELETE FROM {table_name} WHERE run_id = ?", (run_id,))
+            conn.executemany(
+                f"INSERT INTO {table_name} (run_id, co2_growth_pct, forcing_ramp, year, {', '.join(names)}) "
+                f"VALUES (?, ?, ?, ?{', ?' * len(names)})",
+                rows,
+            )
+            record_version(conn, table_name, run_id)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+    return len(rows)
@@ -0,0 +1,139 @@
+"""
+On-disk storage for regional and gridded climate series.
+
+A dataset is a directory holding one ``.npy`` file per variable, each a
+``(regions, years)`` array in C order, plus ``regions.npy`` and a small JSON
+manifest. Files are opened with ``np.load(mmap_mode=...)`` so only the pages
+a query touches are read: a contiguous block of regions over a year range
+is returned as a view into the mapped file without copying.
+"""
+
+from pathlib import Path
+import json
+
+import numpy as np
+
+MANIFEST = "manifest.json"
+_REGIONS_FILE = "regions.npy"
+
+
+class GriddedStore:
+    """
+    Memory-mapped ``(region, year)`` arrays for one dataset directory.
+    """
+
+    def __init__(self, root: str | Path):
+        self.root = Path(root)
+        manifest = json.loads((self.root / MANIFEST).read_text())
+        self.year_start = manifest["year_start"]
+        self.n_years = manifest["n_years"]
+        self.variables = manifest["variables"]
+        # Region ids are stored sorted so lookups are a binary search
+        self.regions = np.load(self.root / _REGIONS_FILE, mmap_mode="r")
+        self._arrays = {}
+
+    @classmethod
+    def create(cls, root: str | Path, regions, years, variables) -> "GriddedStore":
+        """
+        Lay out an empty (NaN-filled) dataset.
+
+        ``years`` must be consecutive; ``variables`` maps a name to a floating
+        dtype (float32 keeps gridded archives half the size of float64).
+        """
+        root = Path(root)
+        root.mkdir(parents=True, exist_ok=True)
+        regions = np.unique(np.asarray(regions))
+        years = np.asarray(years)
+        if len(years) == 0 or np.any(np.diff(years) != 1):
+            raise ValueError("years must be a non-empty consecutive range")
+
+        np.save(root / _REGIONS_FILE, regions)
+        for name, dtype in variables.items():
+            arr = np.lib.format.open_memmap(
+                root / f"{name}.npy", mode="w+", dtype=dtype, shape=(len(regions), len(years))
+            )
+            arr[:] = np.nan
+            arr.flush()
+            del arr
+
+        manifest = {
+            "year_start": int(years[0]),
+            "n_years": int(len(years)),
+            "n_regions": int(len(regions)),
+            "variables": {name: np.dtype(dtype).name for name, dtype in variables.items()},
+        }
+        (root / MANIFEST).write_text(json.dumps(manifest, indent=2))
+        return cls(root)
+
+    @property
+    def years(self) -> np.ndarray:
+        """
+        Consecutive years covered by every variable.
+        """
+        return np.arange(self.year_start, self.year_start + self.n_years)
+
+    def _array(self, variable: str, writable: bool = False) -> np.ndarray:
+        """
+        Memory-mapped array for ``variable`` (read-only unless ``writable``).
+        """
+        if variable not in self.variables:
+            raise KeyError(f"Unknown variable: {variable}")
+        if writable:
+            return np.load(self.root / f"{variable}.npy", mmap_mode="r+")
+        if variable not in self._arrays:
+            self._arrays[variable] = np.load(self.root / f"{variable}.npy", mmap_mode="r")
+        return self._arrays[variable]
+
+    def region_rows(self, regions) -> np.ndarray:
+        """
+        Row positions of ``regions``; raises ``KeyError`` for unknown ids.
+        """
+        regions = np.asarray(regions)
+        rows = np.searchsorted(self.regions, regions)
+        rows_clipped = np.minimum(rows, len(self.regions) - 1)
+        missing = self.regions[rows_clipped] != regions
+        if np.any(missing):
+            raise KeyError(f"Unknown regions: {regions[missing][:5].tolist()}")
+        return rows
+
+    def _year_slice(self, start: int | None, end: int | None) -> slice:
+        """
+        Column slice for an inclusive year range, clipped to the stored years.
+        """
+        first = 0 if start is None else max(0, start - self.year_start)
+        last = self.n_years if end is None else min(self.n_years, end - self.year_start + 1)
+        return slice(first, max(first, last))
+
+    def load(self, variable: str, regions=None, start: int | None = None, end: int | None = None) -> np.ndarray:
+        """
+        Values for ``regions`` over ``start..end`` (inclusive years).
+
+        ``regions`` may be ``None`` (all), a ``(first, last)`` tuple of region
+        ids selecting a contiguous block, or a list of ids. All-region and
+        block selections are zero-copy views of the mapped file; an arbitrary
+        list needs a gather and therefore returns a copy of just those rows.
+        """
+        arr = self._array(variable)
+        years = self._year_slice(start, end)
+        if regions is None:
+            return arr[:, years]
+        if isinstance(regions, tuple):
+            lo, hi = self.region_rows(list(regions))
+            return arr[lo : hi + 1, years]
+        return arr[self.region_rows(regions), years]
+
+    def write(self, variable: str, regions, years, values) -> None:
+        """
+        Scatter long-format rows (one value per region/year) into the store.
+
+        Intended to be called once per chunk when ingesting large sources.
+        """
+        years = np.asarray(years)
+        cols = years - self.year_start
+        if np.any((cols < 0) | (cols >= self.n_years)):
+            raise ValueError("years fall outside the dataset range")
+
+        arr = self._array(variable, writable=True)
+        arr[self.region_rows(regions), cols] = values
+        arr.flush()
+        self._arrays.pop(variable, None)  # Reopen read-only maps on next load
@@ -0,0 +1,173 @@
+"""
+Per-stage profiler for the forecast pipeline.
+
+When a profiler is installed with ``set_profiler`` every pipeline stage
+(``pipeline._timed``) is measured for wall time, CPU time (all threads, so
+XGBoost's native threads count), the process RSS at its end and how much
+RSS grew over it. ``tracemalloc`` hooks every allocation and slows the
+stages down, so peak Python/NumPy allocations are only traced in a
+separate, opt-in pass (``trace_memory``); those stages are flagged
+``memory_traced`` so their inflated timings are not compared with clean
+ones. Stages can optionally be dumped as cProfile ``.prof`` files for
+``snakeviz``/``pstats``. Profiles are stored per run in
+``pipeline_profiles`` so stage costs can be tracked across runs.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+import cProfile
+import os
+import sqlite3
+import time
+import tracemalloc
+
+from backend.utils.data_loader import get_db_path
+
+PROFILE_TABLE = "pipeline_profiles"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {PROFILE_TABLE} (
+    run_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    wall_s REAL,
+    cpu_s REAL,
+    py_peak_mb REAL,
+    memory_traced INTEGER NOT NULL DEFAULT 0,
+    rss_mb REAL,
+    rss_delta_mb REAL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (run_id, seq)
+)
+"""
+
+_PROFILER = None
+
+
+def set_profiler(profiler: "PipelineProfiler | None") -> None:
+    """
+    Install (or with ``None`` remove) the profiler that pipeline stages report to.
+    """
+    global _PROFILER
+    _PROFILER = profiler
+
+
+def get_profiler() -> "PipelineProfiler | None":
+    """
+    The installed profiler, if any.
+    """
+    return _PROFILER
+
+
+def _rss_mb() -> float | None:
+    """
+    Current resident set size (Linux ``/proc``; ``None`` elsewhere).
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+class PipelineProfiler:
+    """
+    Collects one record per pipeline stage, in the order the stages ran.
+    """
+
+    def __init__(self, profile_dir: str | Path | None = None, trace_memory: bool = False):
+        self.profile_dir = Path(profile_dir) if profile_dir is not None else None
+        self.trace_memory = trace_memory
+        self.stages = []
+        self._active = False  # Stages do not nest; an inner stage is folded into the outer one
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Measure the enclosed block as stage ``name``.
+        """
+        if self._active:
+            yield
+            return
+        self._active = True
+
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        elif self.trace_memory:
+            tracemalloc.reset_peak()
+        profile = cProfile.Profile() if self.profile_dir is not None else None
+
+        rss = _rss_mb()
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profile is not None:
+            profile.enable()
+        try:
+            yield
+        finally:
+            if profile is not None:
+                profile.disable()
+            wall_s, cpu_s = time.perf_counter() - wall, time.process_time() - cpu
+            rss_end = _rss_mb()
+            record = {
+                "stage": name,
+                "wall_s": wall_s,
+                "cpu_s": cpu_s,
+                "py_peak_mb": tracemalloc.get_traced_memory()[1] / 2**20 if self.trace_memory else None,
+                "memory_traced": self.trace_memory,
+                "rss_mb": rss_end,
+                "rss_delta_mb": rss_end - rss if rss is not None and rss_end is not None else None,
+            }
+            if started_tracing:
+                tracemalloc.stop()
+            if profile is not None:
+                self.profile_dir.mkdir(parents=True, exist_ok=True)
+                path = self.profile_dir / f"{len(self.stages):02d}_{name}.prof"
+                profile.dump_stats(path)
+                record["profile_path"] = str(path)
+            self.stages.append(record)
+            self._active = False
+
+    def summary(self) -> str:
+        """
+        Fixed-width table of the recorded stages for the console.
+        """
+        def fmt(value, spec):
+            return format(value, spec) if value is not None else "-".rjust(int(spec.split(".")[0]))
+
+        lines = [f"{'stage':<22}{'wall s':>9}{'cpu s':>9}{'py peak MB':>12}{'rss MB':>9}{'rss +MB':>9}"]
+        for s in self.stages:
+            lines.append(
+                f"{s['stage']:<22}{s['wall_s']:9.3f}{s['cpu_s']:9.3f}"
+                f"{fmt(s['py_peak_mb'], '12.1f')}{fmt(s['rss_mb'], '9.1f')}{fmt(s['rss_delta_mb'], '+9.1f')}"
+            )
+        if self.trace_memory:
+            lines.append("(memory traced: times include tracemalloc overhead)")
+        return "\n".join(lines)
+
+
+def save_profile(run_id: str, profiler: PipelineProfiler) -> int:
+    """
+    Store ``profiler``'s stages under ``run_id``; returns the number of stages written.
+    """
+    created_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    rows = [
+        (
+            run_id, seq, s["stage"], s["wall_s"], s["cpu_s"], s["py_peak_mb"], int(s["memory_traced"]),
+            s["rss_mb"], s["rss_delta_mb"], created_at,
+        )
+        for seq, s in enumerate(profiler.stages)
+    ]
+    with sqlite3.connect(get_db_path()) as conn:
+        conn.execute(_SCHEMA)
+        conn.executemany(
+            f"""
+            INSERT OR REPLACE INTO {PROFILE_TABLE}
+                (run_id, seq, stage, wall_s, cpu_s, py_peak_mb, memory_traced, rss_mb, rss_delta_mb, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+    return len(rows)
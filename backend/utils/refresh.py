@@ -0,0 +1,237 @@
+"""
+Incremental refresh of the source CSVs from the upstream data API.
+
+Each configured series is fetched concurrently with a conditional GET
+(``If-None-Match`` / ``If-Modified-Since`` from the previous response), so
+unchanged sources cost one 304 round trip. Changed bodies are streamed to a
+temporary file while being checksummed, then fed through the incremental
+ingest in ``create_db`` (chunked parse, upsert of changed years only) in a
+single transaction. After the commit the local CSV is replaced, so a later
+``build_database`` sees the same content and skips it.
+
+Source URLs are configured through environment variables, one per table
+(see ``URL_ENV``); tables without a URL are left alone.
+
+Usage:
+    CLIMATE_TEMPERATURE_URL=... CLIMATE_CO2_URL=... python -m backend.utils.refresh
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+import hashlib
+import os
+import threading
+
+import requests
+
+from backend.utils.create_db import (
+    FEATURES_TABLE,
+    SOURCES,
+    apply_staged_file,
+    discard_staged,
+    open_ingest_connection,
+    refresh_features_if_changed,
+    source_is_current,
+    stage_file,
+)
+
+URL_ENV = {
+    "temperature": "CLIMATE_TEMPERATURE_URL",
+    "co2_concentration": "CLIMATE_CO2_URL",
+    "sea_level": "CLIMATE_SEA_LEVEL_URL",
+}
+STATE_TABLE = "refresh_state"
+_DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+
+
+def configured_urls() -> dict:
+    """
+    ``{table: url}`` for every source whose environment variable is set.
+    """
+    return {table: os.environ[env] for table, env in URL_ENV.items() if os.environ.get(env)}
+
+
+def _load_state(conn) -> dict:
+    """
+    Validators (ETag, Last-Modified) remembered from each source's last 200 response.
+    """
+    conn.execute(
+        f"""
+        CREATE TABLE IF NOT EXISTS {STATE_TABLE} (
+            table_name TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            checked_at TEXT NOT NULL
+        )
+        """
+    )
+    rows = conn.execute(f"SELECT table_name, url, etag, last_modified FROM {STATE_TABLE}")
+    return {table: {"url": url, "etag": etag, "last_modified": modified} for table, url, etag, modified in rows}
+
+
+def _fetch(table: str, url: str, state: dict | None, data_dir: Path, timeout: float) -> dict:
+    """
+    Conditionally GET one source, streaming a changed body to a temp file.
+    """
+    headers = {}
+    if state and state["url"] == url:
+        # Validators only apply to the URL they were issued for
+        if state["etag"]:
+            headers["If-None-Match"] = state["etag"]
+        if state["last_modified"]:
+            headers["If-Modified-Since"] = state["last_modified"]
+
+    result = {"url": url}
+    with requests.get(url, headers=headers, stream=True, timeout=timeout) as response:
+        if response.status_code == 304:
+            return {**result, "status": "not_modified"}
+        response.raise_for_status()
+
+        filename = SOURCES[table][0]
+        partial = data_dir / f".{filename}.{os.getpid()}-{threading.get_ident()}.part"
+        digest = hashlib.blake2b(digest_size=16)
+        size, complete = 0, False
+        try:
+            with open(partial, "wb") as handle:
+                for block in response.iter_content(chunk_size=1 << 16):
+                    digest.update(block)
+                    handle.write(block)
+                    size += len(block)
+            complete = True
+        finally:
+            if not complete:
+                partial.unlink(missing_ok=True)
+
+        return {
+            **result,
+            "status": "fetched",
+            "path": partial,
+            "checksum": digest.hexdigest(),
+            "bytes": size,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+
+
+def _settle_downloads(results: dict, data_dir: Path, committed: bool) -> None:
+    """
+    Move ingested downloads over the local CSVs and delete the rest.
+    """
+    for table, result in results.items():
+        partial = result.pop("path", None)
+        if partial is None:
+            continue
+        if committed and result["status"] == "updated":
+            os.replace(partial, data_dir / SOURCES[table][0])
+        else:
+            Path(partial).unlink(missing_ok=True)
+
+
+def refresh_sources(
+    db_path: Path | None = None,
+    data_dir: Path | None = None,
+    urls: dict | None = None,
+    timeout: float = 30.0,
+    chunksize: int = 50_000,
+) -> dict:
+    """
+    Fetch every configured source and ingest the ones whose content changed.
+
+    Returns per-table results with ``status`` one of ``not_modified`` (304),
+    ``unchanged`` (200 with the content already ingested), ``updated`` (with
+    the ingest stats) or ``error``; ``climate_features`` holds the refreshed
+    feature row count, or ``None`` when nothing changed.
+    """
+    data_dir = Path(data_dir) if data_dir is not None else _DATA_DIR
+    db_path = Path(db_path) if db_path is not None else data_dir / "climate.db"
+    urls = configured_urls() if urls is None else urls
+    if not urls:
+        raise ValueError(f"No source URLs configured; set any of {', '.join(URL_ENV.values())}")
+    unknown = set(urls) - set(SOURCES)
+    if unknown:
+        raise KeyError(f"Unknown source tables: {sorted(unknown)}")
+
+    results, futures, committed = {}, {}, False
+    conn = open_ingest_connection(db_path)
+    try:
+        state = _load_state(conn)
+
+        # Network I/O overlaps across sources; the database is written once afterwards
+        with ThreadPoolExecutor(max_workers=len(urls)) as pool:
+            futures = {
+                table: pool.submit(_fetch, table, url, state.get(table), data_dir, timeout)
+                for table, url in urls.items()
+            }
+        for table, future in futures.items():
+            try:
+                results[table] = future.result()
+            except (requests.RequestException, OSError) as exc:
+                results[table] = {"url": urls[table], "status": "error", "error": str(exc)}
+
+        # New content is parsed into temp tables before the write lock is taken
+        staged = {
+            table: stage_file(conn, table, result["path"], chunksize)
+            for table, result in results.items()
+            if result["status"] == "fetched" and not source_is_current(conn, table, result["checksum"])
+        }
+
+        now = datetime.now(timezone.utc).isoformat()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for table, result in results.items():
+                if result["status"] == "fetched":
+                    if table not in staged or source_is_current(conn, table, result["checksum"]):
+                        discard_staged(conn, table)
+                        result["status"] = "unchanged"
+                    else:
+                        result.update(apply_staged_file(conn, table, result["checksum"], staged[table]))
+                        result["status"] = "updated"
+                    conn.execute(
+                        f"""
+                        INSERT INTO {STATE_TABLE} (table_name, url, etag, last_modified, checked_at)
+                        VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT(table_name) DO UPDATE SET
+                            url = excluded.url, etag = excluded.etag,
+                            last_modified = excluded.last_modified, checked_at = excluded.checked_at
+                        """,
+                        (table, result["url"], result["etag"], result["last_modified"], now),
+                    )
+                elif result["status"] == "not_modified":
+                    conn.execute(
+                        f"UPDATE {STATE_TABLE} SET checked_at = ? WHERE table_name = ?", (now, table)
+                    )
+
+            updated = {t: r for t, r in results.items() if r["status"] == "updated"}
+            features = refresh_features_if_changed(conn, updated) if updated else None
+            conn.execute("COMMIT")
+            committed = True
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+        # Downloads not collected before an error still have a file to remove
+        for table, future in futures.items():
+            if table not in results and future.done() and future.exception() is None:
+                results[table] = future.result()
+        # Keep the local CSVs in step with what was ingested
+        _settle_downloads(results, data_dir, committed)
+
+    results[FEATURES_TABLE] = features
+    return results
+
+
+if __name__ == "__main__":
+    outcome = refresh_sources()
+    features = outcome.pop(FEATURES_TABLE)
+    for table, result in outcome.items():
+        if result["status"] == "updated":
+            print(f"{table}: updated ({result['upserted']} upserted, {result['deleted']} deleted)")
+        elif result["status"] == "error":
+            print(f"{table}: error - {result['error']}")
+        else:
+            print(f"{table}: {result['status'].replace('_', ' ')}")
+    if features is not None:
+        print(f"{FEATURES_TABLE}: refreshed ({features} rows)")
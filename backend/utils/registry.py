@@ -0,0 +1,300 @@
+"""
+Versioned registry of model runs and their predictions.
+
+Every run of the pipeline is recorded with the hash of the data it was
+trained on, model hyperparameters, evaluation metrics, stage timings and the
+directory holding its serialized models. Predictions, and the per-year
+feature contributions that explain them, are kept per run in indexed tables,
+and a single-row pointer marks which run the API serves by default, so
+switching runs is one UPDATE rather than a recomputation.
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+import hashlib
+import json
+import math
+import sqlite3
+import uuid
+
+import pandas as pd
+
+from backend.utils.data_loader import get_db_path
+from backend.utils.versions import record_version
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS model_runs (
+    run_id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    data_hash TEXT NOT NULL,
+    params TEXT,
+    metrics TEXT,
+    artifact_path TEXT,
+    timings TEXT
+);
+CREATE TABLE IF NOT EXISTS run_predictions (
+    run_id TEXT NOT NULL REFERENCES model_runs(run_id),
+    series TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    prediction REAL,
+    PRIMARY KEY (run_id, series, year)
+);
+CREATE TABLE IF NOT EXISTS run_contributions (
+    run_id TEXT NOT NULL REFERENCES model_runs(run_id),
+    series TEXT NOT NULL,
+    year INTEGER NOT NULL,
+    term TEXT NOT NULL,
+    component TEXT NOT NULL,
+    forecast INTEGER NOT NULL,
+    value REAL,
+    PRIMARY KEY (run_id, series, year, term)
+);
+CREATE TABLE IF NOT EXISTS active_run (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    run_id TEXT NOT NULL REFERENCES model_runs(run_id)
+);
+"""
+
+
+def ensure_registry(conn: sqlite3.Connection) -> None:
+    """
+    Create the registry tables if they do not exist yet.
+    """
+    conn.executescript(_SCHEMA)
+
+
+def new_run_id() -> str:
+    """
+    Sortable, collision-resistant identifier such as ``20250101T120000Z-1a2b3c``.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return f"{stamp}-{uuid.uuid4().hex[:6]}"
+
+
+def hash_datasets(*frames: pd.DataFrame) -> str:
+    """
+    Content hash of the training data so runs on identical inputs can be matched.
+    """
+    digest = hashlib.sha256()
+    for frame in frames:
+        digest.update(",".join(map(str, frame.columns)).encode())
+        digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+    return digest.hexdigest()
+
+
+def _json_safe(params: dict) -> dict:
+    """
+    Keep scalar, finite values so hyperparameters serialize as strict JSON.
+    """
+    safe = {}
+    for key, value in params.items():
+        if isinstance(value, dict):
+            safe[key] = _json_safe(value)
+        elif isinstance(value, (bool, int, str)) or (
+            isinstance(value, float) and math.isfinite(value)
+        ):
+            safe[key] = value
+    return safe
+
+
+def save_artifacts(run_id: str, models: dict, root: str | Path | None = None) -> Path:
+    """
+    Serialize a run's models under ``<root>/<run_id>`` and return the directory.
+
+    ``root`` defaults to a ``models`` directory next to the database.
+
+    XGBoost models use their native JSON format; anything else is pickled with joblib.
+    """
+    import joblib
+
+    run_dir = Path(root or get_db_path().parent / "models") / run_id
+    run_dir.mkdir(parents=True, exist_ok=True)
+    for name, model in models.items():
+        if hasattr(model, "save_model"):
+            model.save_model(run_dir / f"{name}.json")
+        else:
+            joblib.dump(model, run_dir / f"{name}.joblib")
+    return run_dir
+
+
+def load_artifacts(run_id: str | None = None) -> dict:
+    """
+    Deserialize a run's saved models (the active run by default); empty when none are stored.
+    """
+    import joblib
+    from xgboost import XGBRegressor
+
+    with sqlite3.connect(get_db_path()) as conn:
+        ensure_registry(conn)
+        run_id = run_id or get_active_run_id(conn)
+        row = conn.execute(
+            "SELECT artifact_path FROM model_runs WHERE run_id = ?", (run_id,)
+        ).fetchone() if run_id else None
+    if not row or not row[0] or not Path(row[0]).is_dir():
+        return {}
+
+    models = {}
+    for path in sorted(Path(row[0]).iterdir()):
+        if path.suffix == ".json":
+            model = XGBRegressor()
+            model.load_model(path)
+            models[path.stem] = model
+        elif path.suffix == ".joblib":
+            models[path.stem] = joblib.load(path)
+    return models
+
+
+def register_run(
+    run_id: str,
+    data_hash: str,
+    predictions: dict,
+    params: dict | None = None,
+    metrics: dict | None = None,
+    artifact_path: str | Path | None = None,
+    timings: dict | None = None,
+    contributions: dict | None = None,
+    activate: bool = True,
+) -> str:
+    """
+    Record a run and its predictions in one transaction.
+
+    ``predictions`` maps a series name (e.g. ``"temperature"``) to a
+    ``(years, values)`` pair; ``contributions`` optionally maps a series to
+    the long-format frame of ``backend.model.explain``. With ``activate`` the
+    run becomes the one the API serves by default.
+    """
+    rows = [
+        (run_id, series, int(year), float(value))
+        for series, (years, values) in predictions.items()
+        for year, value in zip(years, values)
+    ]
+    contribution_rows = [
+        (run_id, series, int(year), term, component, int(forecast), float(value))
+        for series, frame in (contributions or {}).items()
+        for year, term, component, forecast, value in zip(
+            frame["year"], frame["term"], frame["component"], frame["forecast"], frame["value"]
+        )
+    ]
+
+    with sqlite3.connect(get_db_path()) as conn:
+        ensure_registry(conn)
+        conn.execute(
+            """
+            INSERT INTO model_runs
+                (run_id, created_at, data_hash, params, metrics, artifact_path, timings)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                run_id,
+                datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                data_hash,
+                json.dumps(_json_safe(params or {})),
+                json.dumps(_json_safe(metrics or {})),
+                str(artifact_path) if artifact_path else None,
+                json.dumps(_json_safe(timings or {})),
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO run_predictions (run_id, series, year, prediction) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        conn.executemany(
+            "INSERT INTO run_contributions (run_id, series, year, term, component, forecast, value) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            contribution_rows,
+        )
+        if activate:
+            set_active_run(conn, run_id)
+    return run_id
+
+
+def set_active_run(conn: sqlite3.Connection, run_id: str) -> None:
+    """
+    Flip the single-row active pointer to ``run_id`` and log the change for live clients.
+    """
+    conn.execute(
+        """
+        INSERT INTO active_run (id, run_id) VALUES (1, ?)
+        ON CONFLICT(id) DO UPDATE SET run_id = excluded.run_id
+        """,
+        (run_id,),
+    )
+    record_version(conn, "run_predictions", run_id)
+
+
+def activate_run(run_id: str) -> None:
+    """
+    Point the API at an existing run.
+    """
+    with sqlite3.connect(get_db_path()) as conn:
+        ensure_registry(conn)
+        if not run_exists(conn, run_id):
+            raise KeyError(f"Unknown run: {run_id}")
+        set_active_run(conn, run_id)
+
+
+def get_active_run_id(conn: sqlite3.Connection) -> str | None:
+    """
+    Run currently served by default, or ``None`` if no run has been registered.
+    """
+    try:
+        row = conn.execute("SELECT run_id FROM active_run WHERE id = 1").fetchone()
+    except sqlite3.OperationalError:
+        return None  # Registry tables not created yet
+    return row[0] if row else None
+
+
+def run_exists(conn: sqlite3.Connection, run_id: str) -> bool:
+    """
+    Whether ``run_id`` has been registered.
+    """
+    try:
+        return conn.execute("SELECT 1 FROM model_runs WHERE run_id = ?", (run_id,)).fetchone() is not None
+    except sqlite3.OperationalError:
+        return False
+
+
+def list_runs() -> pd.DataFrame:
+    """
+    All registered runs, newest first, with an ``active`` flag.
+    """
+    with sqlite3.connect(get_db_path()) as conn:
+        ensure_registry(conn)
+        return pd.read_sql_query(
+            """
+            SELECT r.*, COALESCE(r.run_id = a.run_id, 0) AS active
+            FROM model_runs r LEFT JOIN active_run a ON a.id = 1
+            ORDER BY r.created_at DESC, r.run_id DESC
+            """,
+            conn,
+        )
+
+
+def load_run_predictions(series: str, run_id: str | None = None) -> pd.DataFrame:
+    """
+    Predictions for one series of a run (the active run by default).
+    """
+    with sqlite3.connect(get_db_path()) as conn:
+        ensure_registry(conn)
+        run_id = run_id or get_active_run_id(conn)
+        return pd.read_sql_query(
+            "SELECT year, prediction FROM run_predictions "
+            "WHERE run_id = ? AND series = ? ORDER BY year",
+            conn,
+            params=(run_id, series),
+        )
+
+
+def load_run_contributions(series: str, run_id: str | None = None) -> pd.DataFrame:
+    """
+    Stored feature contributions for one series of a run (the active run by default), in stored order.
+    """
+    with sqlite3.connect(get_db_path()) as conn:
+        ensure_registry(conn)
+        run_id = run_id or get_active_run_id(conn)
+        return pd.read_sql_query(
+            "SELECT year, term, component, forecast, value FROM run_contributions "
+            "WHERE run_id = ? AND series = ? ORDER BY rowid",
+            conn,
+            params=(run_id, series),
+        )
@@ -0,0 +1,86 @@
+"""
+Process-wide CPU budget for XGBoost and worker pools.
+
+XGBoost and the BLAS behind scikit-learn default to one thread per core, so a
+pool of N workers each training a model would run N × cores threads. Every
+XGBoost model takes its ``n_jobs`` from ``xgb_threads()``, and pools created
+through ``worker_pool`` split the budget so workers × threads-per-worker
+matches the available cores.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+_THREAD_LIMIT = None  # Per-process allotment; None means the whole budget
+
+
+def available_cores() -> int:
+    """
+    Cores this process may use: ``CLIMATE_CPU_BUDGET`` if set, else the CPU affinity mask.
+    """
+    override = os.environ.get("CLIMATE_CPU_BUDGET")
+    if override:
+        return max(1, int(override))
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # macOS / Windows
+        return os.cpu_count() or 1
+
+
+def set_thread_limit(threads: int | None) -> None:
+    """
+    Cap the threads this process gives to XGBoost (``None`` restores the full budget).
+    """
+    global _THREAD_LIMIT
+    _THREAD_LIMIT = threads
+
+
+def xgb_threads() -> int:
+    """
+    ``n_jobs`` for XGBoost fits and predictions in this process.
+    """
+    return _THREAD_LIMIT or available_cores()
+
+
+def plan_workers(n_tasks: int, max_workers: int | None = None) -> tuple[int, int]:
+    """
+    Split the budget into ``(workers, threads_per_worker)`` for ``n_tasks`` jobs.
+
+    Fewer tasks than cores leaves each worker several threads; more tasks than
+    cores gives one single-threaded worker per core.
+    """
+    cores = xgb_threads()
+    workers = max(1, min(n_tasks, cores, max_workers or cores))
+    return workers, max(1, cores // workers)
+
+
+def _init_worker(threads: int) -> None:
+    """
+    Pool initializer: apply the worker's share of the budget before any task runs.
+    """
+    set_thread_limit(threads)
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    try:
+        from threadpoolctl import threadpool_limits
+
+        # BLAS/OpenMP pools inherited from the parent are already initialized
+        threadpool_limits(limits=threads)
+    except ImportError:
+        pass
+
+
+def worker_pool(
+    n_tasks: int, max_workers: int | None = None, threads_per_worker: int | None = None
+) -> ProcessPoolExecutor:
+    """
+    Process pool sized by ``plan_workers`` whose workers respect their thread share.
+
+    ``threads_per_worker`` overrides the planned share (used by benchmarks to
+    reproduce naive oversubscription).
+    """
+    workers, threads = plan_workers(n_tasks, max_workers)
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(threads_per_worker or threads,),
+    )
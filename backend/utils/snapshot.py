@@ -0,0 +1,135 @@
+"""
+Columnar ``.npy`` snapshots of the SQLite tables.
+
+``export_snapshot`` writes each table as one ``.npy`` file per column (rows
+ordered by year) plus a JSON manifest into a versioned directory next to the
+database; ``<db dir>/snapshot`` is a symlink to the current version. Reading
+a snapshot memory-maps the column files, so load time does not grow with the
+number of rows: pages are only read when values are touched.
+
+Usage:
+    python -m backend.utils.snapshot
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+import json
+import os
+import shutil
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+MANIFEST = "manifest.json"
+DEFAULT_TABLES = ("temperature", "co2_concentration", "sea_level", "climate_features")
+
+
+def snapshot_root(db_path: str | Path) -> Path:
+    """
+    Snapshot directory that belongs to the database at ``db_path``.
+    """
+    return Path(db_path).parent / "snapshot"
+
+
+def export_snapshot(db_path: str | Path, root: str | Path | None = None, tables=DEFAULT_TABLES) -> Path:
+    """
+    Write ``tables`` (those that exist) as per-column ``.npy`` files.
+
+    Each export goes into its own ``<root>.v<timestamp>`` directory and
+    ``root`` (a symlink) is repointed with one atomic rename, so readers
+    always find a complete snapshot. The version it replaced is kept for
+    readers that resolved it just before the swap; older ones are removed.
+    """
+    db_path = Path(db_path)
+    root = Path(root) if root is not None else snapshot_root(db_path)
+    staging = root.with_name(f"{root.name}.v{datetime.now(timezone.utc):%Y%m%dT%H%M%S%f}-{os.getpid()}")
+    staging.mkdir(parents=True)
+    try:
+        _write_tables(db_path, staging, tables)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    _repoint(root, staging)
+    return root
+
+
+def _write_tables(db_path: Path, staging: Path, tables) -> None:
+    """
+    Export ``tables`` and the manifest into the version directory ``staging``.
+    """
+    manifest = {
+        "source": db_path.name,
+        "exported_at": datetime.now(timezone.utc).isoformat(),
+        "tables": {},
+    }
+    with sqlite3.connect(db_path) as conn:
+        existing = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        for table in tables:
+            if table not in existing:
+                continue
+            # Same reader as the SQLite loaders, so dtypes (NULL -> NaN) match
+            df = pd.read_sql_query(f"SELECT * FROM {table} ORDER BY year", conn)
+            table_dir = staging / table
+            table_dir.mkdir()
+            for name in df.columns:
+                values = df[name].to_numpy()
+                if values.dtype == object:
+                    values = values.astype(str)  # Keep files loadable without pickle
+                np.save(table_dir / f"{name}.npy", values)
+            manifest["tables"][table] = {
+                "rows": len(df),
+                "columns": {name: df[name].to_numpy().dtype.str for name in df.columns},
+            }
+    (staging / MANIFEST).write_text(json.dumps(manifest, indent=2))
+
+
+def _repoint(root: Path, version: Path) -> None:
+    """
+    Atomically point the ``root`` symlink at ``version`` and prune old versions.
+    """
+    link = root.with_name(f"{root.name}.link-{os.getpid()}")
+    link.unlink(missing_ok=True)
+    # Relative target, so the data directory can be moved with its snapshots
+    link.symlink_to(version.name, target_is_directory=True)
+
+    keep = {version.name}
+    if root.is_symlink():
+        keep.add(Path(os.readlink(root)).name)
+    elif root.exists():
+        # A plain directory from before versioned exports; this one switch is not atomic
+        legacy = root.with_name(f"{root.name}.old-{os.getpid()}")
+        root.rename(legacy)
+    os.replace(link, root)
+
+    for old in root.parent.glob(f"{root.name}.*"):
+        if old.name not in keep and not old.is_symlink():
+            shutil.rmtree(old, ignore_errors=True)
+
+
+def read_snapshot(root: str | Path, table: str, columns: list[str] | None = None) -> pd.DataFrame:
+    """
+    Frame over memory-mapped, read-only column arrays of one snapshot table.
+    """
+    # Resolve the symlink once, so a concurrent export cannot switch versions mid-read
+    root = Path(root).resolve()
+    manifest = json.loads((root / MANIFEST).read_text())
+    if table not in manifest["tables"]:
+        raise KeyError(f"Table not in snapshot: {table}")
+
+    names = columns or list(manifest["tables"][table]["columns"])
+    # Plain ndarray views of the maps (pandas would otherwise carry the memmap subclass)
+    arrays = {name: np.asarray(np.load(root / table / f"{name}.npy", mmap_mode="r")) for name in names}
+    return pd.DataFrame(arrays, copy=False)
+
+
+if __name__ == "__main__":
+    from backend.utils.data_loader import get_db_path
+
+    path = export_snapshot(get_db_path())
+    manifest = json.loads((path / MANIFEST).read_text())
+    for table, info in manifest["tables"].items():
+        print(f"{table}: {info['rows']} rows, {len(info['columns'])} columns")
+    print(f"Snapshot written to {path}")
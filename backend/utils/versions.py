@@ -0,0 +1,66 @@
+"""
+Append-only log of dataset changes, read by the API's live-update stream.
+
+Every writer that changes what the dashboard shows (ingest, the latest-run
+prediction tables, activating a registry run) appends one row in the same
+transaction as its data, so a row is visible exactly when the data is. The
+autoincrement ``version`` is a global, monotonic change counter: readers keep
+the last version they saw and ask only for newer rows.
+"""
+
+from datetime import datetime, timezone
+import sqlite3
+
+VERSIONS_TABLE = "dataset_versions"
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS {VERSIONS_TABLE} (
+    version INTEGER PRIMARY KEY AUTOINCREMENT,
+    dataset TEXT NOT NULL,
+    run_id TEXT,
+    created_at TEXT NOT NULL
+)
+"""
+
+
+def ensure_versions(conn: sqlite3.Connection) -> None:
+    """
+    Create the version log if it does not exist yet.
+    """
+    conn.execute(_SCHEMA)
+
+
+def record_version(conn: sqlite3.Connection, dataset: str, run_id: str | None = None) -> int:
+    """
+    Log a change to ``dataset`` on ``conn``'s open transaction; returns the new version.
+    """
+    ensure_versions(conn)
+    cursor = conn.execute(
+        f"INSERT INTO {VERSIONS_TABLE} (dataset, run_id, created_at) VALUES (?, ?, ?)",
+        (dataset, run_id, datetime.now(timezone.utc).isoformat(timespec="seconds")),
+    )
+    return cursor.lastrowid
+
+
+def versions_since(conn: sqlite3.Connection, version: int = 0) -> list[dict]:
+    """
+    Changes newer than ``version``, oldest first (empty before anything was logged).
+    """
+    try:
+        rows = conn.execute(
+            f"SELECT version, dataset, run_id FROM {VERSIONS_TABLE} WHERE version > ? ORDER BY version",
+            (version,),
+        ).fetchall()
+    except sqlite3.OperationalError:
+        return []
+    return [{"version": v, "dataset": dataset, "run_id": run_id} for v, dataset, run_id in rows]
+
+
+def latest_version(conn: sqlite3.Connection) -> int:
+    """
+    Newest logged version, or 0 before anything was logged.
+    """
+    try:
+        return conn.execute(f"SELECT COALESCE(MAX(version), 0) FROM {VERSIONS_TABLE}").fetchone()[0]
+    except sqlite3.OperationalError:
+        return 0
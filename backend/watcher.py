@@ -0,0 +1,143 @@
+import sys, os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+"""
+Watch the source CSVs in backend/data and keep the forecasts current.
+
+The watcher polls the files' mtime and size (portable, no extra
+dependency). A change starts a debounce window that every further change
+restarts; once the files have been quiet for ``debounce`` seconds it runs
+the incremental ingest (only tables whose content changed are touched),
+maps the changed tables to the pipeline stages they invalidate, reruns just
+those stages and publishes a new active run.
+
+Usage:
+    python backend/watcher.py [--interval 2] [--debounce 10]
+"""
+
+from pathlib import Path
+import argparse
+import logging
+import threading
+import time
+
+from backend.utils.create_db import FEATURES_TABLE, SOURCES, ingest_sources
+from backend.utils.data_loader import set_db_path
+from backend.model.pipeline import run_stages, stages_for
+
+logger = logging.getLogger(__name__)
+
+_DATA_DIR = Path(__file__).resolve().parent / "data"
+
+
+class DataWatcher:
+    """
+    Debounced poller that rebuilds changed tables and reruns invalidated stages.
+    """
+
+    def __init__(
+        self,
+        data_dir: str | Path = _DATA_DIR,
+        db_path: str | Path | None = None,
+        interval: float = 2.0,
+        debounce: float = 10.0,
+    ):
+        self.data_dir = Path(data_dir)
+        self.db_path = Path(db_path) if db_path is not None else self.data_dir / "climate.db"
+        self.interval = interval
+        self.debounce = debounce
+        self._seen = self._fingerprint()
+        self._last_change = None  # Monotonic time of the latest unprocessed change
+
+    def _fingerprint(self) -> dict:
+        """
+        ``(mtime_ns, size)`` of each source CSV (``None`` when missing).
+        """
+        prints = {}
+        for table, (filename, _) in SOURCES.items():
+            try:
+                stat = (self.data_dir / filename).stat()
+                prints[table] = (stat.st_mtime_ns, stat.st_size)
+            except FileNotFoundError:
+                prints[table] = None
+        return prints
+
+    def poll(self, now: float | None = None) -> dict | None:
+        """
+        Check the files once; returns the update summary when a debounced batch was processed.
+        """
+        now = time.monotonic() if now is None else now
+        current = self._fingerprint()
+        if current != self._seen:
+            self._seen = current
+            self._last_change = now
+            return None
+        if self._last_change is not None and now - self._last_change >= self.debounce:
+            try:
+                result = self.process()
+            except Exception:
+                # Re-armed, so the batch is retried after another debounce period
+                self._last_change = now
+                raise
+            self._last_change = None
+            return result
+        return None
+
+    def process(self) -> dict:
+        """
+        Ingest changed sources and rerun only the stages they invalidate.
+        """
+        started = time.perf_counter()
+        stats = ingest_sources(self.db_path, self.data_dir)
+        changed = {
+            table
+            for table, table_stats in stats.items()
+            if table != FEATURES_TABLE
+            and (table_stats["upserted"] or table_stats["deleted"] or table_stats["migrated"])
+        }
+        summary = {"changed": changed, "stages": set(), "run_id": None, "ingest": stats}
+
+        stages = stages_for(changed)
+        if stages:
+            set_db_path(self.db_path)
+            result = run_stages(stages)
+            summary.update(stages=result["stages"], run_id=result["run_id"])
+        summary["seconds"] = time.perf_counter() - started
+        return summary
+
+    def run_forever(self, stop: threading.Event | None = None) -> None:
+        """
+        Poll until ``stop`` is set; failures are logged and retried after the debounce period.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            try:
+                summary = self.poll()
+            except Exception:
+                logger.exception("Update failed; retrying after the debounce period")
+                summary = None
+            if summary is not None:
+                if summary["run_id"]:
+                    logger.info(
+                        "Tables %s changed; reran %s as run %s in %.1fs",
+                        sorted(summary["changed"]), sorted(summary["stages"]),
+                        summary["run_id"], summary["seconds"],
+                    )
+                else:
+                    logger.info("Files touched but no data changed")
+            stop.wait(self.interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild and re-forecast when source CSVs change")
+    parser.add_argument("--interval", type=float, default=2.0, help="seconds between polls")
+    parser.add_argument("--debounce", type=float, default=10.0, help="quiet seconds before rebuilding")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    watcher = DataWatcher(interval=args.interval, debounce=args.debounce)
+    logger.info("Watching %s", watcher.data_dir)
+    try:
+        watcher.run_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,3 @@
+"""
+Performance benchmarks for Climate Dashboard project.
+"""
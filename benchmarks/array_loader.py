@@ -0,0 +1,57 @@
+"""
+Microbenchmark of the pandas-free array loaders against the DataFrame loaders.
+
+Reports cold import time of each module (in a fresh interpreter) and the
+per-call load time of the temperature table at several sizes, with the
+DataFrame cache disabled so both paths actually hit SQLite.
+
+Usage:
+    python -m benchmarks.array_loader
+    python -m benchmarks.array_loader --rows 1000 100000
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from backend.utils import array_loader, data_loader
+from benchmarks.snapshot_load import _best_of, _build
+
+
+def _import_seconds(module: str, repeats: int = 3) -> float:
+    """Fastest cold import of ``module`` in a fresh interpreter."""
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    return min(
+        float(subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout)
+        for _ in range(repeats)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[175, 10_000, 1_000_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print("Cold import")
+    for module in ("backend.utils.array_loader", "backend.utils.data_loader"):
+        print(f"  {module:<28} {_import_seconds(module):.3f}s")
+
+    data_loader.set_cache_enabled(False)
+    print(f"\n{'rows':>10} {'pandas s':>10} {'numpy s':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            db_path = Path(tmp) / f"bench_{rows}.db"
+            _build(db_path, rows)
+            data_loader.set_db_path(db_path)
+
+            pandas_s = _best_of(data_loader.load_main, args.repeats)
+            numpy_s = _best_of(array_loader.load_main_arrays, args.repeats)
+            print(f"{rows:>10} {pandas_s:>10.4f} {numpy_s:>10.4f} {pandas_s / numpy_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Memory and drift report for the float32 compact mode.
+
+Usage:
+    python -m benchmarks.compact_mode
+"""
+
+import numpy as np
+
+from backend.utils.data_loader import (
+    load_climate_features,
+    split_data,
+    set_compact_mode,
+)
+from backend.model.features import sea_level_features, temperature_features
+from backend.model.temprature_model import train_poly_model, train_xgb_residual, predict_future
+from backend.model.sea_level_model import train_sea_poly_model, train_sea_xgb_residual
+from backend.model.monte_carlo import simulate_future
+
+
+def run(compact: bool) -> dict:
+    """Run loading, features, the deterministic forecast and a Monte Carlo batch."""
+    set_compact_mode(compact)
+    try:
+        data = load_climate_features()
+        sea_dataset = load_climate_features(with_sea_level=True)
+        train, _, _ = split_data(data)
+        sea_train, _, _ = split_data(sea_dataset)
+
+        poly = train_poly_model(train, degree=2)
+        xgb = train_xgb_residual(train, poly)
+        _, _, _, _, anchored = predict_future(poly, xgb, data, start=2025, end=2050)
+
+        sea_poly = train_sea_poly_model(sea_train)
+        sea_xgb = train_sea_xgb_residual(sea_train, sea_poly)
+        _, temp_fan, sea_fan, _ = simulate_future(
+            poly, xgb, data, 2025, 2050, sea_poly, sea_xgb, sea_dataset, n_paths=2000
+        )
+    finally:
+        set_compact_mode(False)
+
+    return {
+        "frame_bytes": int(data.memory_usage(index=False).sum()),
+        "feature_bytes": temperature_features(data).nbytes + sea_level_features(sea_dataset).nbytes,
+        "forecast": anchored,
+        "temp_fan": temp_fan["q50"].to_numpy(),
+        "sea_fan": sea_fan["q50"].to_numpy(),
+    }
+
+
+def main():
+    full, compact = run(False), run(True)
+
+    print(f"{'stage':<16} {'float64 B':>10} {'float32 B':>10} {'saved':>7}")
+    for key in ("frame_bytes", "feature_bytes"):
+        saved = 1 - compact[key] / full[key]
+        print(f"{key:<16} {full[key]:>10} {compact[key]:>10} {saved:>6.0%}")
+
+    print("\nMax absolute drift vs float64")
+    for key in ("forecast", "temp_fan", "sea_fan"):
+        drift = np.max(np.abs(compact[key].astype(np.float64) - full[key]))
+        print(f"  {key:<10} {drift:.2e}")
+
+
+if __name__ == "__main__":
+    main()
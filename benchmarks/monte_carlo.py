@@ -0,0 +1,47 @@
+"""
+Throughput benchmark for the Monte Carlo forecast paths.
+
+Usage:
+    python -m benchmarks.monte_carlo                 # 5000 paths, several chunk sizes
+    python -m benchmarks.monte_carlo --paths 20000
+"""
+
+import argparse
+
+from backend.utils.data_loader import (
+    load_climate_features,
+    split_data,
+)
+from backend.model.temprature_model import train_poly_model, train_xgb_residual
+from backend.model.sea_level_model import train_sea_poly_model, train_sea_xgb_residual
+from backend.model.monte_carlo import simulate_future
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--paths", type=int, default=5000)
+    parser.add_argument("--chunks", type=int, nargs="+", default=[500, 2000, 5000])
+    args = parser.parse_args()
+
+    data = load_climate_features()
+    train, _, _ = split_data(data)
+    poly = train_poly_model(train, degree=2)
+    xgb = train_xgb_residual(train, poly)
+
+    sea_dataset = load_climate_features(with_sea_level=True)
+    sea_train, _, _ = split_data(sea_dataset)
+    sea_poly = train_sea_poly_model(sea_train)
+    sea_xgb = train_sea_xgb_residual(sea_train, sea_poly)
+
+    print(f"{'chunk':>8} {'paths':>8} {'seconds':>9} {'paths/s':>10}")
+    for chunk in args.chunks:
+        _, _, _, stats = simulate_future(
+            poly, xgb, data, 2025, 2050, sea_poly, sea_xgb, sea_dataset,
+            n_paths=args.paths, chunk_size=chunk,
+        )
+        print(f"{chunk:>8} {stats['n_paths']:>8} {stats['seconds']:>9.2f} "
+              f"{stats['paths_per_second']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
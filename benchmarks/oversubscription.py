@@ -0,0 +1,39 @@
+"""
+Wall-clock comparison of the CPU budget against naive thread oversubscription.
+
+Runs the same walk-forward backtest twice: once with the default budget
+(workers x XGBoost threads = cores) and once with every worker claiming all
+cores, which is what happens when XGBoost's default n_jobs meets a process pool.
+
+Usage:
+    python -m benchmarks.oversubscription
+"""
+
+import time
+
+from backend.utils.data_loader import (
+    load_climate_features,
+)
+from backend.utils.resources import available_cores
+from backend.model.backtest import run_backtest
+
+
+def main():
+    data = load_climate_features()
+    sea_dataset = load_climate_features(with_sea_level=True)
+    cores = available_cores()
+
+    timings = {}
+    for label, threads in (("budgeted", None), ("oversubscribed", cores)):
+        start = time.perf_counter()
+        run_backtest(data, sea_dataset, max_workers=cores, threads_per_worker=threads)
+        timings[label] = time.perf_counter() - start
+
+    print(f"cores available: {cores}")
+    for label, seconds in timings.items():
+        print(f"  {label:<15} {seconds:7.2f}s")
+    print(f"  speedup         {timings['oversubscribed'] / timings['budgeted']:7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Load-time comparison of SQLite reads against memory-mapped .npy snapshots.
+
+Builds temperature tables of increasing size in a scratch database, exports
+each as a snapshot, and times the uncached SQLite path (read_sql_query +
+sort) against ``load_snapshot``.
+
+Usage:
+    python -m benchmarks.snapshot_load
+    python -m benchmarks.snapshot_load --rows 1000 100000 2000000
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from backend.utils import data_loader
+from backend.utils.snapshot import export_snapshot
+
+
+def _best_of(fn, repeats: int) -> float:
+    """Fastest wall-clock time of ``repeats`` calls."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _build(db_path: Path, rows: int) -> None:
+    """Scratch temperature table with ``rows`` rows."""
+    rng = np.random.default_rng(0)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE temperature (year INTEGER PRIMARY KEY, anthropogenic_c REAL, "
+            "observed_c REAL, anthropogenic_f REAL)"
+        )
+        values = rng.normal(size=(rows, 3))
+        conn.executemany(
+            "INSERT INTO temperature VALUES (?, ?, ?, ?)",
+            ((i, *map(float, row)) for i, row in enumerate(values)),
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    data_loader.set_cache_enabled(False)  # Time the SQLite read itself, not the cache
+    print(f"{'rows':>10} {'sqlite s':>10} {'snapshot s':>11} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            db_path = Path(tmp) / f"bench_{rows}.db"
+            _build(db_path, rows)
+            export_snapshot(db_path)  # Replaces the previous size's snapshot
+            data_loader.set_db_path(db_path)
+
+            sqlite_s = _best_of(data_loader.load_main, args.repeats)
+            snapshot_s = _best_of(lambda: data_loader.load_snapshot("temperature"), args.repeats)
+            print(f"{rows:>10} {sqlite_s:>10.4f} {snapshot_s:>11.5f} {sqlite_s / snapshot_s:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
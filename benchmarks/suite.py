@@ -0,0 +1,382 @@
+"""
+Performance benchmark suite with a stored baseline and regression gate.
+
+Covers the data loaders and merges, feature construction, the XGBoost
+residual fits, the future projections and every local GET route of the Flask
+app (through the test client). All cases run against a scratch database
+ingested from the bundled CSVs, so results do not depend on the state of
+``backend/data/climate.db``.
+
+Each case is timed like ``timeit``: calls are batched until one sample takes
+at least ``MIN_SAMPLE_SECONDS``, and the fastest per-call time of
+``--repeats`` samples is kept. Results are compared with the baseline JSON; a
+case is a regression when it is slower than its baseline by more than
+``--tolerance`` (relative) and ``MIN_DELTA_SECONDS`` (absolute). Baselines are
+machine specific, so the first run on a machine records one.
+
+Usage:
+    python -m benchmarks.suite [-k pattern] [--repeats 5] [--tolerance 0.25]
+    python -m benchmarks.suite --update-baseline
+    python run_tests.py --bench
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from backend.utils import data_loader
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DATA_DIR = Path(__file__).resolve().parents[1] / "backend" / "data"
+
+MIN_SAMPLE_SECONDS = 0.05
+MIN_DELTA_SECONDS = 2e-5  # Ignore sub-20µs differences on the fastest cases
+
+# Routes that call external services or never finish are not benchmarked;
+# /api/scenario needs parameters and is timed with a query below
+SKIP_ROUTES = {"/api/news", "/api/admin/api-details", "/api/events", "/api/scenario"}
+
+_CASES = {}
+
+
+def bench(name: str):
+    """
+    Register ``setup`` as benchmark ``name``; ``setup(ctx)`` returns the callable to time.
+    """
+    def register(setup):
+        _CASES[name] = setup
+        return setup
+    return register
+
+
+def time_case(fn, repeats: int = 5) -> dict:
+    """
+    Fastest and median per-call seconds of ``repeats`` auto-sized samples.
+    """
+    fn()  # Warm-up: imports, first-touch allocations, SQLite page cache
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_SECONDS or number >= 1 << 16:
+            break
+        number *= 2
+
+    samples = [elapsed / number]
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return {"best_s": min(samples), "median_s": float(np.median(samples)), "number": number, "repeats": repeats}
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.25) -> list[dict]:
+    """
+    Cases whose best time exceeds the baseline by more than ``tolerance``, slowest first.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        delta = result["best_s"] - base["best_s"]
+        if delta > MIN_DELTA_SECONDS and result["best_s"] > base["best_s"] * (1 + tolerance):
+            regressions.append({"name": name, "baseline_s": base["best_s"], "best_s": result["best_s"],
+                                "ratio": result["best_s"] / base["best_s"]})
+    return sorted(regressions, key=lambda r: r["ratio"], reverse=True)
+
+
+def machine() -> dict:
+    """
+    Environment the numbers were recorded on.
+    """
+    import pandas
+    import xgboost
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "numpy": np.__version__,
+        "pandas": pandas.__version__,
+        "xgboost": xgboost.__version__,
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+def save_baseline(results: dict, path: Path = BASELINE_PATH) -> None:
+    payload = {
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": machine(),
+        "cases": results,
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+# ---------------- Fixture ---------------- #
+
+def prepare(workdir: Path) -> dict:
+    """
+    Ingest the bundled CSVs into ``workdir``, train one run and point the loaders and app at it.
+    """
+    from backend.model.pipeline import run_stages
+    from backend.model.scenarios import build_scenario_grid
+    from backend.utils.create_db import ingest_sources
+    import backend.app
+
+    for csv_path in DATA_DIR.glob("*.csv"):
+        shutil.copy(csv_path, workdir / csv_path.name)
+    db_path = workdir / "climate.db"
+    ingest_sources(db_path, workdir)
+    data_loader.set_db_path(db_path)
+    backend.app.DB_PATH = db_path
+
+    result = run_stages({"temperature", "sea_level"})
+    # A coarse grid is enough to time the interpolated lookup
+    build_scenario_grid(
+        result["run_id"],
+        models={**result["temperature"]["models"], **result["sea_level"]["models"]},
+        co2_growth_pct=np.linspace(0.0, 3.0, 7),
+        forcing_ramps=np.linspace(-0.5, 2.0, 6),
+    )
+    backend.app.app.config["TESTING"] = True
+    return {
+        "db_path": db_path,
+        "temperature": result["temperature"],
+        "sea_level": result["sea_level"],
+        "client": backend.app.app.test_client(),
+        "app": backend.app.app,
+    }
+
+
+def _uncached(fn):
+    """Time the SQLite path rather than the in-process frame cache."""
+    def call():
+        data_loader.clear_cache()
+        return fn()
+    return call
+
+
+# ---------------- Cases ---------------- #
+
+@bench("loader.load_main")
+def _(ctx):
+    return _uncached(data_loader.load_main)
+
+
+@bench("loader.load_co2")
+def _(ctx):
+    return _uncached(data_loader.load_co2)
+
+
+@bench("loader.load_sea_level")
+def _(ctx):
+    return _uncached(data_loader.load_sea_level)
+
+
+@bench("loader.load_climate_features")
+def _(ctx):
+    return _uncached(data_loader.load_climate_features)
+
+
+@bench("loader.load_climate_features_sea_level")
+def _(ctx):
+    return _uncached(lambda: data_loader.load_climate_features(with_sea_level=True))
+
+
+@bench("loader.load_climate_features_cached")
+def _(ctx):
+    data_loader.load_climate_features()
+    return data_loader.load_climate_features
+
+
+@bench("loader.merge_datasets")
+def _(ctx):
+    main, co2 = data_loader.load_main(), data_loader.load_co2()
+    return lambda: data_loader.merge_datasets(main, co2)
+
+
+@bench("loader.merge_with_sea_level")
+def _(ctx):
+    merged = data_loader.merge_datasets(data_loader.load_main(), data_loader.load_co2())
+    sea = data_loader.load_sea_level()
+    return lambda: data_loader.merge_with_sea_level(merged, sea)
+
+
+@bench("features.temperature_make_features")
+def _(ctx):
+    from backend.model.temprature_model import _make_features
+
+    data = ctx["temperature"]["data"]
+    return lambda: _make_features(data)
+
+
+@bench("features.sea_level_make_features")
+def _(ctx):
+    from backend.model.sea_level_model import _make_features
+
+    data = ctx["sea_level"]["data"]
+    return lambda: _make_features(data)
+
+
+@bench("model.train_xgb_residual")
+def _(ctx):
+    from backend.model.temprature_model import train_xgb_residual
+
+    train, _, _ = data_loader.split_data(ctx["temperature"]["data"])
+    poly = ctx["temperature"]["models"]["temperature_poly"]
+    return lambda: train_xgb_residual(train, poly)
+
+
+@bench("model.train_sea_xgb_residual")
+def _(ctx):
+    from backend.model.sea_level_model import train_sea_xgb_residual
+
+    train, _, _ = data_loader.split_data(ctx["sea_level"]["data"])
+    poly = ctx["sea_level"]["models"]["sea_level_poly"]
+    return lambda: train_sea_xgb_residual(train, poly)
+
+
+@bench("model.predict_future")
+def _(ctx):
+    from backend.model.temprature_model import predict_future
+
+    t = ctx["temperature"]
+    poly, xgb = t["models"]["temperature_poly"], t["models"]["temperature_xgb"]
+    return lambda: predict_future(poly, xgb, t["data"], start=2025, end=2050)
+
+
+@bench("model.predict_sea_future")
+def _(ctx):
+    from backend.model.sea_level_model import predict_sea_future
+
+    t, s = ctx["temperature"], ctx["sea_level"]
+    poly, xgb = s["models"]["sea_level_poly"], s["models"]["sea_level_xgb"]
+    return lambda: predict_sea_future(poly, xgb, s["data"], t["years"], t["predictions"])
+
+
+def _route_cases(app) -> dict:
+    """
+    One case per argument-free GET route, plus the keyset page and a scenario lookup.
+    """
+    paths = sorted(
+        rule.rule for rule in app.url_map.iter_rules()
+        if "GET" in rule.methods and not rule.arguments
+        and rule.rule not in SKIP_ROUTES and rule.endpoint != "static"
+    )
+    paths.append("/api/admin/tables/temperature/rows?limit=100")
+    paths.append("/api/scenario?co2_growth=1.25&forcing_ramp=0.75")
+    return {f"route.GET {path}": path for path in paths}
+
+
+def run(
+    pattern: str | None = None,
+    repeats: int = 5,
+    baseline: dict | None = None,
+    tolerance: float = 0.25,
+) -> dict:
+    """
+    Run every case whose name contains ``pattern``; returns ``{name: timing}``.
+
+    With a ``baseline``, cases that look regressed are timed once more and
+    keep their faster result, so a single noisy sample does not fail the gate.
+    """
+    import backend.app
+
+    app_db_path = backend.app.DB_PATH
+    loader_db_path = data_loader.get_db_path()
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            ctx = prepare(Path(tmp))
+            results = _run_cases(ctx, pattern, repeats)
+            suspects = [r["name"] for r in compare(results, baseline or {}, tolerance)]
+            if suspects:
+                print(f"\nRe-timing {len(suspects)} suspected regression(s)")
+                for name, retry in _run_cases(ctx, None, repeats, only=suspects).items():
+                    if retry["best_s"] < results[name]["best_s"]:
+                        results[name] = retry
+            return results
+        finally:
+            backend.app.DB_PATH = app_db_path
+            data_loader.set_db_path(loader_db_path)
+
+
+def _run_cases(ctx: dict, pattern: str | None, repeats: int, only: list | None = None) -> dict:
+    client = ctx["client"]
+    cases = dict(_CASES)
+    for name, path in _route_cases(ctx["app"]).items():
+        cases[name] = lambda ctx, path=path: (lambda: client.get(path))
+    etag = client.get("/api/temperature").headers["ETag"]
+    cases["route.GET /api/temperature (304)"] = (
+        lambda ctx: lambda: client.get("/api/temperature", headers={"If-None-Match": etag})
+    )
+
+    results = {}
+    for name, setup in cases.items():
+        if (pattern and pattern not in name) or (only is not None and name not in only):
+            continue
+        results[name] = time_case(setup(ctx), repeats)
+        print(f"  {name:<56} {results[name]['best_s'] * 1e3:>10.3f} ms", flush=True)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark suite with baseline regression gate")
+    parser.add_argument("-k", dest="pattern", default=None, help="only cases whose name contains this")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="record these results as the baseline")
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline)
+    print(f"Running benchmarks (best of {args.repeats})")
+    results = run(
+        args.pattern, args.repeats,
+        baseline=None if args.update_baseline or baseline is None else baseline["cases"],
+        tolerance=args.tolerance,
+    )
+
+    if args.update_baseline or baseline is None:
+        if baseline is not None and args.pattern:
+            # Partial run: keep the other cases' baselines
+            results = {**baseline["cases"], **results}
+        save_baseline(results, args.baseline)
+        print(f"\nBaseline {'updated' if baseline else 'recorded'}: {args.baseline}")
+        return 0
+
+    if baseline.get("machine") != machine():
+        print("\nWarning: baseline was recorded on a different machine or library versions")
+    regressions = compare(results, baseline["cases"], args.tolerance)
+    missing = sorted(set(results) - set(baseline["cases"]))
+    if missing:
+        print(f"\nNo baseline for: {', '.join(missing)} (run with --update-baseline)")
+    if not regressions:
+        print(f"\nNo regressions beyond {args.tolerance:.0%} of {args.baseline.name}")
+        return 0
+
+    print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+    for r in regressions:
+        print(f"  {r['name']:<52} {r['baseline_s'] * 1e3:>9.3f} -> {r['best_s'] * 1e3:>9.3f} ms ({r['ratio']:.2f}x)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
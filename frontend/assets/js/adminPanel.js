@@ -140,9 +140,137 @@ async function showApiDetails() {
     }
 }
 
+// ---------------- Virtual-scrolling table browser ---------------- //
+// Only the rows in view are in the DOM. Rows are fetched in fixed pages:
+// a page following a loaded one resumes from its keyset cursor, any other
+// page (e.g. after dragging the scrollbar far ahead) is fetched by offset.
+const ROW_HEIGHT = 28;
+const VIEWPORT_ROWS = 12;
+const OVERSCAN_ROWS = 6;
+const PAGE_SIZE = 200;
+// Browsers cap element heights (~16-33M px); taller tables scroll proportionally
+const MAX_SCROLL_HEIGHT = 8000000;
+
+const CELL_STYLE = 'padding: 0 6px; border: 1px solid #26408B; color: #f0f0f0; overflow: hidden; white-space: nowrap; text-overflow: ellipsis;';
+const HEADER_STYLE = 'padding: 8px; border: 1px solid #26408B; text-align: left; color: #DCAB6B;';
+
+class VirtualTable {
+    constructor(container, table, columns, totalRows) {
+        this.table = table;
+        this.columns = columns;
+        this.totalRows = totalRows;
+        this.pages = new Map();    // page index -> {rows, cursor}
+        this.inflight = new Map(); // page index -> Promise
+
+        const tableStyle = 'width: 100%; border-collapse: collapse; table-layout: fixed; background: #0D0221; font-size: 0.85em;';
+        const header = document.createElement('table');
+        header.style.cssText = tableStyle;
+        const headRow = header.createTHead().insertRow();
+        columns.forEach(col => {
+            const th = document.createElement('th');
+            th.style.cssText = HEADER_STYLE;
+            th.textContent = col;
+            headRow.appendChild(th);
+        });
+
+        this.viewport = document.createElement('div');
+        this.viewport.style.cssText = `position: relative; overflow-y: auto; height: ${ROW_HEIGHT * Math.min(VIEWPORT_ROWS, totalRows) + 2}px;`;
+        // The spacer clips the rendered rows, so they never stretch the scroll range
+        const spacer = document.createElement('div');
+        spacer.style.cssText = `position: relative; overflow: hidden; height: ${Math.min(ROW_HEIGHT * totalRows, MAX_SCROLL_HEIGHT)}px;`;
+        this.body = document.createElement('table');
+        this.body.style.cssText = `${tableStyle} position: absolute; top: 0; left: 0;`;
+        spacer.appendChild(this.body);
+        this.viewport.appendChild(spacer);
+
+        container.append(header, this.viewport);
+
+        let scheduled = false;
+        this.viewport.addEventListener('scroll', () => {
+            if (scheduled) return;
+            scheduled = true;
+            requestAnimationFrame(() => {
+                scheduled = false;
+                this.render();
+            });
+        });
+        this.render();
+    }
+
+    async fetchPage(index) {
+        let url = `${API_BASE}/admin/tables/${encodeURIComponent(this.table)}/rows?limit=${PAGE_SIZE}`
+            + `&columns=${this.columns.map(encodeURIComponent).join(',')}`;
+        const previous = this.pages.get(index - 1);
+        if (previous && previous.cursor) {
+            url += `&after=${encodeURIComponent(previous.cursor)}`;
+        } else if (index > 0) {
+            url += `&offset=${index * PAGE_SIZE}`;
+        }
+        const response = await fetch(url);
+        const data = await response.json();
+        if (data.status !== 'success') throw new Error(data.error);
+
+        this.pages.set(index, { rows: data.rows, cursor: data.next_cursor });
+    }
+
+    ensurePage(index) {
+        if (this.pages.has(index)) return Promise.resolve();
+        if (!this.inflight.has(index)) {
+            this.inflight.set(index, this.fetchPage(index).finally(() => this.inflight.delete(index)));
+        }
+        return this.inflight.get(index);
+    }
+
+    // Fractional index of the row at the top of the viewport; with a capped
+    // spacer the scroll position maps proportionally onto the whole table
+    topRow() {
+        const maxScroll = this.viewport.scrollHeight - this.viewport.clientHeight;
+        const visibleRows = this.viewport.clientHeight / ROW_HEIGHT;
+        if (maxScroll <= 0) return 0;
+        return Math.min(1, this.viewport.scrollTop / maxScroll) * Math.max(0, this.totalRows - visibleRows);
+    }
+
+    async render() {
+        const top = this.topRow();
+        const first = Math.max(0, Math.floor(top) - OVERSCAN_ROWS);
+        const last = Math.min(this.totalRows, first + VIEWPORT_ROWS + 2 * OVERSCAN_ROWS);
+        const scrollTop = this.viewport.scrollTop;
+
+        const needed = [];
+        for (let page = Math.floor(first / PAGE_SIZE); page <= Math.floor((last - 1) / PAGE_SIZE); page++) {
+            needed.push(page);
+        }
+        try {
+            await Promise.all(needed.map(page => this.ensurePage(page)));
+        } catch (error) {
+            console.error(`Error loading ${this.table} rows:`, error);
+            return;
+        }
+        // A newer scroll has scheduled its own render
+        if (this.viewport.scrollTop !== scrollTop) return;
+
+        const tbody = document.createElement('tbody');
+        for (let i = first; i < last; i++) {
+            const row = this.pages.get(Math.floor(i / PAGE_SIZE)).rows[i % PAGE_SIZE];
+            if (!row) break;
+            const tr = tbody.insertRow();
+            tr.style.height = `${ROW_HEIGHT}px`;
+            row.forEach(value => {
+                const td = tr.insertCell();
+                td.style.cssText = CELL_STYLE;
+                td.textContent = value !== null && value !== undefined ? value : 'NULL';
+            });
+        }
+        // Place the top row at the scroll position (equals first * ROW_HEIGHT when uncapped)
+        this.body.style.top = `${scrollTop - (top - first) * ROW_HEIGHT}px`;
+        this.body.replaceChildren(tbody);
+    }
+}
+
 async function readDatabase() {
     try {
-        const response = await fetch(`${API_BASE}/admin/read-database`);
+        // Schemas and counts only; rows are paged in by each VirtualTable
+        const response = await fetch(`${API_BASE}/admin/read-database?rows=0`);
         const data = await response.json();
         
         if (data.status === 'success') {
@@ -156,7 +284,7 @@ async function readDatabase() {
                 </div>
             `;
             
-            // Display each table's data
+            // Display each table's metadata and a placeholder for its rows
             for (const [tableName, tableData] of Object.entries(data.data)) {
                 content += `
                     <h4 style="color: #DCAB6B; margin-top: 20px; border-top: 1px solid #26408B; padding-top: 15px;">
@@ -165,55 +293,13 @@ async function readDatabase() {
                     <div class="info-item">
                         <span class="info-label">Total Rows:</span> ${tableData.total_rows}
                     </div>
-                    <div class="info-item">
-                        <span class="info-label">Showing:</span> ${tableData.showing_rows} ${tableData.showing_rows < tableData.total_rows ? '(limited to first 100 rows)' : ''}
-                    </div>
                     <div class="info-item">
                         <span class="info-label">Columns:</span> ${tableData.columns.map(c => `${c.name} (${c.type})`).join(', ')}
                     </div>
                 `;
                 
-                if (tableData.sample_data.length > 0) {
-                    // Create a simple table display
-                    content += `
-                        <div style="overflow-x: auto; margin-top: 10px;">
-                            <table style="width: 100%; border-collapse: collapse; background: #0D0221; font-size: 0.85em;">
-                                <thead>
-                                    <tr style="background: #26408B;">
-                    `;
-                    
-                    // Table headers
-                    const columnNames = tableData.columns.map(c => c.name);
-                    columnNames.forEach(col => {
-                        content += `<th style="padding: 8px; border: 1px solid #26408B; text-align: left; color: #DCAB6B;">${col}</th>`;
-                    });
-                    
-                    content += `
-                                    </tr>
-                                </thead>
-                                <tbody>
-                    `;
-                    
-                    // Table rows (limit display to first 20 rows for readability)
-                    const displayRows = tableData.sample_data.slice(0, 20);
-                    displayRows.forEach(row => {
-                        content += `<tr>`;
-                        columnNames.forEach(col => {
-                            const value = row[col] !== null && row[col] !== undefined ? row[col] : 'NULL';
-                            content += `<td style="padding: 6px; border: 1px solid #26408B; color: #f0f0f0;">${value}</td>`;
-                        });
-                        content += `</tr>`;
-                    });
-                    
-                    content += `
-                                </tbody>
-                            </table>
-                        </div>
-                    `;
-                    
-                    if (tableData.sample_data.length > 20) {
-                        content += `<p style="color: #888; font-size: 0.85em; margin-top: 5px;">Showing first 20 of ${tableData.sample_data.length} rows</p>`;
-                    }
+                if (tableData.total_rows > 0) {
+                    content += `<div class="virtual-table" data-table="${tableName}" style="overflow-x: auto; margin-top: 10px;"></div>`;
                 } else {
                     content += `<p style="color: #888; margin-top: 10px;">No data in this table.</p>`;
                 }
@@ -228,6 +314,11 @@ async function readDatabase() {
             `;
             
             showResult('Database Contents', content, true);
+
+            document.querySelectorAll('#result-content .virtual-table').forEach(container => {
+                const tableData = data.data[container.dataset.table];
+                new VirtualTable(container, container.dataset.table, tableData.columns.map(c => c.name), tableData.total_rows);
+            });
         } else {
             showResult('Read Database - ERROR', 
                 `<div class="info-item">
@@ -246,6 +337,89 @@ async function readDatabase() {
     }
 }
 
+async function showPipelineProfiles() {
+    try {
+        const response = await fetch(`${API_BASE}/admin/profiles?limit=8`);
+        const data = await response.json();
+
+        if (data.status !== 'success') {
+            showResult('Pipeline Profiles - ERROR', 
+                `<div class="info-item">
+                    <span class="status-indicator error"></span>
+                    <strong>Error:</strong> ${data.error}
+                </div>`, false);
+            return;
+        }
+        if (data.profiles.length === 0) {
+            showResult('Pipeline Profiles', '<p>No profiled runs yet. Run <code>python backend/main.py --profile</code>.</p>', true);
+            return;
+        }
+
+        const th = 'padding: 8px; border: 1px solid #26408B; text-align: left; color: #DCAB6B;';
+        const td = 'padding: 6px; border: 1px solid #26408B; color: #f0f0f0;';
+        const fixed = (value, digits) => value === null || value === undefined ? '-' : value.toFixed(digits);
+
+        // Latest run in full
+        const latest = data.profiles[0];
+        let content = `
+            <div class="info-item">
+                <span class="info-label">Latest Run:</span> ${latest.run_id} (${latest.created_at})
+            </div>
+            <div class="info-item">
+                <span class="info-label">Total Wall Time:</span> ${fixed(latest.total_wall_s, 2)} s
+            </div>
+            ${latest.stages.some(s => s.memory_traced) ? `<div class="info-item">
+                <span class="info-label">Memory Traced:</span> yes, so these times include tracemalloc overhead
+            </div>` : ''}
+            <table style="width: 100%; border-collapse: collapse; background: #0D0221; font-size: 0.85em; margin-top: 10px;">
+                <tr style="background: #26408B;">
+                    ${['Stage', 'Wall s', 'CPU s', 'Py Peak MB', 'RSS MB', 'RSS Change MB'].map(h => `<th style="${th}">${h}</th>`).join('')}
+                </tr>
+                ${latest.stages.map(s => `<tr>
+                    <td style="${td}">${s.stage}</td>
+                    <td style="${td}">${fixed(s.wall_s, 3)}</td>
+                    <td style="${td}">${fixed(s.cpu_s, 3)}</td>
+                    <td style="${td}">${fixed(s.py_peak_mb, 1)}</td>
+                    <td style="${td}">${fixed(s.rss_mb, 1)}</td>
+                    <td style="${td}">${fixed(s.rss_delta_mb, 1)}</td>
+                </tr>`).join('')}
+            </table>
+        `;
+
+        // Wall time per stage across recent runs, oldest to newest, for spotting regressions
+        const runs = [...data.profiles].reverse();
+        const stages = [...new Set(runs.flatMap(p => p.stages.map(s => s.stage)))];
+        content += `
+            <h4 style="color: #DCAB6B; margin-top: 20px;">Wall Time Trend (s, * = memory traced)</h4>
+            <div style="overflow-x: auto;">
+            <table style="width: 100%; border-collapse: collapse; background: #0D0221; font-size: 0.85em;">
+                <tr style="background: #26408B;">
+                    <th style="${th}">Stage</th>
+                    ${runs.map(p => `<th style="${th}" title="${p.run_id}">${p.created_at.slice(0, 16)}</th>`).join('')}
+                </tr>
+                ${stages.map(stage => `<tr>
+                    <td style="${td}">${stage}</td>
+                    ${runs.map(p => {
+                        const s = p.stages.find(s => s.stage === stage);
+                        // * marks times measured with memory tracing on
+                        return `<td style="${td}">${s ? fixed(s.wall_s, 3) + (s.memory_traced ? '*' : '') : '-'}</td>`;
+                    }).join('')}
+                </tr>`).join('')}
+            </table>
+            </div>
+        `;
+
+        showResult('Pipeline Profiles', content, true);
+    } catch (error) {
+        showResult('Pipeline Profiles - ERROR', 
+            `<div class="info-item">
+                <span class="status-indicator error"></span>
+                <strong>Connection Error:</strong> ${error.message}
+            </div>
+            <p>Make sure the Flask server is running on port 5000.</p>`, false);
+    }
+}
+
 function showSiteDetails() {
     // This can be implemented to show site information
     showResult('Site Details', 
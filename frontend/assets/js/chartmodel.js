@@ -44,36 +44,102 @@ function createChart(canvasId, chartType, chartData, label, options = {}) {
   });
 }
 
-// Fetch and display all charts
-async function loadCharts() {
-  try {
-    // Fetch all data in parallel
-    const [tempData, seaLevelData, tempPredData, seaLevelPredData] = await Promise.all([
-      fetch(`${API_BASE}/temperature`).then(r => r.json()),
-      fetch(`${API_BASE}/sea-level`).then(r => r.json()),
-      fetch(`${API_BASE}/temperature-predictions`).then(r => r.json()),
-      fetch(`${API_BASE}/sea-level-predictions`).then(r => r.json())
-    ]);
+// Series the charts are built from, keyed by the name the chart specs use
+const SERIES = {
+  temperature: `${API_BASE}/temperature`,
+  seaLevel: `${API_BASE}/sea-level`,
+  temperaturePredictions: `${API_BASE}/temperature-predictions`,
+  seaLevelPredictions: `${API_BASE}/sea-level-predictions`
+};
 
+// ---------------- IndexedDB series cache ---------------- //
+// Each entry is { url, etag, data }. Pages render from the cache straight
+// away, then revalidate with If-None-Match and redraw only changed charts.
+const CACHE_DB = 'climate-dashboard';
+const CACHE_STORE = 'series';
+
+function openCache() {
+  return new Promise((resolve) => {
+    if (!window.indexedDB) return resolve(null);
+    const request = indexedDB.open(CACHE_DB, 1);
+    request.onupgradeneeded = () => request.result.createObjectStore(CACHE_STORE, { keyPath: 'url' });
+    request.onsuccess = () => resolve(request.result);
+    // Private browsing or blocked storage: fall back to plain fetches
+    request.onerror = () => resolve(null);
+    request.onblocked = () => resolve(null);
+  });
+}
+
+function cacheGet(db, url) {
+  return new Promise((resolve) => {
+    if (!db) return resolve(null);
+    const request = db.transaction(CACHE_STORE, 'readonly').objectStore(CACHE_STORE).get(url);
+    request.onsuccess = () => resolve(request.result || null);
+    request.onerror = () => resolve(null);
+  });
+}
+
+function cachePut(db, entry) {
+  return new Promise((resolve) => {
+    if (!db) return resolve();
+    const tx = db.transaction(CACHE_STORE, 'readwrite');
+    tx.objectStore(CACHE_STORE).put(entry);
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => resolve();
+  });
+}
+
+// Revalidate one cached series; resolves to the new entry, or null when unchanged
+async function revalidate(db, url, cached) {
+  const headers = cached && cached.etag ? { 'If-None-Match': cached.etag } : {};
+  // Bypass the HTTP cache so the 304 reaches us instead of being replayed as a 200
+  const response = await fetch(url, { headers, cache: 'no-store' });
+  if (response.status === 304 && cached) return null;
+  if (!response.ok) {
+    // e.g. no predictions yet: keep whatever the cache already shows
+    console.warn(`${url} returned ${response.status}`);
+    return null;
+  }
+
+  const entry = { url, etag: response.headers.get('ETag'), data: await response.json() };
+  await cachePut(db, entry);
+  return entry;
+}
+
+// ---------------- Chart specs ---------------- //
+// Each chart lists the series it reads, so a changed series only redraws its dependants
+const CHART_SPECS = [
+  {
     // Chart 1: Historical Observed Temperature
-    if (tempData.years && tempData.observed_c) {
-      createChart('chart1', 'line', {
+    id: 'chart1',
+    series: ['temperature'],
+    render: ({ temperature: tempData }) => {
+      if (!(tempData.years && tempData.observed_c)) return;
+      return createChart('chart1', 'line', {
         labels: tempData.years,
         values: tempData.observed_c
       }, 'Historical Observed Temperature (°C)');
     }
-
+  },
+  {
     // Chart 2: Historical Anthropogenic Temperature
-    if (tempData.years && tempData.anthropogenic_c) {
-      createChart('chart2', 'line', {
+    id: 'chart2',
+    series: ['temperature'],
+    render: ({ temperature: tempData }) => {
+      if (!(tempData.years && tempData.anthropogenic_c)) return;
+      return createChart('chart2', 'line', {
         labels: tempData.years,
         values: tempData.anthropogenic_c
       }, 'Historical Anthropogenic Temperature (°C)');
     }
-
+  },
+  {
     // Chart 3: Combined Temperature Comparison
-    if (tempData.years) {
-      createChart('chart3', 'line', {
+    id: 'chart3',
+    series: ['temperature'],
+    render: ({ temperature: tempData }) => {
+      if (!tempData.years) return;
+      return createChart('chart3', 'line', {
         labels: tempData.years,
         datasets: [
           {
@@ -93,38 +159,54 @@ async function loadCharts() {
         ]
       }, 'Temperature Comparison');
     }
-
+  },
+  {
     // Chart 4: Historical Sea Level
-    if (seaLevelData.years && seaLevelData.gmsl) {
-      createChart('chart4', 'line', {
+    id: 'chart4',
+    series: ['seaLevel'],
+    render: ({ seaLevel: seaLevelData }) => {
+      if (!(seaLevelData.years && seaLevelData.gmsl)) return;
+      return createChart('chart4', 'line', {
         labels: seaLevelData.years,
         values: seaLevelData.gmsl
       }, 'Historical Sea Level (mm)', { beginAtZero: false });
     }
-
+  },
+  {
     // Chart 5: Temperature Predictions
-    if (tempPredData.years && tempPredData.predictions) {
-      createChart('chart5', 'line', {
+    id: 'chart5',
+    series: ['temperaturePredictions'],
+    render: ({ temperaturePredictions: tempPredData }) => {
+      if (!(tempPredData.years && tempPredData.predictions)) return;
+      return createChart('chart5', 'line', {
         labels: tempPredData.years,
         values: tempPredData.predictions
       }, 'Temperature Predictions 2025-2050 (°C)', { beginAtZero: false });
     }
-
+  },
+  {
     // Chart 6: Sea Level Predictions
-    if (seaLevelPredData.years && seaLevelPredData.predictions) {
-      createChart('chart6', 'line', {
+    id: 'chart6',
+    series: ['seaLevelPredictions'],
+    render: ({ seaLevelPredictions: seaLevelPredData }) => {
+      if (!(seaLevelPredData.years && seaLevelPredData.predictions)) return;
+      return createChart('chart6', 'line', {
         labels: seaLevelPredData.years,
         values: seaLevelPredData.predictions
       }, 'Sea Level Predictions 2025-2050 (mm)', { beginAtZero: false });
     }
-
+  },
+  {
     // Chart 7: Combined Historical + Predictions Temperature
-    if (tempData.years && tempPredData.years) {
+    id: 'chart7',
+    series: ['temperature', 'temperaturePredictions'],
+    render: ({ temperature: tempData, temperaturePredictions: tempPredData }) => {
+      if (!(tempData.years && tempPredData.years)) return;
       const allYears = [...tempData.years, ...tempPredData.years];
       const allObserved = [...tempData.observed_c, ...new Array(tempPredData.years.length).fill(null)];
       const allPredictions = [...new Array(tempData.years.length).fill(null), ...tempPredData.predictions];
-      
-      createChart('chart7', 'line', {
+
+      return createChart('chart7', 'line', {
         labels: allYears,
         datasets: [
           {
@@ -145,14 +227,18 @@ async function loadCharts() {
         ]
       }, 'Temperature: Historical + Predictions');
     }
-
+  },
+  {
     // Chart 8: Combined Historical + Predictions Sea Level
-    if (seaLevelData.years && seaLevelPredData.years) {
+    id: 'chart8',
+    series: ['seaLevel', 'seaLevelPredictions'],
+    render: ({ seaLevel: seaLevelData, seaLevelPredictions: seaLevelPredData }) => {
+      if (!(seaLevelData.years && seaLevelPredData.years)) return;
       const allYears = [...seaLevelData.years, ...seaLevelPredData.years];
       const allHistorical = [...seaLevelData.gmsl, ...new Array(seaLevelPredData.years.length).fill(null)];
       const allPredictions = [...new Array(seaLevelData.years.length).fill(null), ...seaLevelPredData.predictions];
-      
-      createChart('chart8', 'line', {
+
+      return createChart('chart8', 'line', {
         labels: allYears,
         datasets: [
           {
@@ -173,29 +259,105 @@ async function loadCharts() {
         ]
       }, 'Sea Level: Historical + Predictions', { beginAtZero: false });
     }
-
+  },
+  {
     // Chart 9: Temperature Trend (all data combined)
-    if (tempData.years && tempPredData.years) {
+    id: 'chart9',
+    series: ['temperature', 'temperaturePredictions'],
+    render: ({ temperature: tempData, temperaturePredictions: tempPredData }) => {
+      if (!(tempData.years && tempPredData.years)) return;
       const allYears = [...tempData.years, ...tempPredData.years];
-      const allObserved = [...tempData.observed_c];
-      const lastObserved = tempData.observed_c[tempData.observed_c.length - 1];
-      const firstPred = tempPredData.predictions[0];
-      const allPredictions = [lastObserved, ...tempPredData.predictions];
-      const allData = [...allObserved, ...tempPredData.predictions];
-      
-      createChart('chart9', 'line', {
+      const allData = [...tempData.observed_c, ...tempPredData.predictions];
+
+      return createChart('chart9', 'line', {
         labels: allYears,
         values: allData
       }, 'Complete Temperature Trend (°C)', { beginAtZero: false });
     }
+  }
+];
+
+// Live Chart.js instances by canvas id
+const charts = {};
+
+// (Re)draw the charts that read any of the `changed` series
+function drawCharts(data, changed) {
+  for (const spec of CHART_SPECS) {
+    if (!spec.series.some(name => changed.has(name))) continue;
+    if (!spec.series.every(name => data[name])) continue;
+    if (charts[spec.id]) charts[spec.id].destroy();
+    const chart = spec.render(data);
+    if (chart) charts[spec.id] = chart;
+    else delete charts[spec.id];
+  }
+}
+
+// Cache handle and the latest cached entry ({ url, etag, data }) of each series
+let cacheDb = null;
+const entries = {};
+
+function seriesData() {
+  const data = {};
+  for (const [name, entry] of Object.entries(entries)) data[name] = entry.data;
+  return data;
+}
+
+// Revalidate `names` against the API and redraw the charts of those that changed
+async function refreshSeries(names) {
+  const fresh = await Promise.all(names.map(name => revalidate(cacheDb, SERIES[name], entries[name])));
+  const changed = new Set();
+  names.forEach((name, i) => {
+    if (fresh[i]) {
+      entries[name] = fresh[i];
+      changed.add(name);
+    }
+  });
+  drawCharts(seriesData(), changed);
+}
+
+// Render from the cache, then revalidate every series and redraw what changed
+async function loadCharts() {
+  try {
+    cacheDb = await openCache();
+    const names = Object.keys(SERIES);
+    const cached = await Promise.all(names.map(name => cacheGet(cacheDb, SERIES[name])));
+    names.forEach((name, i) => { if (cached[i]) entries[name] = cached[i]; });
+    drawCharts(seriesData(), new Set(Object.keys(entries)));
+
+    await refreshSeries(names);
 
   } catch (error) {
     console.error('Error loading charts:', error);
-    // Display error message
-    document.querySelector('.chart-grid').innerHTML = 
-      '<div style="color: white; text-align: center; padding: 20px;">Error loading data. Make sure the Flask server is running on port 5000.</div>';
+    // Keep charts drawn from the cache; only replace the grid when nothing could be shown
+    if (Object.keys(charts).length === 0) {
+      document.querySelector('.chart-grid').innerHTML = 
+        '<div style="color: white; text-align: center; padding: 20px;">Error loading data. Make sure the Flask server is running on port 5000.</div>';
+    }
   }
 }
 
-// Load charts when page loads
-loadCharts();
\ No newline at end of file
+// ---------------- Live updates ---------------- //
+// Datasets announced by /api/events and the series each one feeds
+const DATASET_SERIES = {
+  temperature: ['temperature'],
+  sea_level: ['seaLevel'],
+  future_predictions: ['temperaturePredictions'],
+  sea_level_predictions: ['seaLevelPredictions'],
+  run_predictions: ['temperaturePredictions', 'seaLevelPredictions']
+};
+
+function subscribeToUpdates() {
+  if (!window.EventSource) return;
+  // The browser reconnects on its own and resumes from the last event id
+  const events = new EventSource(`${API_BASE}/events`);
+  events.addEventListener('dataset', (message) => {
+    const { dataset } = JSON.parse(message.data);
+    const names = DATASET_SERIES[dataset];
+    if (names) {
+      refreshSeries(names).catch(error => console.error(`Error refreshing ${dataset}:`, error));
+    }
+  });
+}
+
+// Load charts when page loads, then follow new data as it is published
+loadCharts().then(subscribeToUpdates);
\ No newline at end of file
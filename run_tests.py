@@ -8,6 +8,9 @@ Usage:
     python run_tests.py --integration # Run only integration tests
     python run_tests.py --api        # Run only API tests
     python run_tests.py --coverage   # Run tests with coverage report
+    python run_tests.py --bench      # Run benchmarks and gate on the stored baseline
+    python run_tests.py --bench --update-baseline  # Record a new baseline
+    python run_tests.py --bench -k route --tolerance 0.5
 """
 
 import sys
@@ -18,6 +21,12 @@ def main():
     """Run pytest with appropriate arguments."""
     args = sys.argv[1:]
     
+    if '--bench' in args:
+        # Remaining options (-k, --repeats, --tolerance, --update-baseline) go to the suite
+        bench_args = [a for a in args if a != '--bench']
+        result = subprocess.run([sys.executable, '-m', 'benchmarks.suite'] + bench_args, cwd=Path(__file__).parent)
+        sys.exit(result.returncode)
+    
     pytest_args = []
     
     if '--unit' in args:
@@ -129,3 +129,38 @@ def app_client():
     with app.test_client() as client:
         yield client
 
+
+
+@pytest.fixture
+def trained_models(sample_temperature_data, sample_sea_level_data):
+    """Train small temperature and sea-level hybrids on the sample data."""
+    sys.path.insert(0, str(BACKEND_DIR.parent))
+    from backend.model.temprature_model import train_poly_model, train_xgb_residual
+    from backend.model.sea_level_model import train_sea_poly_model, train_sea_xgb_residual
+
+    train = sample_temperature_data[sample_temperature_data["year"] <= 2005]
+    poly = train_poly_model(train, degree=2)
+    xgb = train_xgb_residual(train, poly)
+
+    sea_train = sample_sea_level_data[sample_sea_level_data["year"] <= 2005]
+    sea_poly = train_sea_poly_model(sea_train)
+    sea_xgb = train_sea_xgb_residual(sea_train, sea_poly)
+    return poly, xgb, sea_poly, sea_xgb
+
+
+@pytest.fixture(scope="module")
+def published_db(tmp_path_factory):
+    """Database ingested from the bundled CSVs with one published run (and its model artifacts)."""
+    sys.path.insert(0, str(BACKEND_DIR.parent))
+    from backend.model.pipeline import run_stages
+    from backend.utils.create_db import ingest_sources
+    from backend.utils.data_loader import set_db_path
+
+    data_dir = tmp_path_factory.mktemp("published")
+    for csv_path in (BACKEND_DIR / "data").glob("*.csv"):
+        shutil.copy(csv_path, data_dir / csv_path.name)
+    db_path = data_dir / "climate.db"
+    ingest_sources(db_path, data_dir)
+    set_db_path(db_path)
+    run_stages({"temperature", "sea_level"})
+    return db_path
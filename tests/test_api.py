@@ -108,3 +108,138 @@ class TestAPIEndpoints:
         # Could be 404 if missing, but route should be accessible
         assert response.status_code in [200, 404]
 
+
+
+class TestConditionalRequests:
+    """Check ETag revalidation on the series endpoints."""
+
+    SERIES = [
+        '/api/temperature',
+        '/api/sea-level',
+        '/api/temperature-predictions',
+        '/api/sea-level-predictions',
+    ]
+
+    @pytest.mark.parametrize('path', SERIES)
+    def test_matching_etag_returns_304(self, app_client, path):
+        """A client revalidating with the current ETag gets an empty 304."""
+        first = app_client.get(path)
+        assert first.status_code == 200
+        etag = first.headers['ETag']
+        assert first.headers['Cache-Control'] == 'no-cache'
+
+        second = app_client.get(path, headers={'If-None-Match': etag})
+        assert second.status_code == 304
+        assert second.data == b''
+        assert second.headers['ETag'] == etag
+
+    def test_stale_etag_returns_body(self, app_client):
+        """An outdated ETag gets the full payload back."""
+        response = app_client.get('/api/temperature', headers={'If-None-Match': '"stale"'})
+        assert response.status_code == 200
+        assert 'years' in json.loads(response.data)
+
+    def test_etag_exposed_to_cross_origin_clients(self, app_client):
+        """The frontend can read the ETag when served from another origin."""
+        response = app_client.get('/api/sea-level', headers={'Origin': 'http://localhost:8000'})
+        assert 'ETag' in response.headers.get('Access-Control-Expose-Headers', '')
+
+
+@pytest.fixture
+def paged_client(tmp_path, app_client, monkeypatch):
+    """Flask test client over a small database with duplicate years and a table without one."""
+    import backend.app
+
+    db_path = tmp_path / "paged.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE run_predictions (run_id TEXT, series TEXT, year INTEGER, prediction REAL)")
+    conn.executemany(
+        "INSERT INTO run_predictions VALUES (?, ?, ?, ?)",
+        [(run, 'temperature', year, year / 1000) for year in range(2025, 2051) for run in ('a', 'b')]
+    )
+    conn.execute("CREATE TABLE backtest_metrics (fold INTEGER, rmse REAL)")
+    conn.executemany("INSERT INTO backtest_metrics VALUES (?, ?)", [(i, i * 0.1) for i in range(7)])
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(backend.app, "DB_PATH", db_path)
+    return app_client
+
+
+class TestTablePages:
+    """Check the keyset-paginated admin table endpoint."""
+
+    def _all_pages(self, client, table, **params):
+        pages, after = [], None
+        while True:
+            query = dict(params, **({'after': after} if after else {}))
+            page = client.get(f'/api/admin/tables/{table}/rows', query_string=query).get_json()
+            pages.append(page)
+            after = page['next_cursor']
+            if after is None:
+                return pages
+
+    def test_pages_cover_every_row_once(self, paged_client):
+        """Duplicate years are neither skipped nor repeated across page boundaries."""
+        pages = self._all_pages(paged_client, 'run_predictions', limit=5)
+        rows = [row for page in pages for row in page['rows']]
+
+        assert len(rows) == 52
+        assert len({(r[0], r[2]) for r in rows}) == 52
+        assert [r[2] for r in rows] == sorted(r[2] for r in rows)
+        assert pages[0]['total_rows'] == 52 and pages[1]['total_rows'] is None
+
+    def test_offset_jumps_to_window(self, paged_client):
+        """An offset page matches the sequential pages and its cursor continues from it."""
+        rows = [row for page in self._all_pages(paged_client, 'run_predictions', limit=5) for row in page['rows']]
+        url = '/api/admin/tables/run_predictions/rows'
+
+        jump = paged_client.get(url, query_string={'offset': 30, 'limit': 5}).get_json()
+        assert jump['rows'] == rows[30:35] and jump['total_rows'] is None
+        following = paged_client.get(url, query_string={'after': jump['next_cursor'], 'limit': 5}).get_json()
+        assert following['rows'] == rows[35:40]
+
+        assert paged_client.get(url, query_string={'offset': -1}).status_code == 400
+        assert paged_client.get(url, query_string={'offset': 5, 'after': jump['next_cursor']}).status_code == 400
+
+    def test_column_projection(self, paged_client):
+        """Only the requested columns come back, in the requested order."""
+        page = paged_client.get(
+            '/api/admin/tables/run_predictions/rows', query_string={'columns': 'prediction,year', 'limit': 3}
+        ).get_json()
+        assert page['columns'] == ['prediction', 'year']
+        assert page['rows'][0] == [2.025, 2025]
+
+    def test_table_without_year_uses_rowid(self, paged_client):
+        """Tables without a year column page in insertion order."""
+        pages = self._all_pages(paged_client, 'backtest_metrics', limit=3)
+        assert [r[0] for page in pages for r in page['rows']] == list(range(7))
+
+    def test_rejects_unknown_table_and_columns(self, paged_client):
+        assert paged_client.get('/api/admin/tables/nope/rows').status_code == 404
+        response = paged_client.get('/api/admin/tables/backtest_metrics/rows?columns=fold,secret')
+        assert response.status_code == 400
+        response = paged_client.get('/api/admin/tables/run_predictions/rows?after=2030')
+        assert response.status_code == 400
+        response = paged_client.get('/api/admin/tables/run_predictions/rows?after=2030,1')
+        assert response.status_code == 400
+
+    def test_without_rowid_table_pages_by_primary_key(self, paged_client, tmp_path):
+        """scenario_grid has no rowid, so its pages are keyed on (run_id, growth, ramp, year)."""
+        import numpy as np
+        from backend.utils.data_loader import save_scenario_grid, set_db_path
+
+        set_db_path(tmp_path / "paged.db")
+        grids = {"temperature": np.arange(18.0).reshape(2, 3, 3), "sea_level": np.zeros((2, 3, 3))}
+        save_scenario_grid("run-a", [0.5, 1.0], [0.0, 0.5, 1.0], [2025, 2026, 2027], grids)
+
+        pages = self._all_pages(paged_client, 'scenario_grid', limit=4)
+        rows = [row for page in pages for row in page['rows']]
+        assert len(pages) == 5 and pages[0]['total_rows'] == 18
+        assert [row[4] for row in rows] == list(range(18))
+        assert rows[0][:4] == ['run-a', 0.5, 0.0, 2025]
+
+    def test_read_database_without_rows(self, paged_client):
+        """?rows=0 returns schemas and counts for the panel without any sample rows."""
+        data = paged_client.get('/api/admin/read-database?rows=0').get_json()
+        assert data['data']['run_predictions']['sample_data'] == []
+        assert data['data']['run_predictions']['total_rows'] == 52
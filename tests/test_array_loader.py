@@ -0,0 +1,120 @@
+"""
+Tests for the pandas-free NumPy loaders.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.database]
+import sqlite3
+import subprocess
+import sys
+import numpy as np
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.utils import array_loader
+from backend.utils.array_loader import (
+    load_co2_arrays,
+    load_main_arrays,
+    load_sea_level_arrays,
+    read_table,
+)
+from backend.utils.data_loader import (
+    load_co2,
+    load_main,
+    load_sea_level,
+    set_compact_mode,
+    set_db_path,
+)
+
+
+class TestArrayLoader:
+    """Check that array loads match the DataFrame loaders."""
+
+    @pytest.mark.parametrize(
+        "arrays, frame",
+        [
+            (load_main_arrays, load_main),
+            (load_co2_arrays, load_co2),
+            (load_sea_level_arrays, load_sea_level),
+        ],
+    )
+    def test_matches_dataframe_loaders(self, temp_db, arrays, frame):
+        """Same columns, dtypes, order and values as the pandas path."""
+        set_db_path(temp_db)
+        records, df = arrays(), frame()
+
+        assert list(records.dtype.names) == list(df.columns)
+        for name in df.columns:
+            assert records[name].dtype == df[name].dtype
+            np.testing.assert_array_equal(records[name], df[name].to_numpy())
+
+    def test_sorted_by_year_and_nulls_become_nan(self, temp_db):
+        """Rows come back in year order even when stored out of order."""
+        conn = sqlite3.connect(temp_db)
+        conn.execute("CREATE TABLE shuffled (year INTEGER, value REAL)")
+        conn.executemany("INSERT INTO shuffled VALUES (?, ?)", [(2002, 2.0), (2000, None), (2001, 1.0)])
+        conn.commit()
+        conn.close()
+
+        set_db_path(temp_db)
+        records = read_table("shuffled")
+        assert records["year"].tolist() == [2000, 2001, 2002]
+        assert np.isnan(records["value"][0])
+
+    def test_compact_mode_applies(self, temp_db):
+        """Compact mode set through data_loader narrows array floats too."""
+        set_db_path(temp_db)
+        set_compact_mode(True)
+        try:
+            records = load_main_arrays()
+        finally:
+            set_compact_mode(False)
+        assert records["observed_c"].dtype == np.float32
+        assert records["year"].dtype == np.int64
+
+    def test_unknown_table_or_column(self, temp_db):
+        """Bad names raise sqlite3 errors like the SQL path would."""
+        set_db_path(temp_db)
+        with pytest.raises(sqlite3.OperationalError):
+            read_table("missing")
+        with pytest.raises(sqlite3.OperationalError):
+            read_table("temperature", columns=["year", "nope"])
+
+    def test_count_and_rows_share_a_snapshot(self, temp_db, monkeypatch):
+        """A row deleted between the count and the read does not break the load."""
+        writer = sqlite3.connect(temp_db)
+        writer.execute("PRAGMA journal_mode=WAL")
+
+        class Interleaved(sqlite3.Connection):
+            def execute(self, sql, *args):
+                cursor = super().execute(sql, *args)
+                if sql.startswith("SELECT COUNT(*)"):
+                    writer.execute("DELETE FROM temperature WHERE year = 2024")
+                    writer.commit()
+                return cursor
+
+        connect = sqlite3.connect
+        monkeypatch.setattr(
+            array_loader.sqlite3, "connect", lambda *a, **kw: connect(*a, factory=Interleaved, **kw)
+        )
+        set_db_path(temp_db)
+        try:
+            records = read_table("temperature")
+        finally:
+            writer.close()
+        assert len(records) == 175
+        assert records["year"][-1] == 2024
+
+    def test_does_not_import_pandas(self):
+        """Importing and using the module keeps pandas out of the process."""
+        code = (
+            "import sys; sys.path.insert(0, %r); "
+            "import backend.utils.array_loader; "
+            "print('pandas' in sys.modules)" % str(BACKEND_DIR.parent)
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,78 @@
+"""
+Tests for the walk-forward backtesting engine.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.model]
+import sqlite3
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.model.backtest import run_backtest, summarize_backtest
+from backend.utils.data_loader import save_backtest_results, set_db_path
+
+
+class TestBacktest:
+    """Check that rolling-origin folds are trained and scored correctly."""
+
+    def test_folds_cover_each_cutoff(self, sample_temperature_data, sample_sea_level_data):
+        """Every cutoff should produce one row per forecast year up to the horizon."""
+        results, metrics = run_backtest(
+            sample_temperature_data,
+            sample_sea_level_data,
+            cutoffs=(1990, 2000),
+            horizon=5,
+            max_workers=1,
+        )
+
+        assert set(results["model"]) == {"temperature", "sea_level"}
+        assert set(results["cutoff"]) == {1990, 2000}
+        assert results["horizon"].between(1, 5).all()
+        assert len(results) == 2 * 2 * 5
+        assert not results["predicted"].isna().any()
+
+        assert set(metrics["horizon"]) == {1, 2, 3, 4, 5}
+        assert (metrics["n_folds"] == 2).all()
+        assert (metrics["rmse"] >= metrics["mae"] - 1e-12).all()
+
+    def test_parallel_matches_sequential(self, sample_temperature_data, monkeypatch):
+        """Running folds in worker processes should not change the scores."""
+        monkeypatch.setenv("CLIMATE_CPU_BUDGET", "2")
+        kwargs = dict(cutoffs=(1995, 2005), horizon=3)
+        sequential, _ = run_backtest(sample_temperature_data, max_workers=1, **kwargs)
+        parallel, _ = run_backtest(sample_temperature_data, max_workers=2, **kwargs)
+
+        assert sequential["predicted"].tolist() == pytest.approx(parallel["predicted"].tolist())
+
+    def test_cutoffs_outside_history_rejected(self, sample_temperature_data):
+        """A backtest with no usable cutoffs should fail loudly."""
+        with pytest.raises(ValueError):
+            run_backtest(sample_temperature_data, cutoffs=(1700, 2100), max_workers=1)
+
+    def test_summarize_backtest(self, sample_temperature_data):
+        """Summary metrics should be computed per model and horizon."""
+        results, _ = run_backtest(
+            sample_temperature_data, cutoffs=(2000,), horizon=2, max_workers=1
+        )
+        metrics = summarize_backtest(results)
+
+        row = metrics[metrics["horizon"] == 1].iloc[0]
+        assert row["mae"] == pytest.approx(abs(results.loc[results["horizon"] == 1, "error"]).mean())
+
+    def test_save_backtest_results(self, temp_db, sample_temperature_data):
+        """Backtest tables should be written to the database."""
+        set_db_path(temp_db)
+        results, metrics = run_backtest(
+            sample_temperature_data, cutoffs=(2000,), horizon=2, max_workers=1
+        )
+        save_backtest_results(results, metrics)
+
+        conn = sqlite3.connect(temp_db)
+        assert conn.execute("SELECT COUNT(*) FROM backtest_results").fetchone()[0] == 2
+        assert conn.execute("SELECT COUNT(*) FROM backtest_metrics").fetchone()[0] == 2
+        conn.close()
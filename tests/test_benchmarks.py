@@ -0,0 +1,70 @@
+"""
+Tests for the benchmark suite's timing, baseline and regression gate.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit]
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.utils import data_loader
+from benchmarks import suite
+
+
+def _timing(best_s):
+    return {"best_s": best_s, "median_s": best_s, "number": 1, "repeats": 1}
+
+
+class TestGate:
+    """Check the regression comparison."""
+
+    def test_flags_only_slowdowns_beyond_tolerance(self):
+        baseline = {"fast": _timing(0.010), "slow": _timing(0.010)}
+        results = {"fast": _timing(0.012), "slow": _timing(0.020), "unknown": _timing(1.0)}
+        regressions = suite.compare(results, baseline, tolerance=0.25)
+        assert [r["name"] for r in regressions] == ["slow"]
+        assert regressions[0]["ratio"] == pytest.approx(2.0)
+
+    def test_ignores_tiny_absolute_differences(self):
+        """Doubling a 5µs case is noise, not a regression."""
+        assert suite.compare({"tiny": _timing(10e-6)}, {"tiny": _timing(5e-6)}) == []
+
+    def test_time_case_batches_fast_calls(self):
+        result = suite.time_case(lambda: None, repeats=3)
+        assert result["number"] > 1 and result["repeats"] == 3
+        assert result["best_s"] <= result["median_s"]
+
+    def test_baseline_round_trip(self, tmp_path):
+        path = tmp_path / "baseline.json"
+        assert suite.load_baseline(path) is None
+        suite.save_baseline({"case": _timing(0.5)}, path)
+        stored = suite.load_baseline(path)
+        assert stored["cases"]["case"]["best_s"] == 0.5
+        assert stored["machine"] == suite.machine()
+
+
+@pytest.mark.integration
+class TestSuiteRun:
+    """Run a slice of the real suite against its scratch database."""
+
+    def test_filtered_run_restores_paths(self):
+        import backend.app
+
+        before = (backend.app.DB_PATH, data_loader.get_db_path())
+        results = suite.run("features.", repeats=1)
+        assert set(results) == {"features.temperature_make_features", "features.sea_level_make_features"}
+        assert (backend.app.DB_PATH, data_loader.get_db_path()) == before
+
+    def test_main_gates_on_baseline(self, tmp_path, monkeypatch):
+        """A baseline far faster than reality fails the run; a fresh baseline passes."""
+        path = tmp_path / "baseline.json"
+        monkeypatch.setattr(suite, "run", lambda *args, **kwargs: {"case": _timing(0.5)})
+        assert suite.main(["--baseline", str(path)]) == 0  # Records the baseline
+        suite.save_baseline({"case": _timing(0.1)}, path)
+        assert suite.main(["--baseline", str(path)]) == 1
+        assert suite.main(["--baseline", str(path), "--tolerance", "5"]) == 0
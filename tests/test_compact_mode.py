@@ -0,0 +1,123 @@
+"""
+Tests for the float32 compact memory mode.
+
+Runs the loaders, feature store and forecasts in both precisions to check
+that compact mode stays float32 end to end, quantify the memory it saves
+and bound the numerical drift against the float64 path.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.model]
+import numpy as np
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.utils.data_loader import (
+    load_main,
+    load_co2,
+    load_sea_level,
+    merge_datasets,
+    merge_with_sea_level,
+    split_data,
+    set_compact_mode,
+    set_db_path,
+)
+from backend.model.features import sea_level_features, temperature_features
+from backend.model.temprature_model import train_poly_model, train_xgb_residual, predict_future
+from backend.model.sea_level_model import (
+    train_sea_poly_model,
+    train_sea_xgb_residual,
+    predict_sea_future,
+)
+
+
+def _run_pipeline(compact: bool) -> dict:
+    """Load, featurize and forecast in one precision, returning every stage's arrays."""
+    set_compact_mode(compact)
+    try:
+        data = merge_datasets(load_main(), load_co2())
+        sea_dataset = merge_with_sea_level(data, load_sea_level())
+        train, _, _ = split_data(data)
+        sea_train, _, _ = split_data(sea_dataset)
+
+        poly = train_poly_model(train, degree=2)
+        xgb = train_xgb_residual(train, poly)
+        years, _, _, _, anchored = predict_future(poly, xgb, data, start=2025, end=2050)
+
+        sea_poly = train_sea_poly_model(sea_train)
+        sea_xgb = train_sea_xgb_residual(sea_train, sea_poly)
+        _, _, _, sea_anchored = predict_sea_future(sea_poly, sea_xgb, sea_dataset, years, anchored)
+    finally:
+        set_compact_mode(False)
+
+    return {
+        "data": data,
+        "temp_features": temperature_features(data),
+        "sea_features": sea_level_features(sea_dataset),
+        "temp_forecast": anchored,
+        "sea_forecast": sea_anchored,
+    }
+
+
+@pytest.fixture
+def both_modes(temp_db):
+    """Run the pipeline against the test database in float64 and float32."""
+    set_db_path(temp_db)
+    return _run_pipeline(compact=False), _run_pipeline(compact=True)
+
+
+class TestCompactMode:
+    """Check dtype preservation, memory savings and drift in compact mode."""
+
+    def test_loaders_return_float32(self, temp_db):
+        """Measurement columns should be float32 while years stay integral."""
+        set_db_path(temp_db)
+        set_compact_mode(True)
+        try:
+            main_df = load_main()
+            merged = merge_datasets(main_df, load_co2())
+        finally:
+            set_compact_mode(False)
+
+        assert main_df["observed_c"].dtype == np.float32
+        assert main_df["year"].dtype.kind == "i"
+        assert merged["ln_co2_ratio"].dtype == np.float32
+
+    def test_default_mode_unchanged(self, temp_db):
+        """Without opting in, loaders keep returning float64."""
+        set_db_path(temp_db)
+        assert load_main()["observed_c"].dtype == np.float64
+
+    def test_no_upcasts_end_to_end(self, both_modes):
+        """Features and forecasts should stay float32 through every stage."""
+        _, compact = both_modes
+
+        assert compact["temp_features"].dtype == np.float32
+        assert compact["sea_features"].dtype == np.float32
+        assert compact["temp_forecast"].dtype == np.float32
+        assert compact["sea_forecast"].dtype == np.float32
+
+    def test_memory_saved(self, both_modes):
+        """Compact mode should halve feature matrices and shrink the merged frame."""
+        full, compact = both_modes
+
+        assert compact["temp_features"].nbytes * 2 == full["temp_features"].nbytes
+        assert compact["sea_features"].nbytes * 2 == full["sea_features"].nbytes
+
+        full_bytes = full["data"].memory_usage(index=False).sum()
+        compact_bytes = compact["data"].memory_usage(index=False).sum()
+        # Five of the six columns are floats; the int64 year column is unchanged
+        assert compact_bytes / full_bytes == pytest.approx(7 / 12)
+
+    def test_numerical_drift(self, both_modes):
+        """Float32 forecasts should agree with the float64 path to well below display precision."""
+        full, compact = both_modes
+
+        np.testing.assert_allclose(compact["temp_features"], full["temp_features"], rtol=1e-6, atol=1e-6)
+        assert np.max(np.abs(compact["temp_forecast"] - full["temp_forecast"])) < 1e-3
+        assert np.max(np.abs(compact["sea_forecast"] - full["sea_forecast"])) < 1e-2
@@ -121,3 +121,148 @@ class TestDataLoader:
         assert df['year'].min() == 2025
         assert df['year'].max() == 2050
 
+
+
+class TestDatasetCache:
+    """Check memoization and automatic invalidation of loaded frames."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, temp_db):
+        from backend.utils.data_loader import clear_cache
+
+        set_db_path(temp_db)
+        clear_cache()
+        yield
+        clear_cache()
+
+    def test_repeated_loads_hit(self):
+        """Second and later loads of an unchanged database come from the cache."""
+        from backend.utils.data_loader import cache_info
+
+        first = load_main()
+        second = load_main()
+
+        info = cache_info()
+        assert (info["hits"], info["misses"]) == (1, 1)
+        pd.testing.assert_frame_equal(first, second)
+        assert np.shares_memory(first["observed_c"].to_numpy(), second["observed_c"].to_numpy())
+
+    def test_cached_frames_are_read_only(self):
+        """In-place edits raise; new columns stay local to the caller's frame."""
+        df = load_co2()
+        with pytest.raises(ValueError):
+            df.loc[0, "co2_ppm"] = 0.0
+
+        df["extra"] = 1.0
+        assert "extra" not in load_co2().columns
+        assert load_co2().copy().loc[0, "co2_ppm"] != 0.0
+
+    def test_commit_from_other_connection_invalidates(self, temp_db):
+        """A write by any connection is picked up on the next load."""
+        import sqlite3
+        from backend.utils.data_loader import cache_info
+
+        before = load_sea_level()
+        conn = sqlite3.connect(temp_db)
+        conn.execute("UPDATE sea_level SET gmsl = -100 WHERE year = ?", (int(before["year"].iloc[0]),))
+        conn.commit()
+        conn.close()
+
+        after = load_sea_level()
+        assert after["gmsl"].iloc[0] == -100
+        assert cache_info()["misses"] == 2
+
+    def test_dtype_and_path_in_key(self, temp_db):
+        """Compact mode and a different database never reuse another entry."""
+        from backend.utils.data_loader import set_compact_mode
+
+        assert load_main()["observed_c"].dtype == np.float64
+        set_compact_mode(True)
+        try:
+            assert load_main()["observed_c"].dtype == np.float32
+        finally:
+            set_compact_mode(False)
+
+        set_db_path(Path(temp_db).with_name("missing.db"))
+        with pytest.raises(Exception):
+            load_main()
+
+    def test_cache_can_be_disabled(self):
+        """With the cache off every call reloads and counters stay at zero."""
+        from backend.utils.data_loader import cache_info, set_cache_enabled
+
+        set_cache_enabled(False)
+        try:
+            load_main()
+            load_main()
+            assert cache_info() == {"hits": 0, "misses": 0, "entries": 0}
+        finally:
+            set_cache_enabled(True)
+
+
+class TestQueryPushdown:
+    """Check that windowed SQL loads match the in-memory split and joins."""
+
+    @staticmethod
+    def _assert_same_split(pushed, in_memory):
+        for got, expected in zip(pushed, in_memory):
+            pd.testing.assert_frame_equal(got, expected.reset_index(drop=True), check_exact=True)
+
+    def test_split_matches_split_data(self, temp_db):
+        """Per-window queries return exactly the rows split_data keeps."""
+        from backend.utils.data_loader import load_climate_features, load_split
+
+        set_db_path(temp_db)
+        self._assert_same_split(load_split(), split_data(load_climate_features()))
+        self._assert_same_split(
+            load_split(with_sea_level=True), split_data(load_climate_features(with_sea_level=True))
+        )
+
+    def test_sql_join_matches_pandas_merge(self, temp_db):
+        """The SQL fallback join reproduces merge_datasets and merge_with_sea_level."""
+        from backend.utils.data_loader import load_climate_features
+
+        set_db_path(temp_db)
+        data = merge_datasets(load_main(), load_co2())
+        sea = merge_with_sea_level(data, load_sea_level())
+
+        pd.testing.assert_frame_equal(load_climate_features(), data, check_exact=True)
+        pd.testing.assert_frame_equal(load_climate_features(with_sea_level=True), sea, check_exact=True)
+
+    def test_window_uses_year_index(self, temp_db):
+        """Year windows are answered by an index search, not a table scan."""
+        import sqlite3
+        from backend.utils.data_loader import load_climate_features
+
+        set_db_path(temp_db)
+        window = load_climate_features(start=1990, end=1999)
+        assert window["year"].tolist() == list(range(1990, 2000))
+
+        conn = sqlite3.connect(temp_db)
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT t.year FROM temperature t "
+            "LEFT JOIN co2_concentration c ON c.year = t.year WHERE t.year >= ? AND t.year <= ?",
+            (1990, 1999),
+        ).fetchall()
+        conn.close()
+        details = [row[-1] for row in plan]
+        assert all(detail.startswith("SEARCH") for detail in details)
+
+    def test_materialized_window(self, temp_db):
+        """Windows also apply when reading the materialized features table."""
+        import shutil
+        from backend.utils.create_db import ingest_sources
+        from backend.utils.data_loader import load_climate_features, load_split
+
+        data_dir = Path(temp_db).parent
+        for csv_path in (BACKEND_DIR / "data").glob("*.csv"):
+            shutil.copy(csv_path, data_dir / csv_path.name)
+        ingest_sources(Path(temp_db), data_dir)
+        set_db_path(temp_db)
+
+        train, val, test = load_split(with_sea_level=True)
+        assert train["year"].max() <= 2005 and val["year"].between(2006, 2015).all()
+        assert test["year"].min() >= 2016 and not test["gmsl"].isna().any()
+        self._assert_same_split(
+            (train, val, test), split_data(load_climate_features(with_sea_level=True))
+        )
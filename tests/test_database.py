@@ -88,3 +88,283 @@ class TestDatabase:
         
         conn.close()
 
+
+
+class TestAtomicPredictionWrites:
+    """Check that prediction writes keep the schema and are invisible until committed."""
+
+    def _schema(self, db_path, table):
+        conn = sqlite3.connect(db_path)
+        info = conn.execute(f"PRAGMA table_info({table})").fetchall()
+        conn.close()
+        return {row[1]: row[5] for row in info}
+
+    def test_primary_key_survives_rewrites(self, temp_db):
+        """Repeated saves should keep year as the PRIMARY KEY."""
+        import numpy as np
+        from backend.utils.data_loader import save_predictions
+
+        set_db_path(temp_db)
+        years = np.arange(2025, 2051)
+        save_predictions(years, np.zeros(len(years)), table_name="future_predictions")
+        save_predictions(years, np.ones(len(years)), table_name="future_predictions")
+
+        assert self._schema(temp_db, "future_predictions")["year"] == 1
+        df = _read_table("future_predictions")
+        assert len(df) == len(years)
+        assert (df["prediction"] == 1.0).all()
+
+    def test_stale_years_removed(self, temp_db):
+        """Years missing from the new forecast should not linger."""
+        import numpy as np
+        from backend.utils.data_loader import save_predictions
+
+        set_db_path(temp_db)
+        save_predictions(np.arange(2025, 2051), np.zeros(26), table_name="future_predictions")
+        save_predictions(np.arange(2030, 2041), np.ones(11), table_name="future_predictions")
+
+        df = _read_table("future_predictions")
+        assert df["year"].tolist() == list(range(2030, 2041))
+
+    def test_legacy_table_migrated(self, temp_db):
+        """Tables created without a key (old to_sql output) are rebuilt with one."""
+        import numpy as np
+        from backend.utils.data_loader import save_predictions
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute('CREATE TABLE "future_predictions" ("year" INTEGER, "prediction" REAL)')
+        conn.execute("INSERT INTO future_predictions VALUES (1999, 0.0)")
+        conn.commit()
+        conn.close()
+
+        set_db_path(temp_db)
+        save_predictions(np.arange(2025, 2028), np.ones(3), table_name="future_predictions")
+
+        assert self._schema(temp_db, "future_predictions")["year"] == 1
+        assert _read_table("future_predictions")["year"].tolist() == [2025, 2026, 2027]
+
+    def test_reader_snapshot_not_blocked(self, temp_db):
+        """An open reader keeps its snapshot while the writer commits without waiting."""
+        import numpy as np
+        from backend.utils.data_loader import save_predictions
+
+        set_db_path(temp_db)
+        years = np.arange(2025, 2051)
+        save_predictions(years, np.zeros(len(years)), table_name="future_predictions")
+
+        reader = sqlite3.connect(temp_db, isolation_level=None)
+        reader.execute("BEGIN")
+        before = reader.execute("SELECT SUM(prediction) FROM future_predictions").fetchone()[0]
+
+        save_predictions(years, np.ones(len(years)), table_name="future_predictions")
+
+        during = reader.execute("SELECT SUM(prediction) FROM future_predictions").fetchone()[0]
+        reader.execute("COMMIT")
+        after = reader.execute("SELECT SUM(prediction) FROM future_predictions").fetchone()[0]
+        reader.close()
+
+        assert before == during == 0.0
+        assert after == len(years)
+
+    def test_failed_write_leaves_previous_forecast(self, temp_db):
+        """Invalid rows are rejected before anything touches the live table."""
+        import numpy as np
+        from backend.utils.data_loader import save_predictions
+
+        set_db_path(temp_db)
+        save_predictions(np.arange(2025, 2028), np.ones(3), table_name="future_predictions")
+
+        with pytest.raises(ValueError):
+            save_predictions([2025, 2026, 2027], [2.0, "bad", 2.0], table_name="future_predictions")
+
+        assert _read_table("future_predictions")["prediction"].tolist() == [1.0, 1.0, 1.0]
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Copy of the bundled CSV sources that tests are free to edit."""
+    import shutil
+
+    data_dir = BACKEND_DIR / "data"
+    for csv_path in data_dir.glob("*.csv"):
+        shutil.copy(csv_path, tmp_path / csv_path.name)
+    return tmp_path
+
+
+class TestIncrementalBuild:
+    """Check that rebuilds only touch sources and years that changed."""
+
+    def test_unchanged_sources_skipped(self, source_dir):
+        """A second build with identical CSVs writes nothing."""
+        from backend.utils.create_db import SOURCES, ingest_sources
+
+        db_path = source_dir / "climate.db"
+        first = ingest_sources(db_path, source_dir)
+        second = ingest_sources(db_path, source_dir)
+
+        assert all(not first[t]["skipped"] and first[t]["upserted"] == first[t]["rows_read"] for t in SOURCES)
+        assert all(second[t]["skipped"] for t in SOURCES)
+
+        conn = sqlite3.connect(db_path)
+        checksums = conn.execute("SELECT COUNT(*) FROM ingest_checksums").fetchone()[0]
+        conn.close()
+        assert checksums == 3
+
+    def test_only_changed_years_upserted(self, source_dir):
+        """Editing one row and dropping another touches just those years."""
+        from backend.utils.create_db import ingest_sources
+
+        db_path = source_dir / "climate.db"
+        ingest_sources(db_path, source_dir)
+
+        csv_path = source_dir / "co2_concentration.csv"
+        lines = csv_path.read_text().splitlines()
+        header = next(i for i, line in enumerate(lines) if line.startswith('"year"'))
+        fields = lines[header + 1].split(",")
+        fields[2] = "999.5"
+        lines[header + 1] = ",".join(fields)
+        del lines[header + 2]
+        csv_path.write_text("\n".join(lines) + "\n")
+
+        stats = ingest_sources(db_path, source_dir, chunksize=16)
+
+        assert stats["temperature"]["skipped"] and stats["sea_level"]["skipped"]
+        assert stats["co2_concentration"]["upserted"] == 1
+        assert stats["co2_concentration"]["deleted"] == 1
+
+        conn = sqlite3.connect(db_path)
+        assert conn.execute("SELECT MAX(co2_ppm) FROM co2_concentration").fetchone()[0] == 999.5
+        conn.close()
+
+    def test_legacy_tables_migrated(self, source_dir):
+        """Tables written by the old to_sql build gain the year primary key."""
+        from backend.utils.create_db import build_database
+
+        db_path = source_dir / "climate.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE sea_level (year INTEGER, gmsl REAL)")
+        conn.execute("INSERT INTO sea_level VALUES (1800, 1.0)")
+        conn.execute("CREATE INDEX idx_sea_level_year ON sea_level(year)")
+        conn.commit()
+        conn.close()
+
+        build_database(db_path, source_dir)
+
+        conn = sqlite3.connect(db_path)
+        info = conn.execute("PRAGMA table_info(sea_level)").fetchall()
+        oldest = conn.execute("SELECT MIN(year) FROM sea_level").fetchone()[0]
+        indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        conn.close()
+        assert any(row[1] == "year" and row[5] == 1 for row in info)
+        assert oldest > 1800
+        # year is the rowid, so the old secondary year indexes are dropped
+        assert not {"idx_temperature_year", "idx_co2_year", "idx_sea_level_year"} & indexes
+
+
+class TestMaterializedFeatures:
+    """Check the climate_features table built at ingest."""
+
+    def test_loader_matches_pandas_joins(self, source_dir):
+        """The one-query loader returns exactly what the pandas merges produce."""
+        import pandas as pd
+        from backend.utils.create_db import ingest_sources
+        from backend.utils.data_loader import (
+            load_climate_features,
+            load_co2,
+            load_main,
+            load_sea_level,
+            merge_datasets,
+            merge_with_sea_level,
+        )
+
+        db_path = source_dir / "climate.db"
+        ingest_sources(db_path, source_dir)
+        set_db_path(db_path)
+
+        joined = merge_datasets(load_main(), load_co2())
+        pd.testing.assert_frame_equal(load_climate_features(), joined, check_exact=True)
+
+        sea = merge_with_sea_level(joined, load_sea_level()).sort_values("year").reset_index(drop=True)
+        pd.testing.assert_frame_equal(load_climate_features(with_sea_level=True), sea, check_exact=True)
+
+    def test_sea_level_rows_without_reading_match_inner_join(self, source_dir):
+        """A sea-level year with a blank gmsl stays in, as in merge_with_sea_level, on both SQL paths."""
+        import pandas as pd
+        from backend.utils.create_db import ingest_sources
+        from backend.utils.data_loader import (
+            clear_cache,
+            load_climate_features,
+            load_co2,
+            load_main,
+            load_sea_level,
+            merge_datasets,
+            merge_with_sea_level,
+        )
+
+        csv_path = source_dir / "ClimateChangeTracker.org_Data_Download_Chart_4_8.csv"
+        lines = csv_path.read_text().splitlines()
+        row = next(i for i, line in enumerate(lines) if line.startswith('"1950"'))
+        fields = lines[row].split(",")
+        fields[1] = ""
+        lines[row] = ",".join(fields)
+        csv_path.write_text("\n".join(lines) + "\n")
+
+        db_path = source_dir / "climate.db"
+        ingest_sources(db_path, source_dir)
+        set_db_path(db_path)
+
+        expected = merge_with_sea_level(merge_datasets(load_main(), load_co2()), load_sea_level())
+        expected = expected.sort_values("year").reset_index(drop=True)
+        assert expected.loc[expected["year"] == 1950, "gmsl"].isna().all()
+
+        materialized = load_climate_features(with_sea_level=True)
+        pd.testing.assert_frame_equal(materialized, expected, check_exact=True)
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP TABLE climate_features")
+        conn.commit()
+        conn.close()
+        clear_cache()
+        pd.testing.assert_frame_equal(load_climate_features(with_sea_level=True), expected, check_exact=True)
+
+    def test_refreshed_only_when_sources_change(self, source_dir):
+        """Unchanged rebuilds leave the table alone; edits are reflected."""
+        from backend.utils.create_db import ingest_sources
+
+        db_path = source_dir / "climate.db"
+        assert ingest_sources(db_path, source_dir)["climate_features"] > 0
+        assert ingest_sources(db_path, source_dir)["climate_features"] is None
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE ingest_checksums SET checksum = 'stale' WHERE table_name = 'sea_level'")
+        conn.execute("UPDATE sea_level SET gmsl = -1 WHERE year = 2000")
+        conn.commit()
+        conn.close()
+
+        assert ingest_sources(db_path, source_dir)["climate_features"] is not None
+        conn = sqlite3.connect(db_path)
+        gmsl = conn.execute("SELECT gmsl FROM climate_features WHERE year = 2000").fetchone()[0]
+        conn.close()
+        assert gmsl != -1
+
+    def test_loader_falls_back_without_table(self, temp_db):
+        """Databases built before the table existed still load via pandas joins."""
+        from backend.utils.data_loader import load_climate_features
+
+        set_db_path(temp_db)
+        data = load_climate_features(with_sea_level=True)
+        assert {"ln_co2_ratio", "gmsl"} <= set(data.columns)
+
+    def test_api_serves_features(self, source_dir, app_client, monkeypatch):
+        """The features endpoint returns one list per column, or 404 before a build."""
+        import backend.app
+        from backend.utils.create_db import ingest_sources
+
+        db_path = source_dir / "climate.db"
+        sqlite3.connect(db_path).close()
+        monkeypatch.setattr(backend.app, "DB_PATH", db_path)
+        assert app_client.get("/api/climate-features").status_code == 404
+
+        ingest_sources(db_path, source_dir)
+        data = app_client.get("/api/climate-features").get_json()
+        assert len(data["years"]) == len(data["ln_co2_ratio"]) == len(data["gmsl"])
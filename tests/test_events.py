@@ -0,0 +1,151 @@
+"""
+Tests for the dataset version log and the Server-Sent Events stream.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.integration, pytest.mark.api]
+import json
+import queue
+import shutil
+import sqlite3
+import sys
+import numpy as np
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+import backend.app
+from backend.utils.create_db import ingest_sources
+from backend.utils.data_loader import save_predictions, set_db_path
+from backend.utils.registry import register_run
+from backend.utils.versions import versions_since
+
+YEARS = np.arange(2025, 2031)
+
+
+def _logged(db_path, version=0):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [(e["dataset"], e["run_id"]) for e in versions_since(conn, version)]
+    finally:
+        conn.close()
+
+
+def _register(run_id):
+    register_run(run_id, "abc123", predictions={"temperature": (YEARS, np.ones(len(YEARS)))})
+
+
+@pytest.fixture
+def events_client(temp_db, app_client, monkeypatch):
+    """Test client over the temporary database with a fresh, fast broadcaster."""
+    set_db_path(temp_db)
+    monkeypatch.setattr(backend.app, "DB_PATH", temp_db)
+    monkeypatch.setattr(backend.app, "EVENTS_POLL_SECONDS", 0.02)
+    monkeypatch.setattr(backend.app, "EVENTS_KEEPALIVE_SECONDS", 0.05)
+    monkeypatch.setattr(backend.app, "broadcaster", backend.app.VersionBroadcaster())
+    return app_client
+
+
+def _read_events(response, count, max_chunks=200):
+    """Parse the next ``count`` non-comment events from a streamed response."""
+    events = []
+    for _, chunk in zip(range(max_chunks), response.response):
+        text = chunk.decode() if isinstance(chunk, bytes) else chunk
+        fields = dict(line.split(": ", 1) for line in text.splitlines() if line and not line.startswith(":"))
+        if "event" in fields:
+            events.append((fields["event"], json.loads(fields["data"])))
+            if len(events) == count:
+                break
+    return events
+
+
+class TestVersionLog:
+    """Check that every writer logs its change in the same transaction."""
+
+    def test_prediction_tables_and_runs_are_logged(self, temp_db):
+        set_db_path(temp_db)
+        save_predictions(YEARS, np.ones(len(YEARS)), table_name="future_predictions")
+        _register("run-a")
+
+        assert _logged(temp_db) == [("future_predictions", None), ("run_predictions", "run-a")]
+
+    def test_ingest_logs_only_changed_tables(self, tmp_path):
+        for csv_path in (BACKEND_DIR / "data").glob("*.csv"):
+            shutil.copy(csv_path, tmp_path / csv_path.name)
+        db_path = tmp_path / "climate.db"
+
+        ingest_sources(db_path, tmp_path)
+        first = _logged(db_path)
+        assert {table for table, _ in first} == {
+            "temperature", "co2_concentration", "sea_level", "climate_features"
+        }
+
+        ingest_sources(db_path, tmp_path, force=True)  # Same content: nothing upserted
+        assert _logged(db_path) == first
+
+
+class TestBroadcaster:
+    """Check fan-out from the single poller."""
+
+    def test_poll_fans_out_to_every_subscriber(self, events_client, temp_db):
+        broadcaster = backend.app.broadcaster
+        subscribers = [queue.Queue(), queue.Queue()]
+        broadcaster._connection()
+        broadcaster._subscribers.update(subscribers)
+
+        _register("run-a")
+        events = broadcaster.poll_once()
+
+        assert [e["dataset"] for e in events] == ["run_predictions"]
+        assert all(s.get_nowait() == events[0] for s in subscribers)
+        assert broadcaster.poll_once() == []  # data_version unchanged: no query
+
+    def test_slow_subscriber_is_dropped(self, events_client):
+        broadcaster = backend.app.broadcaster
+        slow = queue.Queue(maxsize=1)
+        broadcaster._connection()
+        broadcaster._subscribers.add(slow)
+
+        _register("run-a")
+        _register("run-b")
+        broadcaster.poll_once()
+        assert not broadcaster.is_subscribed(slow)
+
+
+class TestEventStream:
+    """Check the /api/events stream end to end."""
+
+    def test_live_event_after_hello(self, events_client):
+        response = events_client.get("/api/events", buffered=False)
+        assert response.mimetype == "text/event-stream"
+        try:
+            assert _read_events(response, 1)[0][0] == "hello"
+            _register("run-a")
+            kind, event = _read_events(response, 1)[0]
+        finally:
+            response.close()
+
+        assert kind == "dataset"
+        assert event["dataset"] == "run_predictions" and event["run_id"] == "run-a"
+
+    def test_reconnect_replays_missed_events(self, events_client, temp_db):
+        save_predictions(YEARS, np.ones(len(YEARS)), table_name="future_predictions")
+        _register("run-a")
+
+        response = events_client.get("/api/events", headers={"Last-Event-ID": "1"}, buffered=False)
+        try:
+            events = _read_events(response, 2)
+        finally:
+            response.close()
+
+        assert events[0] == ("dataset", {"version": 2, "dataset": "run_predictions", "run_id": "run-a"})
+        assert events[1][0] == "hello" and events[1][1]["version"] == 2
+
+    def test_activate_endpoint_is_logged(self, events_client, temp_db):
+        _register("run-a")
+        _register("run-b")
+        assert events_client.post("/api/admin/runs/run-a/activate").status_code == 200
+        assert _logged(temp_db)[-1] == ("run_predictions", "run-a")
@@ -0,0 +1,132 @@
+"""
+Tests for the stored feature contributions and the /api/explain endpoint.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.model]
+import numpy as np
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.model.explain import sea_level_contributions, temperature_contributions
+from backend.model.features import temperature_features
+from backend.model.pipeline import run_stages
+from backend.model.sea_level_model import predict_sea_future
+from backend.model.temprature_model import predict_future
+from backend.utils.data_loader import set_db_path
+from backend.utils.registry import load_run_contributions, register_run
+
+
+def _totals(frame):
+    return frame.groupby("year")["value"].sum()
+
+
+@pytest.fixture
+def explain_client(published_db, app_client, monkeypatch):
+    import backend.app
+
+    set_db_path(published_db)
+    monkeypatch.setattr(backend.app, "DB_PATH", published_db)
+    return app_client
+
+
+class TestContributions:
+    """Check that the terms decompose the hybrid predictions."""
+
+    def test_temperature_terms_sum_to_predictions(self, sample_temperature_data, trained_models):
+        poly, xgb, _, _ = trained_models
+        years, _, _, _, anchored = predict_future(poly, xgb, sample_temperature_data, start=2025, end=2050)
+        frame = temperature_contributions(poly, xgb, sample_temperature_data, years, anchored)
+
+        forecast = frame[frame["forecast"] == 1]
+        np.testing.assert_allclose(_totals(forecast).to_numpy(), anchored, rtol=1e-5, atol=1e-5)
+
+        history = frame[frame["forecast"] == 0]
+        fitted = (poly.predict(sample_temperature_data[["year"]])
+                  + xgb.predict(temperature_features(sample_temperature_data)))
+        np.testing.assert_allclose(_totals(history).to_numpy(), fitted, rtol=1e-5, atol=1e-5)
+        assert "anchor" not in set(history["term"])
+        assert list(dict.fromkeys(forecast["term"])) == [
+            "trend", "year_c", "year_c2", "anthro_c", "anthro_f", "co2_ppm", "ln_co2_ratio", "bias", "anchor",
+        ]
+
+    def test_sea_level_terms_sum_to_predictions(self, sample_temperature_data, sample_sea_level_data,
+                                                trained_models):
+        poly, xgb, sea_poly, sea_xgb = trained_models
+        years, _, _, _, temps = predict_future(poly, xgb, sample_temperature_data, start=2025, end=2050)
+        _, _, _, anchored = predict_sea_future(sea_poly, sea_xgb, sample_sea_level_data, years, temps)
+        frame = sea_level_contributions(sea_poly, sea_xgb, sample_sea_level_data, years, temps, anchored)
+
+        forecast = frame[frame["forecast"] == 1]
+        np.testing.assert_allclose(_totals(forecast).to_numpy(), anchored, rtol=1e-5, atol=1e-4)
+        assert set(frame["component"]) == {"trend", "time", "temperature", "baseline"}
+
+    def test_history_overlapping_forecast_stored_once(self, sample_temperature_data, sample_sea_level_data,
+                                                      trained_models, temp_db):
+        """History years inside the forecast horizon are attributed as forecasts only, so the run registers."""
+        poly, xgb, sea_poly, sea_xgb = trained_models
+        years, _, _, _, temps = predict_future(poly, xgb, sample_temperature_data, start=2020, end=2030)
+        _, _, _, sea = predict_sea_future(sea_poly, sea_xgb, sample_sea_level_data, years, temps)
+        frames = {
+            "temperature": temperature_contributions(poly, xgb, sample_temperature_data, years, temps),
+            "sea_level": sea_level_contributions(sea_poly, sea_xgb, sample_sea_level_data, years, temps, sea),
+        }
+
+        for frame in frames.values():
+            assert not frame.duplicated(["year", "term"]).any()
+            assert frame.loc[frame["forecast"] == 0, "year"].max() == 2019
+        np.testing.assert_allclose(
+            _totals(frames["temperature"][frames["temperature"]["forecast"] == 1]).to_numpy(), temps,
+            rtol=1e-5, atol=1e-5,
+        )
+
+        set_db_path(temp_db)
+        register_run("overlap", "hash", {"temperature": (years, temps), "sea_level": (years, sea)},
+                     contributions=frames)
+        assert len(load_run_contributions("temperature", "overlap")) == len(frames["temperature"])
+
+
+@pytest.mark.integration
+@pytest.mark.api
+class TestExplainEndpoint:
+    """Check the stored contributions as served by /api/explain."""
+
+    def test_totals_match_served_predictions(self, explain_client):
+        body = explain_client.get("/api/explain").get_json()
+        for series, path in (("temperature", "/api/temperature-predictions"),
+                             ("sea_level", "/api/sea-level-predictions")):
+            predictions = explain_client.get(path).get_json()
+            explained = body[series]
+            start = explained["years"].index(explained["forecast_start"])
+            assert explained["years"][start:] == predictions["years"]
+            np.testing.assert_allclose(explained["total"][start:], predictions["predictions"], atol=1e-4)
+            np.testing.assert_allclose(
+                np.sum(list(explained["components"].values()), axis=0), explained["total"], atol=1e-6
+            )
+
+        components = body["temperature"]["components"]
+        assert set(components) == {"trend", "time", "anthropogenic", "co2", "baseline"}
+        assert body["run_id"] == explain_client.get("/api/temperature-predictions").get_json()["run_id"]
+
+    def test_conditional_and_filtered(self, explain_client):
+        first = explain_client.get("/api/explain")
+        assert first.headers["Cache-Control"] == "no-cache"
+        assert explain_client.get("/api/explain", headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+
+        sea_only = explain_client.get("/api/explain?series=sea_level").get_json()
+        assert set(sea_only) == {"run_id", "sea_level"}
+        assert explain_client.get("/api/explain?series=rainfall").status_code == 400
+        assert explain_client.get("/api/explain?run=missing").status_code == 404
+
+    def test_sea_level_rerun_keeps_temperature_contributions(self, published_db):
+        set_db_path(published_db)
+        before = load_run_contributions("temperature")
+        result = run_stages({"sea_level"})
+        after = load_run_contributions("temperature", result["run_id"])
+        assert len(after) == len(before) > 0
+        np.testing.assert_allclose(after["value"], before["value"])
@@ -0,0 +1,106 @@
+"""
+Tests for the per-series fan-out trainer.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.model]
+import sqlite3
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.model.fanout import train_series
+from backend.utils.data_loader import set_db_path
+
+
+def _long_format(df, offsets):
+    """Stack copies of ``df`` as separate series, each shifted by its offset."""
+    frames = []
+    for series_id, offset in offsets.items():
+        frame = df.copy()
+        frame["observed_c"] += offset
+        frame["series_id"] = series_id
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+class TestFanout:
+    """Check that one model is trained and stored per series."""
+
+    def test_one_forecast_per_series(self, temp_db, sample_temperature_data):
+        """Each series gets a full forecast, written to the keyed table."""
+        set_db_path(temp_db)
+        long_df = _long_format(sample_temperature_data, {"north": 0.0, "south": 1.0, "west": 2.0})
+
+        predictions, errors, stats = train_series(long_df, start=2025, end=2030, max_workers=1)
+
+        assert errors == {}
+        assert stats["trained"] == 3
+        assert stats["series_per_minute"] > 0
+        assert len(predictions) == 3 * 6
+
+        conn = sqlite3.connect(temp_db)
+        rows = conn.execute(
+            "SELECT series_id, COUNT(*) FROM series_predictions GROUP BY series_id"
+        ).fetchall()
+        conn.close()
+        assert dict(rows) == {"north": 6, "south": 6, "west": 6}
+
+        # Offsets survive the anchored forecast, so the series stay distinct
+        first = predictions.groupby("series_id")["prediction"].first()
+        assert first["south"] > first["north"]
+
+    def test_parallel_matches_sequential(self, sample_temperature_data, monkeypatch):
+        """Chunked worker processes produce the same forecasts as one process."""
+        monkeypatch.setenv("CLIMATE_CPU_BUDGET", "2")
+        long_df = _long_format(sample_temperature_data, {"a": 0.0, "b": 0.5, "c": 1.0})
+        kwargs = dict(start=2025, end=2027, table_name=None)
+
+        sequential, _, _ = train_series(long_df, max_workers=1, **kwargs)
+        parallel, _, stats = train_series(long_df, max_workers=2, chunksize=2, **kwargs)
+
+        assert stats["workers"] == 2
+        assert parallel["prediction"].tolist() == pytest.approx(sequential["prediction"].tolist())
+
+    def test_reports_pool_size_not_series_count(self, sample_temperature_data, monkeypatch):
+        """Three series in one chunk run on one worker, however many cores there are."""
+        monkeypatch.setenv("CLIMATE_CPU_BUDGET", "4")
+        long_df = _long_format(sample_temperature_data, {"a": 0.0, "b": 0.5, "c": 1.0})
+
+        _, _, stats = train_series(long_df, start=2025, end=2026, chunksize=3, table_name=None)
+
+        assert stats["workers"] == 1
+
+    def test_failed_series_are_reported(self, sample_temperature_data):
+        """A series with no training history is reported without stopping the rest."""
+        long_df = _long_format(sample_temperature_data, {"good": 0.0})
+        short = sample_temperature_data[sample_temperature_data["year"] > 2010].copy()
+        short["series_id"] = "short"
+        long_df = pd.concat([long_df, short], ignore_index=True)
+
+        predictions, errors, stats = train_series(
+            long_df, start=2025, end=2026, max_workers=1, table_name=None
+        )
+
+        assert set(errors) == {"short"}
+        assert set(predictions["series_id"]) == {"good"}
+        assert stats["failed"] == 1
+
+    def test_sea_level_needs_future_temps(self, sample_sea_level_data):
+        """Sea-level fan-out requires the temperature path it is driven by."""
+        long_df = sample_sea_level_data.assign(series_id="tide")
+        with pytest.raises(ValueError):
+            train_series(long_df, kind="sea_level", table_name=None)
+
+        predictions, errors, _ = train_series(
+            long_df, kind="sea_level", start=2025, end=2027,
+            future_temps=np.array([1.2, 1.3, 1.4]), max_workers=1, table_name=None,
+        )
+        assert errors == {}
+        assert len(predictions) == 3
@@ -0,0 +1,112 @@
+"""
+Tests for the shared feature store.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.model]
+import numpy as np
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.model.features import (
+    FeatureStore,
+    SEA_LEVEL_FEATURES,
+    TEMPERATURE_FEATURES,
+    sea_level_features,
+    temperature_features,
+)
+
+
+class TestFeatureStore:
+    """Check that feature matrices are built once and served consistently."""
+
+    def test_temperature_features_values(self, sample_temperature_data):
+        """The temperature matrix should hold the engineered columns in order."""
+        X = temperature_features(sample_temperature_data)
+
+        assert X.shape == (len(sample_temperature_data), len(TEMPERATURE_FEATURES))
+        assert X.flags.c_contiguous
+        year_c = sample_temperature_data["year"].values - 2000.0
+        np.testing.assert_allclose(X[:, 0], year_c)
+        np.testing.assert_allclose(X[:, 1], year_c**2)
+        np.testing.assert_allclose(X[:, 5], sample_temperature_data["ln_co2_ratio"].values)
+
+    def test_sea_level_features_values(self, sample_sea_level_data):
+        """The sea-level matrix should carry temperature and its square."""
+        X = sea_level_features(sample_sea_level_data)
+
+        assert X.shape == (len(sample_sea_level_data), len(SEA_LEVEL_FEATURES))
+        temp = sample_sea_level_data["observed_c"].values
+        np.testing.assert_allclose(X[:, 2], temp)
+        np.testing.assert_allclose(X[:, 3], temp**2)
+
+    def test_same_content_hits_cache(self, sample_temperature_data):
+        """Equal data, even in a different container, should reuse the cached matrix."""
+        store = FeatureStore()
+        first = store.matrix(sample_temperature_data, TEMPERATURE_FEATURES)
+        second = store.matrix(
+            {c: sample_temperature_data[c].values for c in sample_temperature_data},
+            TEMPERATURE_FEATURES,
+        )
+
+        assert first is second
+        assert store.hits == 1
+        assert store.misses == 1
+
+    def test_changed_content_misses_cache(self, sample_temperature_data):
+        """A new dataset version should produce a fresh matrix."""
+        store = FeatureStore()
+        store.matrix(sample_temperature_data, TEMPERATURE_FEATURES)
+
+        changed = sample_temperature_data.copy()
+        changed.loc[0, "co2_ppm"] += 1.0
+        X = store.matrix(changed, TEMPERATURE_FEATURES)
+
+        assert store.misses == 2
+        assert X[0, 4] == changed.loc[0, "co2_ppm"]
+
+    def test_column_subsets_share_one_build(self, sample_sea_level_data):
+        """Different column subsets of one dataset come from a single cached build."""
+        store = FeatureStore()
+        store.matrix(sample_sea_level_data, SEA_LEVEL_FEATURES)
+        subset = store.matrix(sample_sea_level_data, ("temp", "year_c"))
+
+        assert store.misses == 1
+        assert subset.shape == (len(sample_sea_level_data), 2)
+        np.testing.assert_allclose(subset[:, 1], sample_sea_level_data["year"].values - 2000.0)
+
+    def test_matrices_are_read_only(self, sample_temperature_data):
+        """Cached matrices must not be mutated by callers."""
+        X = temperature_features(sample_temperature_data)
+        with pytest.raises(ValueError):
+            X[0, 0] = 1.0
+
+    def test_missing_source_column(self, sample_sea_level_data):
+        """Requesting features the data cannot support should raise KeyError."""
+        with pytest.raises(KeyError):
+            temperature_features(sample_sea_level_data)
+
+    def test_cache_is_bounded(self, sample_temperature_data):
+        """The store should evict old dataset versions beyond max_entries."""
+        store = FeatureStore(max_entries=2)
+        for offset in range(3):
+            shifted = sample_temperature_data.assign(co2_ppm=sample_temperature_data["co2_ppm"] + offset)
+            store.matrix(shifted, TEMPERATURE_FEATURES)
+
+        assert len(store._entries) == 2
+
+    def test_concurrent_lookups_build_once(self, sample_temperature_data):
+        """Threads asking for the same matrix share one entry and one subset."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        store = FeatureStore()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: store.matrix(sample_temperature_data, TEMPERATURE_FEATURES), range(32)))
+
+        assert all(result is results[0] for result in results)
+        assert store.misses == 1 and store.hits == 31
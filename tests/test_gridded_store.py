@@ -0,0 +1,100 @@
+"""
+Tests for the memory-mapped regional/gridded dataset store.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.database]
+import numpy as np
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.utils.gridded_store import GriddedStore
+from backend.utils.data_loader import load_gridded, set_db_path
+
+REGIONS = np.array([30, 10, 20, 40, 50])
+YEARS = np.arange(1950, 2025)
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A small store filled with value = region * 1000 + year offset, written in chunks."""
+    store = GriddedStore.create(tmp_path / "regional", REGIONS, YEARS, {"tas": "float32"})
+    rr, yy = np.meshgrid(REGIONS, YEARS, indexing="ij")
+    values = rr * 1000 + (yy - 1950)
+    for chunk in np.array_split(np.arange(rr.size), 4):
+        store.write("tas", rr.ravel()[chunk], yy.ravel()[chunk], values.ravel()[chunk])
+    return store
+
+
+class TestGriddedStore:
+    """Check layout, slicing and zero-copy behaviour."""
+
+    def test_create_layout(self, store):
+        """Regions are sorted and each variable is a (regions, years) array."""
+        assert store.regions.tolist() == [10, 20, 30, 40, 50]
+        assert store.years[0] == 1950 and store.years[-1] == 2024
+        assert store.load("tas").shape == (5, len(YEARS))
+        assert store.load("tas").dtype == np.float32
+
+    def test_year_range_slice(self, store):
+        """Year windows are inclusive and clipped to the stored range."""
+        window = store.load("tas", start=2000, end=2004)
+        assert window.shape == (5, 5)
+        assert window[0].tolist() == [10050, 10051, 10052, 10053, 10054]
+
+        clipped = store.load("tas", start=2020, end=2100)
+        assert clipped.shape == (5, 5)
+
+    def test_region_block_is_zero_copy(self, store):
+        """A contiguous block of regions over a year window is a view of the map."""
+        full = store._array("tas")
+        block = store.load("tas", regions=(20, 40), start=1990, end=2000)
+
+        assert block.shape == (3, 11)
+        assert np.shares_memory(block, full)
+        assert block[1, 0] == 30040
+
+    def test_region_list_gather(self, store):
+        """Arbitrary regions are gathered in the requested order."""
+        picked = store.load("tas", regions=[50, 10], start=1950, end=1951)
+        assert picked.tolist() == [[50000, 50001], [10000, 10001]]
+
+    def test_views_are_read_only(self, store):
+        """Loaded slices must not allow writes back into the file."""
+        with pytest.raises(ValueError):
+            store.load("tas")[0, 0] = 1.0
+
+    def test_unknown_region_and_variable(self, store):
+        """Unknown ids and variables raise KeyError; out-of-range years ValueError."""
+        with pytest.raises(KeyError):
+            store.load("tas", regions=[99])
+        with pytest.raises(KeyError):
+            store.load("precip")
+        with pytest.raises(ValueError):
+            store.write("tas", [10], [1900], [1.0])
+
+    def test_reopen_from_disk(self, store):
+        """A new store on the same directory sees the persisted values."""
+        reopened = GriddedStore(store.root)
+        assert reopened.load("tas", regions=[40], start=2024, end=2024).tolist() == [[40074]]
+
+    def test_unwritten_cells_are_nan(self, tmp_path):
+        """Cells never written stay missing."""
+        store = GriddedStore.create(tmp_path / "empty", [1, 2], [2000, 2001], {"tas": "float32"})
+        store.write("tas", [1], [2000], [0.5])
+        data = store.load("tas")
+        assert data[0, 0] == 0.5
+        assert np.isnan(data[1]).all()
+
+    def test_load_gridded_next_to_database(self, temp_db):
+        """The data_loader entry point finds datasets beside the SQLite file."""
+        set_db_path(temp_db)
+        store = GriddedStore.create(temp_db.parent / "gridded" / "stations", [7], [2000], {"tas": "float32"})
+        store.write("tas", [7], [2000], [1.25])
+
+        assert load_gridded("stations", "tas").tolist() == [[1.25]]
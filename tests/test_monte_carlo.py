@@ -0,0 +1,90 @@
+"""
+Tests for the Monte Carlo forecast paths.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.model]
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.model.temprature_model import predict_future
+from backend.model.monte_carlo import (
+    _temperature_paths,
+    co2_growth_prior,
+    quantile_fan,
+    sample_scenarios,
+    simulate_future,
+)
+
+
+class TestMonteCarlo:
+    """Check sampling, batching and fan summaries."""
+
+    def test_sample_scenarios_reproducible(self, sample_temperature_data):
+        """The same seed should reproduce the same scenario draws."""
+        a = sample_scenarios(sample_temperature_data, 100, seed=7)
+        b = sample_scenarios(sample_temperature_data, 100, seed=7)
+
+        np.testing.assert_array_equal(a[0], b[0])
+        np.testing.assert_array_equal(a[1], b[1])
+        assert a[0].shape == (100,)
+
+    def test_central_path_matches_predict_future(self, sample_temperature_data, trained_models):
+        """A path at the fitted growth rate and +0.5 ramp reproduces predict_future."""
+        poly, xgb, _, _ = trained_models
+        years, _, poly_pred, hybrid, _ = predict_future(
+            poly, xgb, sample_temperature_data, start=2025, end=2050
+        )
+        slope, _ = co2_growth_prior(sample_temperature_data)
+
+        resid = _temperature_paths(
+            xgb, sample_temperature_data, years, np.array([slope]), np.array([0.5])
+        )
+
+        np.testing.assert_allclose(resid[0], hybrid - poly_pred, rtol=1e-5, atol=1e-6)
+
+    def test_simulate_future_fans(self, sample_temperature_data, sample_sea_level_data, trained_models):
+        """Fans should cover every year with ordered quantiles."""
+        poly, xgb, sea_poly, sea_xgb = trained_models
+        years, temp_fan, sea_fan, stats = simulate_future(
+            poly, xgb, sample_temperature_data, 2025, 2050,
+            sea_poly, sea_xgb, sample_sea_level_data,
+            n_paths=300, chunk_size=128,
+        )
+
+        assert len(years) == 26
+        for fan in (temp_fan, sea_fan):
+            assert list(fan["year"]) == list(years)
+            assert (fan["q05"] <= fan["q50"]).all()
+            assert (fan["q50"] <= fan["q95"]).all()
+            assert not fan.isna().any().any()
+        assert stats["n_paths"] == 300
+        assert stats["paths_per_second"] > 0
+
+    def test_chunking_does_not_change_results(self, sample_temperature_data, trained_models):
+        """Chunk size only bounds memory; it must not change the fans."""
+        poly, xgb, _, _ = trained_models
+        _, small, _, _ = simulate_future(
+            poly, xgb, sample_temperature_data, 2025, 2035, n_paths=200, chunk_size=17
+        )
+        _, large, sea_fan, _ = simulate_future(
+            poly, xgb, sample_temperature_data, 2025, 2035, n_paths=200, chunk_size=200
+        )
+
+        pd.testing.assert_frame_equal(small, large)
+        assert sea_fan is None
+
+    def test_quantile_fan(self):
+        """Quantile columns should be labelled by percentile."""
+        paths = np.arange(20, dtype=float).reshape(10, 2)
+        fan = quantile_fan([2025, 2026], paths, quantiles=(0.5,))
+
+        assert list(fan.columns) == ["year", "q50", "mean"]
+        assert fan["q50"].tolist() == pytest.approx([9.0, 10.0])
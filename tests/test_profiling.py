@@ -0,0 +1,111 @@
+"""
+Tests for the per-stage pipeline profiler and the profiles endpoint.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.database]
+import pstats
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.model.pipeline import _timed
+from backend.utils.data_loader import set_db_path
+from backend.utils.profiling import PipelineProfiler, save_profile, set_profiler
+
+
+def _allocate(megabytes):
+    """Hold a Python allocation of roughly ``megabytes`` briefly."""
+    block = bytearray(megabytes * 2**20)
+    return len(block)
+
+
+@pytest.fixture
+def profiler():
+    profiler = PipelineProfiler(trace_memory=True)
+    set_profiler(profiler)
+    yield profiler
+    set_profiler(None)
+
+
+class TestProfiler:
+    """Check what each stage records."""
+
+    def test_stages_recorded_through_timed(self, profiler):
+        """Pipeline stages report to the installed profiler and still fill ``timings``."""
+        timings = {}
+        with _timed(timings, "load"):
+            _allocate(1)
+        with _timed(timings, "train"):
+            _allocate(8)
+
+        assert [s["stage"] for s in profiler.stages] == ["load", "train"]
+        assert set(timings) == {"load", "train"}
+        load, train = profiler.stages
+        assert train["py_peak_mb"] >= 8 > load["py_peak_mb"]  # Peak is reset per stage
+        assert train["wall_s"] >= 0 and train["cpu_s"] >= 0
+        assert train["memory_traced"] and "times include tracemalloc overhead" in profiler.summary()
+
+    def test_timing_pass_does_not_trace(self):
+        """By default only time and RSS are measured; tracemalloc stays off."""
+        import tracemalloc
+
+        profiler = PipelineProfiler()
+        with profiler.stage("train"):
+            assert not tracemalloc.is_tracing()
+            _allocate(1)
+
+        record = profiler.stages[0]
+        assert record["py_peak_mb"] is None and not record["memory_traced"]
+        if record["rss_mb"] is not None:
+            # Change over the stage, not the process-lifetime high-water mark
+            assert abs(record["rss_delta_mb"]) < record["rss_mb"]
+
+    def test_no_profiler_only_times(self):
+        timings = {}
+        with _timed(timings, "load"):
+            pass
+        assert set(timings) == {"load"}
+
+    def test_nested_stage_folds_into_outer(self, profiler):
+        with profiler.stage("outer"):
+            with profiler.stage("inner"):
+                _allocate(1)
+        assert [s["stage"] for s in profiler.stages] == ["outer"]
+
+    def test_cprofile_dump_per_stage(self, tmp_path):
+        profiler = PipelineProfiler(profile_dir=tmp_path / "prof")
+        with profiler.stage("fit"):
+            sorted(range(1000), key=lambda v: -v)
+
+        path = Path(profiler.stages[0]["profile_path"])
+        assert path.name == "00_fit.prof"
+        assert pstats.Stats(str(path)).total_calls > 0
+
+
+class TestStoredProfiles:
+    """Check persistence and the admin endpoint."""
+
+    def test_profiles_endpoint_groups_runs(self, temp_db, app_client, monkeypatch):
+        import backend.app
+
+        set_db_path(temp_db)
+        monkeypatch.setattr(backend.app, "DB_PATH", temp_db)
+        assert app_client.get("/api/admin/profiles").get_json()["profiles"] == []
+
+        for run_id in ("run-a", "run-b"):
+            profiler = PipelineProfiler(trace_memory=False)
+            for stage in ("load", "temperature_xgb"):
+                with profiler.stage(stage):
+                    pass
+            assert save_profile(run_id, profiler) == 2
+
+        profiles = app_client.get("/api/admin/profiles?limit=1").get_json()["profiles"]
+        assert len(profiles) == 1 and profiles[0]["run_id"] == "run-b"
+        assert [s["stage"] for s in profiles[0]["stages"]] == ["load", "temperature_xgb"]
+        assert profiles[0]["stages"][0]["py_peak_mb"] is None
+        assert profiles[0]["stages"][0]["memory_traced"] is False
@@ -0,0 +1,148 @@
+"""
+Tests for the conditional-GET source refresher, against a local stand-in server.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.integration, pytest.mark.database]
+import hashlib
+import sqlite3
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.utils.create_db import SOURCES
+from backend.utils.refresh import refresh_sources
+
+LAST_MODIFIED = "Tue, 17 Jun 2025 09:26:00 GMT"
+
+
+class _Upstream:
+    """Serves CSV bodies by path, honouring ETag/Last-Modified validators."""
+
+    def __init__(self):
+        self.bodies = {}
+        self.validators = True
+        self.requests = []
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                upstream.requests.append((self.path, dict(self.headers)))
+                body = upstream.bodies.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                etag = '"%s"' % hashlib.md5(body).hexdigest()
+                if upstream.validators and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/csv")
+                self.send_header("Content-Length", str(len(body)))
+                if upstream.validators:
+                    self.send_header("ETag", etag)
+                    self.send_header("Last-Modified", LAST_MODIFIED)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def url(self, table):
+        return f"http://127.0.0.1:{self.server.server_port}/{table}.csv"
+
+
+@pytest.fixture
+def upstream():
+    """Local server preloaded with the bundled CSVs."""
+    server = _Upstream()
+    for table, (filename, _) in SOURCES.items():
+        server.bodies[f"/{table}.csv"] = (BACKEND_DIR / "data" / filename).read_bytes()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+@pytest.fixture
+def urls(upstream):
+    return {table: upstream.url(table) for table in SOURCES}
+
+
+class TestRefresh:
+    """Check conditional fetching and incremental ingest of remote sources."""
+
+    def test_first_fetch_then_not_modified(self, tmp_path, upstream, urls):
+        """The first refresh ingests everything; the next one is all 304s."""
+        first = refresh_sources(data_dir=tmp_path, urls=urls)
+        assert all(first[table]["status"] == "updated" for table in SOURCES)
+        assert first["climate_features"] > 0
+        for filename, _ in SOURCES.values():
+            assert (tmp_path / filename).read_bytes() == (BACKEND_DIR / "data" / filename).read_bytes()
+
+        second = refresh_sources(data_dir=tmp_path, urls=urls)
+        assert all(second[table]["status"] == "not_modified" for table in SOURCES)
+        assert second["climate_features"] is None
+        sent = [headers for _, headers in upstream.requests[-len(SOURCES):]]
+        assert all("If-None-Match" in headers and "If-Modified-Since" in headers for headers in sent)
+
+    def test_only_changed_rows_ingested(self, tmp_path, upstream, urls):
+        """An upstream edit to one row upserts exactly that year."""
+        refresh_sources(data_dir=tmp_path, urls=urls)
+
+        body = upstream.bodies["/co2_concentration.csv"].decode()
+        upstream.bodies["/co2_concentration.csv"] = body.replace("\n2024,3290,422.8", "\n2024,3290,500.0").encode()
+
+        result = refresh_sources(data_dir=tmp_path, urls=urls)
+        assert result["co2_concentration"]["status"] == "updated"
+        assert result["co2_concentration"]["upserted"] == 1
+        assert result["temperature"]["status"] == "not_modified"
+
+        conn = sqlite3.connect(tmp_path / "climate.db")
+        ppm, ln_ratio = conn.execute(
+            "SELECT co2_ppm, ln_co2_ratio FROM climate_features WHERE year = 2024"
+        ).fetchone()
+        conn.close()
+        assert ppm == 500.0 and ln_ratio > 0.5
+
+    def test_without_validators_uses_checksum(self, tmp_path, upstream, urls):
+        """Servers without ETag/Last-Modified still skip identical content."""
+        upstream.validators = False
+        refresh_sources(data_dir=tmp_path, urls=urls)
+        second = refresh_sources(data_dir=tmp_path, urls=urls)
+        assert all(second[table]["status"] == "unchanged" for table in SOURCES)
+
+    def test_failed_source_does_not_block_others(self, tmp_path, upstream, urls):
+        """A 404 is reported, the other sources are ingested, no partial files remain."""
+        urls["sea_level"] = urls["sea_level"].replace("sea_level", "missing")
+        result = refresh_sources(data_dir=tmp_path, urls=urls)
+
+        assert result["sea_level"]["status"] == "error"
+        assert result["temperature"]["status"] == "updated"
+        assert not list(tmp_path.glob("*.part"))
+
+    def test_failed_ingest_removes_downloads(self, tmp_path, upstream, urls):
+        """An error after the downloads leaves neither partial files nor replaced CSVs."""
+        upstream.bodies["/co2_concentration.csv"] = b'"year","unexpected"\n2024,1\n'
+        with pytest.raises(ValueError, match="ppm"):
+            refresh_sources(data_dir=tmp_path, urls=urls)
+
+        assert not list(tmp_path.glob("*.part"))
+        assert not list(tmp_path.glob("*.csv"))
+
+    def test_requires_configured_urls(self, tmp_path, monkeypatch):
+        """Without URLs (arguments or environment) nothing is fetched."""
+        for env in ("CLIMATE_TEMPERATURE_URL", "CLIMATE_CO2_URL", "CLIMATE_SEA_LEVEL_URL"):
+            monkeypatch.delenv(env, raising=False)
+        with pytest.raises(ValueError):
+            refresh_sources(data_dir=tmp_path)
@@ -0,0 +1,173 @@
+"""
+Tests for the versioned model registry and run-aware prediction endpoints.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.database]
+import json
+import numpy as np
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.utils.data_loader import set_db_path
+from backend.utils.registry import (
+    activate_run,
+    hash_datasets,
+    list_runs,
+    load_run_predictions,
+    register_run,
+    save_artifacts,
+)
+
+YEARS = np.arange(2025, 2031)
+
+
+def _register(run_id, offset, activate=True):
+    """Register a run whose predictions are shifted by ``offset``."""
+    return register_run(
+        run_id,
+        "abc123",
+        predictions={
+            "temperature": (YEARS, np.linspace(1.5, 2.0, len(YEARS)) + offset),
+            "sea_level": (YEARS, np.linspace(20, 25, len(YEARS)) + offset),
+        },
+        params={"xgb": {"n_estimators": 10, "missing": float("nan"), "callbacks": None}},
+        metrics={"temperature_val": {"rmse": 0.1}},
+        timings={"train": 1.5},
+        activate=activate,
+    )
+
+
+@pytest.fixture
+def registry_client(temp_db, app_client, monkeypatch):
+    """Flask test client reading from the temporary database."""
+    import backend.app
+
+    set_db_path(temp_db)
+    monkeypatch.setattr(backend.app, "DB_PATH", temp_db)
+    return app_client
+
+
+class TestRegistry:
+    """Check run bookkeeping and active-run switching."""
+
+    def test_register_and_list_runs(self, temp_db):
+        """Registered runs keep their metadata and the newest is active."""
+        set_db_path(temp_db)
+        _register("run-a", 0.0)
+        _register("run-b", 1.0)
+
+        runs = list_runs()
+        assert set(runs["run_id"]) == {"run-a", "run-b"}
+        active = runs.loc[runs["active"] == 1, "run_id"].tolist()
+        assert active == ["run-b"]
+
+        params = json.loads(runs.loc[runs["run_id"] == "run-a", "params"].iloc[0])
+        assert params == {"xgb": {"n_estimators": 10}}
+
+    def test_predictions_are_kept_per_run(self, temp_db):
+        """Registering a new run must not destroy the previous forecast."""
+        set_db_path(temp_db)
+        _register("run-a", 0.0)
+        _register("run-b", 1.0)
+
+        old = load_run_predictions("temperature", "run-a")
+        new = load_run_predictions("temperature")
+
+        assert len(old) == len(YEARS)
+        assert new["prediction"].values == pytest.approx(old["prediction"].values + 1.0)
+
+    def test_activate_run(self, temp_db):
+        """Flipping the pointer changes which run is served by default."""
+        set_db_path(temp_db)
+        _register("run-a", 0.0)
+        _register("run-b", 1.0)
+
+        activate_run("run-a")
+        default = load_run_predictions("sea_level")
+        assert default["prediction"].iloc[0] == pytest.approx(20.0)
+
+        with pytest.raises(KeyError):
+            activate_run("missing")
+
+    def test_inactive_registration(self, temp_db):
+        """Runs registered with activate=False leave the pointer alone."""
+        set_db_path(temp_db)
+        _register("run-a", 0.0)
+        _register("run-b", 1.0, activate=False)
+
+        runs = list_runs()
+        assert runs.loc[runs["active"] == 1, "run_id"].tolist() == ["run-a"]
+
+    def test_hash_datasets(self, sample_temperature_data):
+        """Equal data hashes equally; any change alters the hash."""
+        same = hash_datasets(sample_temperature_data.copy())
+        assert hash_datasets(sample_temperature_data) == same
+
+        changed = sample_temperature_data.copy()
+        changed.loc[0, "observed_c"] += 0.01
+        assert hash_datasets(changed) != same
+
+    def test_save_artifacts(self, tmp_path, sample_temperature_data):
+        """XGBoost models are saved natively, other models via joblib."""
+        from backend.model.temprature_model import train_poly_model, train_xgb_residual
+
+        train = sample_temperature_data[sample_temperature_data["year"] <= 2005]
+        poly = train_poly_model(train)
+        xgb = train_xgb_residual(train, poly)
+
+        run_dir = save_artifacts("run-x", {"poly": poly, "xgb": xgb}, root=tmp_path)
+        assert (run_dir / "poly.joblib").exists()
+        assert (run_dir / "xgb.json").exists()
+
+
+class TestRunEndpoints:
+    """Check that the API serves the active run and honours ?run=."""
+
+    def test_legacy_table_without_registry(self, registry_client, temp_db):
+        """Databases with no registered runs fall back to the latest-run table."""
+        from backend.utils.data_loader import save_predictions
+
+        save_predictions(YEARS, np.ones(len(YEARS)), table_name="future_predictions")
+        data = registry_client.get("/api/temperature-predictions").get_json()
+
+        assert data["run_id"] is None
+        assert data["predictions"] == [1.0] * len(YEARS)
+
+    def test_active_run_and_run_parameter(self, registry_client):
+        """The active run is the default; ?run= selects any other run."""
+        _register("run-a", 0.0)
+        _register("run-b", 1.0)
+
+        default = registry_client.get("/api/sea-level-predictions").get_json()
+        assert default["run_id"] == "run-b"
+        assert default["predictions"][0] == pytest.approx(21.0)
+
+        older = registry_client.get("/api/sea-level-predictions?run=run-a").get_json()
+        assert older["run_id"] == "run-a"
+        assert older["predictions"][0] == pytest.approx(20.0)
+
+        missing = registry_client.get("/api/temperature-predictions?run=nope")
+        assert missing.status_code == 404
+
+    def test_runs_listing_and_activation(self, registry_client):
+        """Admins can list runs and flip the active pointer over the API."""
+        _register("run-a", 0.0)
+        _register("run-b", 1.0)
+
+        listing = registry_client.get("/api/admin/runs").get_json()
+        assert listing["active_run"] == "run-b"
+        assert {r["run_id"] for r in listing["runs"]} == {"run-a", "run-b"}
+        assert listing["runs"][0]["timings"] == {"train": 1.5}
+
+        response = registry_client.post("/api/admin/runs/run-a/activate")
+        assert response.status_code == 200
+        data = registry_client.get("/api/temperature-predictions").get_json()
+        assert data["run_id"] == "run-a"
+
+        assert registry_client.post("/api/admin/runs/nope/activate").status_code == 404
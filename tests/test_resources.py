@@ -0,0 +1,74 @@
+"""
+Tests for the shared CPU budget.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit]
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.utils import resources
+from backend.utils.resources import (
+    available_cores,
+    plan_workers,
+    set_thread_limit,
+    worker_pool,
+    xgb_threads,
+)
+
+
+@pytest.fixture
+def eight_cores(monkeypatch):
+    """Pretend the machine has eight cores and reset any per-process limit."""
+    monkeypatch.setenv("CLIMATE_CPU_BUDGET", "8")
+    set_thread_limit(None)
+    yield
+    set_thread_limit(None)
+
+
+class TestCpuBudget:
+    """Check that threads and workers are sized to the available cores."""
+
+    def test_budget_override(self, eight_cores):
+        """The environment override should define the budget."""
+        assert available_cores() == 8
+        assert xgb_threads() == 8
+
+    def test_thread_limit(self, eight_cores):
+        """A per-process limit caps the XGBoost thread count."""
+        set_thread_limit(2)
+        assert xgb_threads() == 2
+
+    @pytest.mark.parametrize(
+        "n_tasks, max_workers, expected",
+        [(2, None, (2, 4)), (8, None, (8, 1)), (20, None, (8, 1)), (20, 3, (3, 2)), (1, None, (1, 8))],
+    )
+    def test_plan_workers(self, eight_cores, n_tasks, max_workers, expected):
+        """Workers times threads per worker should never exceed the cores."""
+        workers, threads = plan_workers(n_tasks, max_workers)
+        assert (workers, threads) == expected
+        assert workers * threads <= 8
+
+    def test_models_take_their_share(self, eight_cores, sample_temperature_data):
+        """XGBoost models should be built with the current allotment."""
+        from backend.model.temprature_model import train_poly_model, train_xgb_residual
+
+        set_thread_limit(3)
+        train = sample_temperature_data[sample_temperature_data["year"] <= 2005]
+        xgb = train_xgb_residual(train, train_poly_model(train))
+        assert xgb.get_params()["n_jobs"] == 3
+
+    def test_worker_pool_applies_share(self, eight_cores):
+        """Workers should see their share of the budget, not the whole machine."""
+        with worker_pool(n_tasks=2) as pool:
+            limits = list(pool.map(_worker_threads, range(2)))
+        assert limits == [4, 4]
+
+
+def _worker_threads(_):
+    return resources.xgb_threads()
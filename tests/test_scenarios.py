@@ -0,0 +1,123 @@
+"""
+Tests for the precomputed scenario grid and the interpolated lookup endpoint.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.model]
+import numpy as np
+import sys
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.model.monte_carlo import co2_growth_prior
+from backend.model.scenarios import build_scenario_grid, scenario_grid
+from backend.model.sea_level_model import predict_sea_future
+from backend.model.temprature_model import predict_future
+from backend.utils.data_loader import save_scenario_grid, set_db_path
+
+GROWTH = np.array([0.0, 1.0, 2.0])
+RAMPS = np.array([0.0, 0.5, 1.0, 2.0])
+YEARS = np.arange(2025, 2031)
+
+
+def _linear_grid(offset=0.0):
+    """Grid linear in both parameters, so multilinear interpolation is exact."""
+    g, r, y = np.meshgrid(GROWTH, RAMPS, YEARS - YEARS[0], indexing="ij")
+    return {"temperature": offset + g + 10 * r + 0.1 * y, "sea_level": 100 * g + r + y}
+
+
+@pytest.fixture
+def grid_client(temp_db, app_client, monkeypatch):
+    import backend.app
+
+    set_db_path(temp_db)
+    monkeypatch.setattr(backend.app, "DB_PATH", temp_db)
+    return app_client
+
+
+class TestScenarioGrid:
+    """Check the batched grid evaluation."""
+
+    def test_default_scenario_matches_deterministic_forecast(
+        self, sample_temperature_data, sample_sea_level_data, trained_models
+    ):
+        """The fitted growth rate with a +0.5 ramp reproduces predict_future and predict_sea_future."""
+        poly, xgb, sea_poly, sea_xgb = trained_models
+        slope, _ = co2_growth_prior(sample_temperature_data)
+        growth = np.expm1(slope) * 100
+        years, grids, stats = scenario_grid(
+            poly, xgb, sample_temperature_data, 2025, 2050,
+            sea_poly, sea_xgb, sample_sea_level_data,
+            co2_growth_pct=[growth - 0.5, growth], forcing_ramps=[0.0, 0.5, 1.0], chunk_size=4,
+        )
+        _, _, _, _, temps = predict_future(poly, xgb, sample_temperature_data, start=2025, end=2050)
+        _, _, _, sea = predict_sea_future(sea_poly, sea_xgb, sample_sea_level_data, years, temps)
+
+        assert grids["temperature"].shape == grids["sea_level"].shape == (2, 3, 26)
+        assert stats["scenarios"] == 6
+        np.testing.assert_allclose(grids["temperature"][1, 1], temps, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(grids["sea_level"][1, 1], sea, rtol=1e-5, atol=1e-4)
+
+    def test_temperature_only_without_sea_models(self, sample_temperature_data, trained_models):
+        poly, xgb, _, _ = trained_models
+        _, grids, _ = scenario_grid(poly, xgb, sample_temperature_data, 2025, 2030,
+                                    co2_growth_pct=[0.5], forcing_ramps=[0.5])
+        assert set(grids) == {"temperature"}
+
+    def test_rejects_unsorted_axes(self, sample_temperature_data, trained_models):
+        poly, xgb, _, _ = trained_models
+        with pytest.raises(ValueError):
+            scenario_grid(poly, xgb, sample_temperature_data, 2025, 2030, co2_growth_pct=[1.0, 0.5])
+
+    def test_build_needs_temperature_models(self):
+        with pytest.raises(ValueError, match="temperature_poly"):
+            build_scenario_grid("some-run", models={})
+
+
+@pytest.mark.api
+@pytest.mark.database
+class TestScenarioEndpoint:
+    """Check storage and the interpolated /api/scenario lookup."""
+
+    def test_missing_grid_is_404(self, grid_client):
+        assert grid_client.get("/api/scenario?co2_growth=1&forcing_ramp=0.5").status_code == 404
+
+    def test_interpolates_between_grid_points(self, grid_client):
+        assert save_scenario_grid("run-a", GROWTH, RAMPS, YEARS, _linear_grid()) == 3 * 4 * 6
+
+        body = grid_client.get("/api/scenario?run=run-a&co2_growth=1.25&forcing_ramp=1.4").get_json()
+        assert body["years"] == YEARS.tolist()
+        np.testing.assert_allclose(body["temperature"], 1.25 + 14 + 0.1 * np.arange(6))
+        np.testing.assert_allclose(body["sea_level"], 125 + 1.4 + np.arange(6))
+
+        # Grid points and the outer edges come back exactly
+        edge = grid_client.get("/api/scenario?run=run-a&co2_growth=2&forcing_ramp=0").get_json()
+        np.testing.assert_allclose(edge["temperature"], _linear_grid()["temperature"][2, 0])
+
+    @pytest.mark.parametrize("query", [
+        "co2_growth=1",
+        "co2_growth=3.5&forcing_ramp=0.5",
+        "co2_growth=1&forcing_ramp=-0.1",
+        "co2_growth=nan&forcing_ramp=0.5",
+        "co2_growth=fast&forcing_ramp=0.5",
+    ])
+    def test_rejects_parameters_outside_grid(self, grid_client, query):
+        save_scenario_grid("run-a", GROWTH, RAMPS, YEARS, _linear_grid())
+        response = grid_client.get(f"/api/scenario?run=run-a&{query}")
+        assert response.status_code == 400
+        assert "must be a number" in response.get_json()["error"]
+
+    def test_rebuilt_grid_replaces_cached_arrays(self, grid_client):
+        """Saving a run's grid again logs a version, so workers reload it."""
+        url = "/api/scenario?run=run-a&co2_growth=1&forcing_ramp=0.5"
+        save_scenario_grid("run-a", GROWTH, RAMPS, YEARS, _linear_grid())
+        first = grid_client.get(url)
+        assert grid_client.get(url, headers={"If-None-Match": first.headers["ETag"]}).status_code == 304
+
+        save_scenario_grid("run-a", GROWTH, RAMPS, YEARS, _linear_grid(offset=1.0))
+        second = grid_client.get(url).get_json()
+        assert second["temperature"][0] == pytest.approx(first.get_json()["temperature"][0] + 1.0)
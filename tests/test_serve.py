@@ -0,0 +1,140 @@
+"""
+Tests for the app factory, precomputed responses and the pre-fork launcher.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.integration, pytest.mark.api]
+import os
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+import backend.app as web
+from backend.serve import preload
+from backend.utils.data_loader import set_db_path
+from backend.utils.versions import record_version
+
+
+@pytest.fixture
+def factory_app(published_db, monkeypatch):
+    set_db_path(published_db)
+    monkeypatch.setattr(web, "DB_PATH", published_db)
+    monkeypatch.setattr(web, "_precomputed", {"db_path": None, "version": None, "responses": {}})
+    return web.create_app({"TESTING": True})
+
+
+def _children(pid):
+    """Live child pids of ``pid`` (Linux /proc)."""
+    children = []
+    for entry in Path("/proc").iterdir():
+        if entry.name.isdigit():
+            try:
+                fields = (entry / "stat").read_text().rsplit(")", 1)[1].split()
+            except OSError:
+                continue
+            if int(fields[1]) == pid and fields[0] != "Z":
+                children.append(int(entry.name))
+    return sorted(children)
+
+
+def _wait_for(predicate, timeout=15.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.1)
+    return False
+
+
+class TestFactory:
+    """Check create_app and the precomputed series responses."""
+
+    def test_factory_builds_independent_apps(self, factory_app):
+        other = web.create_app()
+        assert other is not factory_app
+        assert {r.rule for r in other.url_map.iter_rules()} == {r.rule for r in factory_app.url_map.iter_rules()}
+
+    def test_precomputed_until_version_changes(self, factory_app, published_db):
+        """Bodies come from memory while the version log is unchanged, and go live after a write."""
+        assert set(preload(factory_app)["responses"]) == set(web.PRECOMPUTED_PATHS)
+        client = factory_app.test_client()
+        original = client.get("/api/sea-level").get_json()["gmsl"][-1]
+
+        # An unlogged edit is invisible to the precomputed response...
+        conn = sqlite3.connect(published_db)
+        conn.execute("UPDATE sea_level SET gmsl = -1 WHERE year = (SELECT MAX(year) FROM sea_level)")
+        conn.commit()
+        cached = client.get("/api/sea-level")
+        assert cached.get_json()["gmsl"][-1] == original
+        assert client.get("/api/sea-level", headers={"If-None-Match": cached.headers["ETag"]}).status_code == 304
+
+        # ...until a writer logs a new version
+        record_version(conn, "sea_level")
+        conn.commit()
+        conn.close()
+        assert client.get("/api/sea-level").get_json()["gmsl"][-1] == -1
+        assert web._precomputed["responses"] == {}
+
+    def test_init_worker_resets_process_state(self, factory_app):
+        before = web.broadcaster
+        web.init_worker()
+        assert web.broadcaster is not before
+        assert web._local.key == (os.getpid(), web.DB_PATH)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork") or not Path("/proc").exists(), reason="needs fork and /proc")
+class TestPreforkServer:
+    """Run the built-in pre-fork launcher as a real process."""
+
+    def test_workers_serve_respawn_and_stop(self, published_db):
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        proc = subprocess.Popen(
+            [sys.executable, str(BACKEND_DIR / "serve.py"), "--server", "builtin", "--workers", "2",
+             "--port", str(port), "--db", str(published_db)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        url = f"http://127.0.0.1:{port}/api/temperature-predictions"
+        try:
+            def ok():
+                try:
+                    return requests.get(url, timeout=1).status_code == 200
+                except requests.ConnectionError:
+                    return False
+
+            assert _wait_for(ok)
+            assert _wait_for(lambda: len(_children(proc.pid)) == 2)
+            workers = _children(proc.pid)
+
+            os.kill(workers[0], signal.SIGKILL)
+            assert _wait_for(lambda: len(_children(proc.pid)) == 2 and workers[0] not in _children(proc.pid))
+            assert ok()
+        finally:
+            proc.send_signal(signal.SIGTERM)
+            assert proc.wait(timeout=15) == 0
+
+    def test_failing_workers_stop_with_error(self):
+        """Workers that fail on start are retried with backoff, then the server exits non-zero."""
+        script = (
+            "import sys; sys.path.insert(0, %r)\n"
+            "import backend.serve as serve\n"
+            "serve.WORKER_BACKOFF = 0.01\n"
+            "serve.WORKER_MAX_QUICK_EXITS = 3\n"
+            "def post_fork(): raise RuntimeError('cannot open database')\n"
+            "serve.post_fork = post_fork\n"
+            "sys.exit(serve.serve_prefork(serve.web.create_app(), '127.0.0.1', 0, 2))\n"
+        ) % str(BACKEND_DIR.parent)
+        proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=60)
+        assert proc.returncode == 1
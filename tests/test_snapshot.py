@@ -0,0 +1,102 @@
+"""
+Tests for the columnar .npy snapshot export and loader.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.unit, pytest.mark.database]
+import json
+import sqlite3
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.utils.data_loader import (
+    load_co2,
+    load_main,
+    load_snapshot,
+    set_compact_mode,
+    set_db_path,
+)
+from backend.utils.snapshot import MANIFEST, export_snapshot, snapshot_root
+
+
+class TestSnapshot:
+    """Check that snapshots round-trip the SQLite tables."""
+
+    def test_export_writes_columns_and_manifest(self, temp_db):
+        """Every existing table gets one .npy per column and a manifest entry."""
+        root = export_snapshot(temp_db)
+
+        manifest = json.loads((root / MANIFEST).read_text())
+        assert set(manifest["tables"]) == {"temperature", "co2_concentration", "sea_level"}
+        assert manifest["tables"]["temperature"]["rows"] == 175
+        assert (root / "temperature" / "observed_c.npy").exists()
+
+    def test_snapshot_matches_sqlite(self, temp_db):
+        """Snapshot frames equal the SQLite loaders, column for column."""
+        set_db_path(temp_db)
+        export_snapshot(temp_db)
+
+        pd.testing.assert_frame_equal(load_snapshot("temperature"), load_main(), check_exact=True)
+        pd.testing.assert_frame_equal(
+            load_snapshot("co2_concentration", columns=["year", "co2_ppm"]), load_co2(), check_exact=True
+        )
+
+    def test_columns_are_memory_mapped(self, temp_db):
+        """Loaded columns are read-only views of the mapped files."""
+        set_db_path(temp_db)
+        export_snapshot(temp_db)
+
+        values = load_snapshot("sea_level")["gmsl"].to_numpy()
+        base = values
+        while base is not None and not isinstance(base, np.memmap):
+            base = getattr(base, "base", None)
+        assert isinstance(base, np.memmap)
+        assert not values.flags.writeable
+
+    def test_compact_mode_narrows(self, temp_db):
+        """Compact mode applies to snapshots like it does to SQLite loads."""
+        set_db_path(temp_db)
+        export_snapshot(temp_db)
+        set_compact_mode(True)
+        try:
+            assert load_snapshot("temperature")["observed_c"].dtype == np.float32
+        finally:
+            set_compact_mode(False)
+
+    def test_reexport_replaces_snapshot(self, temp_db):
+        """A second export swaps in fresh data; unknown tables raise KeyError."""
+        set_db_path(temp_db)
+        export_snapshot(temp_db)
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute("DELETE FROM sea_level WHERE year > 2000")
+        conn.commit()
+        conn.close()
+        export_snapshot(temp_db)
+
+        assert load_snapshot("sea_level")["year"].max() == 2000
+        with pytest.raises(KeyError):
+            load_snapshot("future_predictions")
+
+    def test_versions_swapped_behind_symlink(self, temp_db):
+        """Exports repoint the symlink and keep only the current and previous versions."""
+        root = snapshot_root(temp_db)
+        root.mkdir()  # Plain directory left by an older export
+        (root / MANIFEST).write_text("{}")
+
+        versions = []
+        for _ in range(3):
+            export_snapshot(temp_db)
+            versions.append(root.resolve().name)
+
+        assert root.is_symlink()
+        assert len(set(versions)) == 3
+        siblings = {p.name for p in root.parent.iterdir() if p.name.startswith("snapshot")}
+        assert siblings == {"snapshot", versions[1], versions[2]}
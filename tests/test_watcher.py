@@ -0,0 +1,131 @@
+"""
+Tests for the debounced data watcher and stage invalidation.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.integration, pytest.mark.model]
+import shutil
+import sys
+import numpy as np
+from pathlib import Path
+
+# Set up imports
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR.parent))
+
+from backend.model.pipeline import run_stages, stages_for
+from backend.utils.create_db import ingest_sources
+from backend.utils.data_loader import set_db_path
+from backend.utils.registry import list_runs, load_run_predictions
+from backend.watcher import DataWatcher
+
+SEA_CSV = "ClimateChangeTracker.org_Data_Download_Chart_4_8.csv"
+
+
+@pytest.fixture
+def published(tmp_path):
+    """Data directory with an ingested database and one published run."""
+    for csv_path in (BACKEND_DIR / "data").glob("*.csv"):
+        shutil.copy(csv_path, tmp_path / csv_path.name)
+    db_path = tmp_path / "climate.db"
+    ingest_sources(db_path, tmp_path)
+    set_db_path(db_path)
+    run_stages({"temperature", "sea_level"})
+    return tmp_path
+
+
+def _edit_last_row(path: Path, old: str, new: str):
+    """Rewrite one value in a source CSV."""
+    text = path.read_text()
+    assert old in text
+    path.write_text(text.replace(old, new))
+
+
+class TestStages:
+    """Check which stages each source table invalidates."""
+
+    def test_stage_mapping(self):
+        assert stages_for({"sea_level"}) == {"sea_level"}
+        assert stages_for({"co2_concentration"}) == {"temperature", "sea_level"}
+        assert stages_for({"temperature"}) == {"temperature", "sea_level"}
+        assert stages_for(set()) == set()
+
+
+class TestWatcher:
+    """Check debouncing and partial re-forecasting."""
+
+    def test_debounce_waits_for_quiet(self, published):
+        """Changes inside the debounce window postpone the rebuild."""
+        watcher = DataWatcher(published, debounce=5.0)
+        sea_csv = published / SEA_CSV
+
+        _edit_last_row(sea_csv, '"2024",22.8', '"2024",23.8')
+        assert watcher.poll(now=100.0) is None
+        _edit_last_row(sea_csv, '"2023",22.4', '"2023",22.9')
+        assert watcher.poll(now=103.0) is None  # Second edit restarts the window
+        assert watcher.poll(now=107.0) is None
+
+        summary = watcher.poll(now=108.5)
+        assert summary["changed"] == {"sea_level"}
+        assert summary["ingest"]["sea_level"]["upserted"] == 2
+        assert watcher.poll(now=200.0) is None
+
+    def test_sea_level_change_reuses_temperature(self, published):
+        """Only the sea-level stage reruns; the temperature forecast is carried over."""
+        before = load_run_predictions("temperature")
+        watcher = DataWatcher(published, debounce=0.0)
+
+        _edit_last_row(published / SEA_CSV, '"2024",22.8', '"2024",30.0')
+        watcher.poll(now=0.0)
+        summary = watcher.poll(now=1.0)
+
+        assert summary["stages"] == {"sea_level"}
+        runs = list_runs()
+        assert len(runs) == 2
+        assert runs.loc[runs["active"] == 1, "run_id"].item() == summary["run_id"]
+        after = load_run_predictions("temperature")
+        np.testing.assert_array_equal(after["prediction"], before["prediction"])
+
+    def test_co2_change_reruns_everything(self, published):
+        """Temperature inputs invalidate both stages."""
+        watcher = DataWatcher(published, debounce=0.0)
+        _edit_last_row(published / "co2_concentration.csv", "2024,3290,422.8", "2024,3290,430.0")
+        watcher.poll(now=0.0)
+        summary = watcher.poll(now=1.0)
+
+        assert summary["changed"] == {"co2_concentration"}
+        assert summary["stages"] == {"temperature", "sea_level"}
+
+    def test_touch_without_data_change(self, published):
+        """Rewriting identical content triggers an ingest check but no new run."""
+        watcher = DataWatcher(published, debounce=0.0)
+        sea_csv = published / SEA_CSV
+        sea_csv.write_bytes(sea_csv.read_bytes() + b"\n")
+
+        watcher.poll(now=0.0)
+        summary = watcher.poll(now=1.0)
+        assert summary["stages"] == set() and summary["run_id"] is None
+        assert len(list_runs()) == 1
+
+    def test_failed_batch_is_retried(self, tmp_path, monkeypatch):
+        """A batch whose processing raises is re-armed instead of dropped."""
+        shutil.copy(BACKEND_DIR / "data" / SEA_CSV, tmp_path / SEA_CSV)
+        watcher = DataWatcher(tmp_path, debounce=5.0)
+        calls = []
+
+        def process():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                raise RuntimeError("database is locked")
+            return {"changed": {"sea_level"}}
+
+        monkeypatch.setattr(watcher, "process", process)
+        _edit_last_row(tmp_path / SEA_CSV, '"2024",22.8', '"2024",23.8')
+        assert watcher.poll(now=100.0) is None
+        with pytest.raises(RuntimeError):
+            watcher.poll(now=105.0)
+        assert watcher.poll(now=107.0) is None  # Waits another debounce period
+        assert watcher.poll(now=110.0) == {"changed": {"sea_level"}}
+        assert watcher.poll(now=200.0) is None
+        assert calls == [0, 1]